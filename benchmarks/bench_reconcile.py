@@ -0,0 +1,175 @@
+"""
+Reconcile Benchmark - Move latency of the Project Task Manager board
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Moves tasks between columns on boards of growing size and reports, per
+move, the time spent and how many card widgets were created, destroyed
+and packed, and how many windowed rows were bound to a task. The board
+runs as users run it, with columns longer than VIRTUAL_THRESHOLD shown
+as windowed lists, but without a display: a HeadlessLoop replaces the Tk
+root and stand-in widgets and canvases count the calls a real card would
+get, so the numbers isolate the renderer from Tk's own drawing. For
+comparison, the same moves are repeated with a full refresh of the
+board after every move.
+
+Run from the repository root:  python benchmarks/bench_reconcile.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import notes
+from task_engine import TaskEngine, HeadlessLoop
+from task_storage import JournalStorage
+
+BOARD_SIZES = (60, 300, 3_000, 30_000, 100_000)
+MOVES = 50
+STATUSES = ('pending', 'in_progress', 'done')
+# Height of the stand-in column canvases, in pixels
+VIEWPORT = 600
+
+
+class Counts:
+    """Widget calls made since the last reset"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.created = self.destroyed = self.packed = self.bound = 0
+
+
+class StandInWidget:
+    """Accepts the calls the board makes on a widget and counts the costly ones"""
+
+    def __init__(self, counts, card=True):
+        self.counts = counts
+        self.card = card
+        if card:
+            counts.created += 1
+
+    def config(self, **options):
+        if self.card and 'text' in options:
+            self.counts.bound += 1
+
+    def pack(self, **options):
+        self.counts.packed += 1
+
+    def pack_forget(self):
+        pass
+
+    def destroy(self):
+        self.counts.destroyed += 1
+
+
+class StandInCanvas:
+    """The calls a column's canvas gets while it shows a windowed list"""
+
+    def canvasy(self, y):
+        return y
+
+    def winfo_width(self):
+        return 380
+
+    def winfo_height(self):
+        return VIEWPORT
+
+    def configure(self, **options):
+        pass
+
+    def itemconfigure(self, item, **options):
+        pass
+
+    def create_window(self, *args, **options):
+        return 1
+
+    def move(self, tag, x, y):
+        pass
+
+    def delete(self, tag):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+
+def make_board(directory, size, counts):
+    """A ProjectTaskApp over a board of `size` tasks, with stand-ins for every widget"""
+    app = notes.ProjectTaskApp.__new__(notes.ProjectTaskApp)
+    app.root = HeadlessLoop()
+    app.card_engine = 'widgets'
+    app.current_project = 'Benchmark'
+    app.search_query = ''
+    app.showing_cached_board = False
+    app.columns = {status: {'cards': {}, 'virtual': False, 'pool': [], 'slot_tags': {},
+                            'rows': [], 'canvas': StandInCanvas(), 'window': 1}
+                   for status in STATUSES}
+    app.count_labels = {status: StandInWidget(counts, card=False) for status in STATUSES}
+    app.stats_label = StandInWidget(counts, card=False)
+    app.archive_button = StandInWidget(counts, card=False)
+
+    def add_task_card(task, before=None, holder=None):
+        widget = StandInWidget(counts)
+        widget.pack(before=before)
+        return widget
+    app.add_task_card = add_task_card
+
+    def create_card_widgets(parent, status, holder):
+        return {'container': StandInWidget(counts), 'title_label': StandInWidget(counts)}
+    app.create_card_widgets = create_card_widgets
+
+    path = os.path.join(directory, f"board{size}.json")
+    app.board = TaskEngine(JournalStorage(path), app.root)
+    app.board.load()
+    app.archive = TaskEngine(JournalStorage(path + ".archive"), app.root)
+    app.archive.load()
+    now = time.time()
+    for number in range(size):
+        app.board.create(title=f"task {number}", status=STATUSES[number % 3],
+                         created=now, modified=now)
+    app.refresh_task_board()
+    return app
+
+
+def measure(app, counts, full_refresh=False):
+    """Average seconds and widget calls of one move to the next column"""
+    # A few tasks from the middle of Pending, each moved round the board
+    pending = app.board.view(('pending',))
+    tasks = [pending[len(pending) // 2 + offset] for offset in range(5)]
+    counts.reset()
+    elapsed = 0.0
+    moves = 0
+    while moves < MOVES:
+        for task in tasks:
+            started = time.perf_counter()
+            app.advance_task(task)
+            if full_refresh:
+                app.refresh_task_board()
+            elapsed += time.perf_counter() - started
+            moves += 1
+    return (elapsed / moves, counts.created / moves, counts.destroyed / moves,
+            counts.packed / moves, counts.bound / moves)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'tasks':>7}  {'refresh':<7}  {'ms/move':>8}  {'created':>7}  "
+              f"{'destroyed':>9}  {'packed':>6}  {'bound':>6}")
+        for size in BOARD_SIZES:
+            counts = Counts()
+            app = make_board(directory, size, counts)
+            for name, full_refresh in (('tasks', False), ('board', True)):
+                seconds, created, destroyed, packed, bound = measure(app, counts, full_refresh)
+                print(f"{size:>7}  {name:<7}  {seconds * 1000:8.3f}  {created:7.1f}  "
+                      f"{destroyed:9.1f}  {packed:6.1f}  {bound:6.1f}")
+            app.board.discard()
+            app.archive.discard()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Snapshot Format Benchmark - Size and speed of the task file formats
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Writes task lists of growing size as a snapshot in each of the
+SNAPSHOT_FORMATS through JournalStorage, then loads them back in a fresh
+storage, and reports the file size and the time of each step. The tasks
+are synthetic, with five-word titles drawn from a small vocabulary, as
+on a board where many tasks share words; every load is checked against
+the tasks written.
+
+Run from the repository root:  python benchmarks/bench_snapshot_formats.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_storage import JournalStorage, SNAPSHOT_FORMATS
+
+TASK_COUNTS = (1_000, 10_000, 100_000)
+WORDS = "alpha beta gamma delta fix bug write docs review deploy release ship test refactor".split()
+STATUSES = ('pending', 'in_progress', 'done')
+
+
+def make_tasks(count):
+    """Synthetic tasks with titles, statuses and epoch times"""
+    rng = random.Random(1)
+    now = time.time()
+    return [{'id': number, 'title': " ".join(rng.choice(WORDS) for _ in range(5)),
+             'status': rng.choice(STATUSES), 'created': now - rng.randint(0, 86400 * 365),
+             'modified': now}
+            for number in range(1, count + 1)]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'tasks':>7}  {'format':<8}  {'KiB':>10}  {'save ms':>8}  {'load ms':>8}")
+        for count in TASK_COUNTS:
+            tasks = make_tasks(count)
+            for snapshot_format in SNAPSHOT_FORMATS:
+                path = os.path.join(directory, f"{snapshot_format}{count}.json")
+                started = time.perf_counter()
+                JournalStorage(path, snapshot_format=snapshot_format).save_snapshot(tasks)
+                saved = time.perf_counter() - started
+                started = time.perf_counter()
+                loaded = JournalStorage(path).load()
+                read = time.perf_counter() - started
+                assert loaded == tasks
+                print(f"{count:>7}  {snapshot_format:<8}  {os.path.getsize(path) / 1024:10.1f}  "
+                      f"{saved * 1000:8.1f}  {read * 1000:8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Task Store Benchmark - Cost of lookups, moves and deletes by task id
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Runs random lookups, status changes and deletes by task id against a
+TaskStore of growing size, and against a plain list searched front to
+back, as the apps kept their tasks before the store indexed them by id.
+Each operation starts from an id alone, as a click on a card does, so
+the list has to be scanned for the task and the store looks it up.
+
+Run from the repository root:  python benchmarks/bench_task_store.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_store import TaskStore
+
+STORE_SIZES = (10_000, 100_000)
+OPERATIONS = 1_000
+STATUSES = ('pending', 'in_progress', 'done')
+
+
+class ListScan:
+    """Tasks in a list, found by scanning for their id"""
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+
+    def get(self, task_id):
+        return next(task for task in self.tasks if task['id'] == task_id)
+
+    def update(self, task, **fields):
+        task.update(fields)
+
+    def remove(self, task):
+        self.tasks.remove(task)
+
+
+def make_tasks(count):
+    """Tasks spread evenly over the columns"""
+    return [{'id': number, 'title': f"task {number}", 'status': STATUSES[number % 3]}
+            for number in range(1, count + 1)]
+
+
+def measure(store, ids):
+    """Mean microseconds of a lookup, a move and a delete, each by id"""
+    lookups, deletes = ids[:OPERATIONS], ids[OPERATIONS:]
+    started = time.perf_counter()
+    for task_id in lookups:
+        store.get(task_id)
+    looked_up = time.perf_counter() - started
+    started = time.perf_counter()
+    for task_id in lookups:
+        task = store.get(task_id)
+        store.update(task, status=STATUSES[(STATUSES.index(task['status']) + 1) % 3])
+    moved = time.perf_counter() - started
+    started = time.perf_counter()
+    for task_id in deletes:
+        store.remove(store.get(task_id))
+    deleted = time.perf_counter() - started
+    return [seconds / OPERATIONS * 1e6 for seconds in (looked_up, moved, deleted)]
+
+
+def main():
+    print(f"{'tasks':>7}  {'store':<8}  {'lookup us':>10}  {'move us':>10}  {'delete us':>10}")
+    for size in STORE_SIZES:
+        ids = random.Random(1).sample(range(1, size + 1), 2 * OPERATIONS)
+        for name, make_store in (('list', ListScan), ('indexed', TaskStore)):
+            lookup, move, delete = measure(make_store(make_tasks(size)), ids)
+            print(f"{size:>7}  {name:<8}  {lookup:10.1f}  {move:10.1f}  {delete:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
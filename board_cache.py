@@ -0,0 +1,127 @@
+"""
+Board Cache - Startup snapshot of the rendered Kanban board
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+When the Project Task Manager closes, it records what its board showed:
+the workspace, the size and modification time of the workspace's task
+files, each column's task count with the ids and titles of its first
+cards, and the statistics line. On the next launch a cache whose stamps
+still match the task files is painted before the task file is parsed,
+then replaced by the real board once loading finishes. The cache is a
+small binary file read with struct, so painting it involves no JSON.
+"""
+
+import struct
+
+from task_storage import atomic_write
+
+# Magic bytes at the start of a board cache file
+CACHE_MAGIC = b"GBC1"
+
+
+class BoardCache:
+    """What the board showed for one workspace, valid while its task files are unchanged"""
+
+    def __init__(self, key, stamp, columns, stats_text):
+        # Identifies the workspace, e.g. its name and task file
+        self.key = key
+        # disk_stamp() of the workspace's task files when the cache was written
+        self.stamp = stamp
+        # status -> (task count, [(id, title), ...] of the first cards in board order)
+        self.columns = columns
+        self.stats_text = stats_text
+
+
+def read_board_cache(path, key, stamp):
+    """Return the cache at path if it belongs to a workspace and stamp, else None"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        cache = decode_board_cache(data)
+    except (struct.error, UnicodeDecodeError, ValueError):
+        # Damaged or from another version; the board simply loads normally
+        return None
+    if cache.key != key or cache.stamp != stamp:
+        return None
+    return cache
+
+
+def write_board_cache(path, cache):
+    """Replace the cache file; raises ValueError for ids the format cannot hold"""
+    atomic_write(path, encode_board_cache(cache))
+
+
+def encode_board_cache(cache):
+    """Serialize a BoardCache"""
+    parts = [CACHE_MAGIC, encode_string(cache.key), encode_string(cache.stats_text),
+             struct.pack('<I', len(cache.stamp))]
+    for file_stamp in cache.stamp:
+        if file_stamp is None:
+            parts.append(struct.pack('<B', 0))
+        else:
+            parts.append(struct.pack('<Bqq', 1, *file_stamp))
+    parts.append(struct.pack('<I', len(cache.columns)))
+    for status, (count, rows) in cache.columns.items():
+        parts.append(encode_string(status))
+        parts.append(struct.pack('<qI', count, len(rows)))
+        for task_id, title in rows:
+            if type(task_id) is not int:
+                raise ValueError(f"board cache cannot hold task id {task_id!r}")
+            parts.append(struct.pack('<q', task_id))
+            parts.append(encode_string(title if isinstance(title, str) else str(title)))
+    return b"".join(parts)
+
+
+def decode_board_cache(data):
+    """Deserialize a BoardCache written by encode_board_cache"""
+    if not data.startswith(CACHE_MAGIC):
+        raise ValueError("not a board cache")
+    offset = len(CACHE_MAGIC)
+    key, offset = decode_string(data, offset)
+    stats_text, offset = decode_string(data, offset)
+
+    (stamp_count,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    stamp = []
+    for _ in range(stamp_count):
+        (present,) = struct.unpack_from('<B', data, offset)
+        offset += 1
+        if present:
+            stamp.append(list(struct.unpack_from('<qq', data, offset)))
+            offset += 16
+        else:
+            stamp.append(None)
+
+    (column_count,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    columns = {}
+    for _ in range(column_count):
+        status, offset = decode_string(data, offset)
+        count, row_count = struct.unpack_from('<qI', data, offset)
+        offset += 12
+        rows = []
+        for _ in range(row_count):
+            (task_id,) = struct.unpack_from('<q', data, offset)
+            title, offset = decode_string(data, offset + 8)
+            rows.append((task_id, title))
+        columns[status] = (count, rows)
+    return BoardCache(key, stamp, columns, stats_text)
+
+
+def encode_string(text):
+    """Length-prefixed UTF-8 text"""
+    encoded = text.encode('utf-8')
+    return struct.pack('<I', len(encoded)) + encoded
+
+
+def decode_string(data, offset):
+    """Read text written by encode_string; returns it with the offset after it"""
+    (length,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    if offset + length > len(data):
+        raise ValueError("truncated board cache")
+    return data[offset:offset + length].decode('utf-8'), offset + length
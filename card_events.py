@@ -0,0 +1,74 @@
+"""
+Card Events - One handler per column for the events of every task card
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Instead of binding each widget of each card to closures of its own, a
+column gives its card widgets one extra bind tag and binds every event
+once, on that tag. The handler finds the card under the pointer from the
+widget's path, so creating, recycling or destroying a card only adds or
+removes a dictionary entry. Card buttons run a Tcl command registered
+once per column, with the action and the card in the command text.
+"""
+
+
+class CardEvents:
+    """Dispatches the events of all cards in one column to per-column handlers"""
+
+    def __init__(self, root, tag):
+        self.root = root
+        self.tag = tag
+        # Card container path -> the record given to add(), handed to handlers
+        self.cards = {}
+        self.actions = {}
+        self.command_name = None
+        # A card is forgotten as soon as its tagged widgets are destroyed
+        root.bind_class(tag, "<Destroy>", self.forget)
+
+    def add(self, container, widgets, card):
+        """Route the events of a card's widgets to the column handlers"""
+        self.cards[str(container)] = card
+        for widget in widgets:
+            widget.bindtags((self.tag,) + widget.bindtags())
+
+    def bind(self, sequence, handler):
+        """Call handler(card, event) when the event happens on any card of the column"""
+        def dispatch(event):
+            card = self.card_at(event.widget)
+            if card is not None:
+                return handler(card, event)
+        self.root.bind_class(self.tag, sequence, dispatch)
+
+    def on_command(self, action, handler):
+        """Call handler(card) when a button made with command(action, ...) is pressed"""
+        self.actions[action] = handler
+
+    def command(self, action, container):
+        """Button command text that runs an action for the card in container"""
+        if self.command_name is None:
+            self.command_name = self.root.register(self.invoke)
+        return f"{self.command_name} {action} {container}"
+
+    def invoke(self, action, path):
+        """Run a button's action for its card, if the card still exists"""
+        card = self.cards.get(path)
+        if card is not None:
+            self.actions[action](card)
+
+    def card_at(self, widget):
+        """Record of the card a widget belongs to, or None"""
+        path = str(widget)
+        while path:
+            card = self.cards.get(path)
+            if card is not None:
+                return card
+            path = path.rpartition('.')[0]
+        return None
+
+    def forget(self, event):
+        """Drop the record of a card being destroyed"""
+        path = str(event.widget)
+        while path:
+            if self.cards.pop(path, None) is not None:
+                return
+            path = path.rpartition('.')[0]
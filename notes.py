@@ -7,15 +7,44 @@ A modern project management application with workspace support.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, simpledialog
+from tkinter import ttk, messagebox, simpledialog
 import json
 import os
-import subprocess
 import sys
-from datetime import datetime
+import time
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
+
+from task_storage import open_storage, open_archive, atomic_write, Prefetcher
+from task_store import ChainedView
+from task_engine import TaskEngine, move_tasks, stale_tasks
+from task_search import WorkspaceSearch, words_of
+from startup_profile import StartupProfile, startup_profile
+from board_cache import BoardCache, read_board_cache, write_board_cache
+from card_events import CardEvents
 
 class ProjectTaskApp:
-    def __init__(self, root):
+    # Columns with more cards than this only materialize the visible rows
+    VIRTUAL_THRESHOLD = 200
+    VIRTUAL_ROW_HEIGHT = 52
+    VIRTUAL_OVERSCAN = 2
+    
+    # Recently used workspaces kept loaded for instant switching
+    WORKSPACE_CACHE_SIZE = 4
+    
+    # Total size of task files parsed ahead of use by the prefetcher
+    PREFETCH_MAX_BYTES = 32 * 1024 * 1024
+    
+    # Searches made only of one- or two-letter terms match much of a large
+    # board, so they wait this many milliseconds for typing to pause
+    SEARCH_DELAY = 200
+    
+    # Cards per column kept in the board cache painted on a warm start; a
+    # maximized window shows fewer
+    CACHED_CARDS = 40
+    
+    def __init__(self, root, profile=None):
         self.root = root
         self.root.title("⚡ Project Task Manager - by Gwen Balajediong")
         self.root.geometry("1200x800")
@@ -23,89 +52,122 @@ class ProjectTaskApp:
         self.root.resizable(True, True)
         self.root.minsize(1200, 700)  # Increased minimum width
         
-        # Set window icon for taskbar
-        self.set_window_icon()
+        # Startup phase timings, printed with --profile-startup
+        self.profile = profile if profile is not None else StartupProfile()
+        
+        # Resolved on first use, so startup probes the disk once for each
+        self.documents_path = None
+        self.icon_path = None
         
         # Center the main window on screen
         self.center_window(1200, 800)
         
         # Configure style
         self.setup_styles()
+        self.profile.mark("window")
         
         # Project management - store files in Documents/GwenProject/
         self.projects_file = os.path.join(self.get_documents_path(), "project_workspaces.json")
         self.current_project = "Default"
         self.projects = {}
         
+        # Workspaces switched away from, least recently used first
+        self.workspace_cache = OrderedDict()
+        
+        # Other workspaces are parsed in the background after the first paint
+        self.prefetch_workspaces = True
+        self.prefetcher = Prefetcher()
+        
+        # Card rendering engine: 'widgets' (one widget tree per card) or
+        # 'canvas' (cards drawn as items on the column canvas)
+        self.card_engine = 'widgets'
+        
+        # Done tasks untouched for this many days move to the workspace's
+        # archive; 0 keeps every task on the board
+        self.archive_after_days = 30
+        
+        # Text typed into the search box; the board only shows matching tasks
+        self.search_query = ""
+        self.search_after = None
+        self.search_matches = 0
+        
+        # Searches across all workspaces read unloaded ones on worker threads
+        self.workspace_search = WorkspaceSearch(
+            os.path.join(self.get_documents_path(), "search_index.json"))
+        self.global_search_after = None
+        
+        # The board as shown at the last exit, painted while the tasks load
+        self.board_cache_file = os.path.join(self.get_documents_path(), "board_cache.bin")
+        self.showing_cached_board = False
+        
         # Load projects first
         self.load_projects()
+        self.profile.mark("projects")
         
-        # File to store tasks for current project in Documents/GwenProject/
-        default_file = os.path.join(self.get_documents_path(), 'project_tasks.json')
-        self.data_file = self.projects.get(self.current_project, {}).get('file', default_file)
-        
-        # Task data
-        self.tasks = []
-        self.load_tasks()
+        # Task engines of the current workspace; nothing is read yet
+        self.use_workspace(self.open_workspace(self.current_project))
+        self.profile.mark("open workspace")
         
         # Setup the UI
         self.setup_ui()
-        
-        # Load existing tasks
-        self.refresh_task_board()
+        self.profile.mark("ui")
+        
+        # A warm start paints the board as it was left, if its files are
+        # unchanged; a database paints its first page of each column
+        if self.show_cached_board():
+            self.profile.mark("cached board")
+        elif self.show_first_pages():
+            self.profile.mark("first pages")
+        else:
+            self.refresh_task_board()
         
         # Bind window close event to save data
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # Set icon again after window is fully loaded (for taskbar)
-        self.root.after(100, self.refresh_taskbar_icon)
+        # Paint the empty board before any task file is read
+        self.root.update()
+        self.profile.mark("first paint")
+        
+        # Icon, then task data, streamed in now that the board is on screen
+        self.root.after_idle(self.set_window_icon)
+        self.root.after_idle(self.stream_tasks)
+        
+        # Warm the workspace cache once the board is on screen
+        self.root.after(250, self.start_prefetch)
     
     def set_window_icon(self):
         """Set window icon for taskbar and title bar"""
         try:
-            # Try to load the icon file if it exists
-            icon_path = os.path.join(os.path.dirname(__file__), "project-icon.ico")
-            if os.path.exists(icon_path):
+            icon_path = self.get_icon_path()
+            if icon_path:
+                # Set once the window is mapped, which is when Windows picks
+                # up the taskbar icon; the default also covers every dialog
                 self.root.iconbitmap(icon_path)
-                # Additional method to force taskbar icon update
                 self.root.iconbitmap(default=icon_path)
-            else:
-                # Fallback - try in current directory
-                if os.path.exists("project-icon.ico"):
-                    self.root.iconbitmap("project-icon.ico")
-                    self.root.iconbitmap(default="project-icon.ico")
-            
-            # Force icon refresh for taskbar (Windows-specific)
-            try:
-                # This helps Windows recognize the icon change
-                self.root.wm_iconbitmap(icon_path if os.path.exists(icon_path) else "project-icon.ico")
-            except:
-                pass
-                
         except Exception:
             # If icon loading fails, continue without custom icon
             pass
+        self.profile.mark("icon")
     
-    def refresh_taskbar_icon(self):
-        """Force refresh of taskbar icon after window is fully loaded"""
-        try:
-            # Try to refresh the icon for the taskbar
+    def get_icon_path(self):
+        """Path of the window icon, next to the script or in the current directory; '' if missing"""
+        if self.icon_path is None:
             icon_path = os.path.join(os.path.dirname(__file__), "project-icon.ico")
             if os.path.exists(icon_path):
-                # Force update the window icon
-                self.root.iconbitmap(icon_path)
-                self.root.wm_iconbitmap(icon_path)
+                self.icon_path = icon_path
             elif os.path.exists("project-icon.ico"):
-                self.root.iconbitmap("project-icon.ico")
-                self.root.wm_iconbitmap("project-icon.ico")
-        except Exception:
-            pass
+                self.icon_path = "project-icon.ico"
+            else:
+                self.icon_path = ""
+        return self.icon_path
     
     def get_documents_path(self):
         """Get the path to the GwenProject directory in Documents"""
-        documents_path = os.path.expanduser("~/Documents/GwenProject")
-        os.makedirs(documents_path, exist_ok=True)
-        return documents_path
+        if self.documents_path is None:
+            documents_path = os.path.expanduser("~/Documents/GwenProject")
+            os.makedirs(documents_path, exist_ok=True)
+            self.documents_path = documents_path
+        return self.documents_path
     
     def setup_styles(self):
         """Configure modern UI styles"""
@@ -199,6 +261,33 @@ class ProjectTaskApp:
                              cursor='hand2', activebackground='#e67e22')
         manage_btn.pack(side=tk.LEFT)
         
+        # Live search over the task titles
+        search_frame = tk.Frame(title_container, bg='#8e44ad')
+        search_frame.pack(side=tk.LEFT, anchor=tk.W, padx=(30, 0))
+        
+        tk.Label(search_frame, text="Search:", 
+                font=('Segoe UI', 10, 'bold'), 
+                bg='#8e44ad', fg='#ecf0f1').pack(anchor=tk.W)
+        
+        self.search_var = tk.StringVar()
+        search_row = tk.Frame(search_frame, bg='#8e44ad')
+        search_row.pack(fill=tk.X, pady=(2, 0))
+        search_entry = tk.Entry(search_row, textvariable=self.search_var,
+                                font=('Segoe UI', 10), width=22,
+                                relief=tk.FLAT, bd=4)
+        search_entry.pack(side=tk.LEFT, padx=(0, 5))
+        search_entry.bind('<Escape>', lambda e: self.search_var.set(""))
+        self.search_var.trace_add('write', self.on_search_change)
+        
+        # Search every workspace at once
+        global_search_btn = tk.Button(search_row, text="🌐", 
+                                      command=self.show_global_search,
+                                      bg='#3498db', fg='white', 
+                                      font=('Segoe UI', 8, 'bold'),
+                                      relief=tk.FLAT, bd=0, width=2, height=1,
+                                      cursor='hand2', activebackground='#2980b9')
+        global_search_btn.pack(side=tk.LEFT)
+        
         # Modern add button in header
         add_btn = tk.Button(title_container, text="➕ New Task", 
                            command=self.show_add_dialog,
@@ -224,6 +313,10 @@ class ProjectTaskApp:
                                    bg='#ecf0f1', fg='#7f8c8d')
         self.stats_label.pack(anchor=tk.W, pady=15)
         
+        # Shown while a large task file is still streaming in
+        self.load_progress = ttk.Progressbar(stats_frame, mode='determinate',
+                                             maximum=100, length=180)
+        
         # Trello-style board with 3 columns
         board_frame = tk.Frame(content_frame, bg='#ecf0f1')
         board_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
@@ -232,6 +325,15 @@ class ProjectTaskApp:
         self.create_column(board_frame, "📋 Pending", "pending", "#e74c3c")
         self.create_column(board_frame, "⚡ In Progress", "in_progress", "#f39c12")
         self.create_column(board_frame, "✅ Done", "done", "#27ae60")
+        
+        # Archived tasks stay on disk until asked for
+        self.archive_button = tk.Button(self.columns['done']['body'], text="",
+                                        command=self.load_archive,
+                                        bg='#dee2e6', fg='#2c3e50',
+                                        font=('Segoe UI', 9),
+                                        relief=tk.FLAT, bd=0, pady=4,
+                                        cursor='hand2', activebackground='#ced4da')
+        self.archive_button.pack(side=tk.BOTTOM, fill=tk.X, before=self.columns['done']['canvas'])
     
     def create_column(self, parent, title, status, color):
         """Create a Trello-style column"""
@@ -282,7 +384,9 @@ class ProjectTaskApp:
         
         # Configure scrolling
         def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            # Windowed columns size their scroll region from the row count
+            if not self.columns[status]['virtual']:
+                canvas.configure(scrollregion=canvas.bbox("all"))
         
         def on_mouse_wheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -295,9 +399,23 @@ class ProjectTaskApp:
         # Configure canvas window width
         def configure_canvas_width(event):
             canvas.itemconfig(canvas_window, width=event.width-25)
+            for slot in self.columns[status]['pool']:
+                if 'item' in slot:
+                    canvas.itemconfig(slot['item'], width=max(event.width - 35, 1))
+                else:
+                    self.layout_canvas_slot(canvas, slot, event.width)
         canvas.bind("<Configure>", configure_canvas_width)
         
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Re-bind the recycled cards whenever the view scrolls or resizes
+        def on_view_change(first, last):
+            scrollbar.set(first, last)
+            if self.columns[status]['virtual']:
+                self.render_virtual_rows(status)
+            # Scrolling to the end of Done brings in the archived tasks
+            if status == 'done' and float(first) > 0 and float(last) >= 1.0:
+                self.load_archive()
+        
+        canvas.configure(yscrollcommand=on_view_change)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=15)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 5), pady=15)
@@ -307,9 +425,19 @@ class ProjectTaskApp:
             self.columns = {}
         self.columns[status] = {
             'frame': scrollable_frame,
+            'body': tasks_container,
             'canvas': canvas,
-            'color': color
+            'color': color,
+            'cards': {},
+            'window': canvas_window,
+            'on_mouse_wheel': on_mouse_wheel,
+            'virtual': False,
+            'rows': [],
+            'pool': [],
+            'slot_tags': {}
         }
+        self.columns[status]['events'] = self.bind_card_events(status)
+        self.bind_canvas_cards(status)
     
     def show_add_dialog(self):
         """Show a modern dialog for adding new tasks"""
@@ -323,11 +451,8 @@ class ProjectTaskApp:
         
         # Set dialog icon
         try:
-            icon_path = os.path.join(os.path.dirname(__file__), "project-icon.ico")
-            if os.path.exists(icon_path):
-                dialog.iconbitmap(icon_path)
-            elif os.path.exists("project-icon.ico"):
-                dialog.iconbitmap("project-icon.ico")
+            if self.get_icon_path():
+                dialog.iconbitmap(self.get_icon_path())
         except Exception:
             pass
         
@@ -370,16 +495,9 @@ class ProjectTaskApp:
         def add_task():
             title = task_title_entry.get().strip()
             if title:
-                task_item = {
-                    'id': len(self.tasks) + 1,
-                    'title': title,
-                    'status': 'pending',
-                    'created': datetime.now().strftime('%b %d, %Y - %I:%M%p'),
-                    'modified': datetime.now().strftime('%b %d, %Y - %I:%M%p')
-                }
-                self.tasks.append(task_item)
-                self.refresh_task_board()
-                self.save_tasks()
+                now = time.time()
+                task = self.board.create(title=title, status='pending', created=now, modified=now)
+                self.refresh_tasks([task])
                 dialog.destroy()
             else:
                 messagebox.showwarning("Warning", "Please enter a task title!")
@@ -411,30 +529,178 @@ class ProjectTaskApp:
         dialog.bind('<Escape>', lambda e: cancel())
     
     def refresh_task_board(self):
-        """Refresh all task columns"""
-        # Clear all columns
-        for status, column in self.columns.items():
-            for widget in column['frame'].winfo_children():
-                widget.destroy()
+        """Reconcile all task columns with the current task list"""
+        # Only touch the cards that actually changed; very long columns
+        # switch to a windowed list with a fixed pool of recycled cards,
+        # and the canvas engine always draws its cards that way
+        self.showing_cached_board = False
+        if self.search_query:
+            # The search indexes hand back matching ids; only those are shown
+            board_matches = self.board.search(self.search_query)
+            archive_matches = self.archive.search(self.search_query) if len(self.archive) else set()
+            self.search_matches = len(board_matches) + len(archive_matches)
+        for status in self.columns:
+            if self.search_query:
+                tasks = self.board.select(status, board_matches)
+                if status == 'done' and archive_matches:
+                    tasks = ChainedView((tasks, self.archive.select(status, archive_matches)))
+            else:
+                tasks = self.column_view(status)
+            self.refresh_column(status, tasks)
+        
+        self.update_stats()
+    
+    def refresh_tasks(self, tasks, old_statuses=()):
+        """Redraw only the cards of tasks just added, changed, moved or removed from old_statuses"""
+        if self.search_query or self.showing_cached_board:
+            # Matches or placeholders can change anywhere on the board
+            self.refresh_task_board()
+            return
         
-        # Add tasks to appropriate columns
-        for task in self.tasks:
-            self.add_task_card(task)
+        # Drop the changed tasks' cards wherever they are; a windowed column
+        # has no per-task cards and only needs its rows bound again
+        statuses = set(old_statuses)
+        for task in tasks:
+            for status, column in self.columns.items():
+                entry = column['cards'].pop(task['id'], None)
+                if entry is not None:
+                    entry['widget'].destroy()
+                    statuses.add(status)
+            if task['status'] in self.columns and (task in self.board or task in self.archive):
+                statuses.add(task['status'])
+        statuses &= self.columns.keys()
+        
+        for status in statuses:
+            column = self.columns[status]
+            view = self.column_view(status)
+            if column['virtual'] or self.card_engine == 'canvas' or len(view) > self.VIRTUAL_THRESHOLD:
+                self.refresh_column(status, view)
+                continue
+            # Create the cards still missing, last first, so the task after
+            # each one already has its card to be packed before
+            missing = []
+            for task in tasks:
+                if task['status'] == status and task['id'] not in column['cards']:
+                    if task in self.board:
+                        missing.append(self.board.position(task))
+                    elif task in self.archive:
+                        missing.append(self.board.count(status) + self.archive.position(task))
+            for index in sorted(missing, reverse=True):
+                self.insert_card(column, view, index)
         
         self.update_stats()
     
-    def add_task_card(self, task):
+    def column_view(self, status):
+        """Tasks a column shows when no search is active, in board order"""
+        # The store keeps each column's tasks in board order; a view reads
+        # them in place instead of copying the column
+        tasks = self.board.view((status,))
+        if status == 'done' and len(self.archive):
+            # Loaded archived tasks follow the recent ones
+            tasks = ChainedView((tasks, self.archive.view((status,))))
+        return tasks
+    
+    def refresh_column(self, status, tasks):
+        """Show a column's tasks as cards, or as a windowed list once it is long"""
+        column = self.columns[status]
+        if self.card_engine == 'canvas' or len(tasks) > self.VIRTUAL_THRESHOLD:
+            self.show_virtual_rows(status, tasks)
+        else:
+            if column['virtual']:
+                self.leave_virtual_rows(status)
+            self.reconcile_column(column, tasks)
+    
+    def insert_card(self, column, tasks, index):
+        """Create the card of tasks[index], packed before the card of the task after it"""
+        task = tasks[index]
+        cards = column['cards']
+        after = cards.get(tasks[index + 1]['id']) if index + 1 < len(tasks) else None
+        entry = {
+            'task': task,
+            'title': task['title']
+        }
+        entry['widget'] = self.add_task_card(task, before=after and after['widget'], holder=entry)
+        # Keep the card map in board order, as reconcile_column expects
+        if after is None:
+            cards[task['id']] = entry
+        else:
+            keys = list(cards)
+            items = list(cards.values())
+            at = keys.index(tasks[index + 1]['id'])
+            keys.insert(at, task['id'])
+            items.insert(at, entry)
+            column['cards'] = dict(zip(keys, items))
+    
+    def reconcile_column(self, column, tasks):
+        """Create, destroy or repack only the cards of a column that changed"""
+        cards = column['cards']
+        
+        # Cards are keyed by task id, which is never reused within a workspace
+        wanted = {}
+        for task in tasks:
+            wanted[task['id']] = task
+        
+        # Destroy cards whose task left the column or whose title changed; the
+        # others are rebound to the current task object, which after a reload
+        # or a workspace switch can be a different one with the same id
+        for key in list(cards):
+            entry = cards[key]
+            task = wanted.get(key)
+            if task is None or entry['title'] != task['title']:
+                entry['widget'].destroy()
+                del cards[key]
+            else:
+                entry['task'] = task
+        
+        # If the surviving cards are out of order, repack them all
+        surviving = [key for key in wanted if key in cards]
+        if surviving != list(cards):
+            for key in surviving:
+                cards[key]['widget'].pack_forget()
+            for key in surviving:
+                cards[key]['widget'].pack(fill=tk.X, padx=5, pady=3)
+        
+        # Create the missing cards, packing each before its next neighbour
+        next_widget = None
+        new_cards = {}
+        for key in reversed(list(wanted)):
+            entry = cards.get(key)
+            if entry is None:
+                task = wanted[key]
+                entry = {
+                    'task': task,
+                    'title': task['title']
+                }
+                # Card events act on whatever task the entry is bound to
+                entry['widget'] = self.add_task_card(task, before=next_widget, holder=entry)
+            new_cards[key] = entry
+            next_widget = entry['widget']
+        
+        column['cards'] = dict(reversed(list(new_cards.items())))
+    
+    def add_task_card(self, task, before=None, holder=None):
         """Add a compact task card to the appropriate column"""
         status = task['status']
         if status not in self.columns:
-            return
+            return None
 
         frame = self.columns[status]['frame']
+        
+        card = self.create_card_widgets(frame, status, holder if holder is not None else {'task': task})
+        card['title_label'].config(text=task['title'])
+        if before is not None:
+            card['container'].pack(fill=tk.X, padx=5, pady=3, before=before)
+        else:
+            card['container'].pack(fill=tk.X, padx=5, pady=3)
+        
+        return card['container']
+    
+    def create_card_widgets(self, parent, status, holder):
+        """Build the widgets of one task card; its events act on holder['task']"""
         color = self.columns[status]['color']
         
         # Create compact card container
-        card_container = tk.Frame(frame, bg='#f8f9fa')
-        card_container.pack(fill=tk.X, padx=5, pady=3)
+        card_container = tk.Frame(parent, bg='#f8f9fa')
         
         # Simple card with minimal styling
         card = tk.Frame(card_container, bg='white', relief=tk.FLAT, bd=1)
@@ -456,113 +722,589 @@ class ProjectTaskApp:
         delete_btn.pack(side=tk.RIGHT, padx=5, pady=5)
         
         # Task title (main clickable area) - reduced wrap length to account for delete button
-        title_label = tk.Label(content_frame, text=task['title'], 
+        title_label = tk.Label(content_frame, text="", 
                               font=('Segoe UI', 11), 
                               bg='white', fg='#2c3e50',
                               wraplength=200, justify=tk.LEFT, anchor='w',
                               cursor='hand2')
         title_label.pack(anchor=tk.W, fill=tk.X)
         
+        # Clicks, hover and scrolling are handled by the column, see bind_card_events
+        widgets = [card, content_frame, title_label, delete_btn]
+        self.columns[status]['events'].add(card_container, widgets, {
+            'holder': holder,
+            'widgets': widgets,
+            'delete': delete_btn
+        })
+        
+        return {
+            'container': card_container,
+            'title_label': title_label
+        }
+    
+    def bind_card_events(self, status):
+        """Handle the events of every widget card in a column with one binding per event"""
+        events = CardEvents(self.root, f"TaskCard_{status}")
+        
         # Double-click to move to next status
-        def on_double_click(event):
-            if status == "pending":
-                self.move_task(task, "in_progress")
-            elif status == "in_progress":
-                self.move_task(task, "done")
-            elif status == "done":
-                self.move_task(task, "pending")  # Cycle back to pending
+        def on_double_click(card, event):
+            task = card['holder']['task']
+            if task is not None and event.widget is not card['delete']:
+                self.advance_task(task)
         
         # Right-click for context menu (alternative to double-click)
-        def show_context_menu(event):
-            context_menu = tk.Menu(self.root, tearoff=0)
-            
-            if status == "pending":
-                context_menu.add_command(label="▶️ Start Task", 
-                                       command=lambda: self.move_task(task, "in_progress"))
-            elif status == "in_progress":
-                context_menu.add_command(label="✅ Mark Done", 
-                                       command=lambda: self.move_task(task, "done"))
-                context_menu.add_command(label="⬅️ Move Back", 
-                                       command=lambda: self.move_task(task, "pending"))
-            elif status == "done":
-                context_menu.add_command(label="🔄 Reopen", 
-                                       command=lambda: self.move_task(task, "pending"))
-            
-            context_menu.add_separator()
-            context_menu.add_command(label="🗑️ Delete", 
-                                   command=lambda: self.delete_task(task))
-            
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
-        
-        # Bind events
-        title_label.bind("<Double-Button-1>", on_double_click)
-        title_label.bind("<Button-3>", show_context_menu)  # Right-click
-        card.bind("<Double-Button-1>", on_double_click)
-        card.bind("<Button-3>", show_context_menu)
-        content_frame.bind("<Double-Button-1>", on_double_click)
-        content_frame.bind("<Button-3>", show_context_menu)
+        def on_right_click(card, event):
+            task = card['holder']['task']
+            if task is not None:
+                self.show_task_menu(task, event)
         
         # Delete button click
-        delete_btn.bind("<Button-1>", lambda e: self.delete_task(task))
+        def on_click(card, event):
+            task = card['holder']['task']
+            if task is not None and event.widget is card['delete']:
+                self.delete_task(task)
         
         # Hover effects for better UX
+        def on_enter(card, event):
+            for widget in card['widgets']:
+                widget.config(bg='#f8f9fa')
+        
+        def on_leave(card, event):
+            for widget in card['widgets']:
+                widget.config(bg='white')
+        
+        def on_mouse_wheel(card, event):
+            self.columns[status]['on_mouse_wheel'](event)
+        
+        events.bind("<Double-Button-1>", on_double_click)
+        events.bind("<Button-3>", on_right_click)
+        events.bind("<Button-1>", on_click)
+        events.bind("<Enter>", on_enter)
+        events.bind("<Leave>", on_leave)
+        events.bind("<MouseWheel>", on_mouse_wheel)
+        return events
+    
+    def show_virtual_rows(self, status, tasks):
+        """Show a column as a windowed list that only materializes visible rows"""
+        column = self.columns[status]
+        canvas = column['canvas']
+        
+        if not column['virtual']:
+            # Drop the per-task cards and hide the frame that held them
+            for entry in column['cards'].values():
+                entry['widget'].destroy()
+            column['cards'] = {}
+            canvas.itemconfigure(column['window'], state='hidden')
+            column['virtual'] = True
+        
+        column['rows'] = tasks
+        canvas.configure(scrollregion=(0, 0, canvas.winfo_width(),
+                                       len(tasks) * self.VIRTUAL_ROW_HEIGHT))
+        self.render_virtual_rows(status)
+    
+    def leave_virtual_rows(self, status):
+        """Switch a column back from the windowed list to regular cards"""
+        column = self.columns[status]
+        for slot in column['pool']:
+            if 'container' in slot:
+                slot['container'].destroy()
+            column['canvas'].delete(slot['tag'])
+        column['pool'] = []
+        column['slot_tags'] = {}
+        column['rows'] = []
+        column['virtual'] = False
+        column['canvas'].itemconfigure(column['window'], state='normal')
+        column['canvas'].yview_moveto(0)
+    
+    def render_virtual_rows(self, status):
+        """Bind the recycled card pool of a column to the rows in the viewport"""
+        column = self.columns[status]
+        canvas = column['canvas']
+        rows = column['rows']
+        row_height = self.VIRTUAL_ROW_HEIGHT
+        
+        first = max(int(canvas.canvasy(0)) // row_height, 0)
+        visible = canvas.winfo_height() // row_height + self.VIRTUAL_OVERSCAN
+        
+        # The pool only grows with the viewport, never with the task count
+        pool = column['pool']
+        while len(pool) < visible:
+            if self.card_engine == 'canvas':
+                slot = self.create_canvas_slot(status, len(pool))
+            else:
+                slot = self.create_virtual_slot(status, len(pool))
+            pool.append(slot)
+            column['slot_tags'][slot['tag']] = slot
+        
+        for offset, slot in enumerate(pool):
+            index = first + offset
+            if index < len(rows):
+                task = rows[index]
+                slot['task'] = task
+                if 'title_label' in slot:
+                    slot['title_label'].config(text=task['title'])
+                else:
+                    canvas.itemconfigure(slot['text'], text=self.clip_title(task['title']))
+                canvas.move(slot['tag'], 0, index * row_height - slot['y'])
+                slot['y'] = index * row_height
+                canvas.itemconfigure(slot['tag'], state='normal')
+            else:
+                slot['task'] = None
+                canvas.itemconfigure(slot['tag'], state='hidden')
+    
+    def create_virtual_slot(self, status, number):
+        """Create one recycled widget card for a windowed column"""
+        column = self.columns[status]
+        canvas = column['canvas']
+        slot = {'task': None, 'tag': f"slot{number}", 'y': 0}
+        
+        card = self.create_card_widgets(canvas, status, slot)
+        
+        slot['container'] = card['container']
+        slot['title_label'] = card['title_label']
+        slot['item'] = canvas.create_window(5, 3, window=card['container'], anchor="nw",
+                                            width=max(canvas.winfo_width() - 35, 1),
+                                            height=self.VIRTUAL_ROW_HEIGHT - 6,
+                                            state='hidden', tags=(slot['tag'],))
+        return slot
+    
+    def create_canvas_slot(self, status, number):
+        """Create one recycled card drawn as canvas items (no widgets)"""
+        column = self.columns[status]
+        canvas = column['canvas']
+        slot = {'task': None, 'tag': f"slot{number}", 'y': 0}
+        tags = (slot['tag'], 'card')
+        
+        slot['rect'] = canvas.create_rectangle(0, 0, 0, 0, fill='white', outline='#dee2e6',
+                                               state='hidden', tags=tags)
+        slot['border'] = canvas.create_rectangle(0, 0, 0, 0, fill=column['color'], width=0,
+                                                 state='hidden', tags=tags)
+        slot['text'] = canvas.create_text(0, 0, anchor="nw", fill='#2c3e50',
+                                          font=('Segoe UI', 11), state='hidden', tags=tags)
+        slot['delete'] = canvas.create_text(0, 0, text="×", fill='#dc3545',
+                                            font=('Segoe UI', 12, 'bold'), state='hidden',
+                                            tags=(slot['tag'], 'card_delete'))
+        self.layout_canvas_slot(canvas, slot, canvas.winfo_width())
+        return slot
+    
+    def layout_canvas_slot(self, canvas, slot, width):
+        """Position the items of a canvas-drawn card for the given column width"""
+        right = max(width - 30, 60)
+        top = slot['y'] + 3
+        bottom = slot['y'] + self.VIRTUAL_ROW_HEIGHT - 3
+        canvas.coords(slot['rect'], 5, top, right, bottom)
+        canvas.coords(slot['border'], 6, top + 1, 10, bottom)
+        canvas.coords(slot['text'], 20, top + 8)
+        canvas.itemconfigure(slot['text'], width=right - 60)
+        canvas.coords(slot['delete'], right - 15, top + 15)
+    
+    def clip_title(self, title):
+        """Shorten a title so it fits a fixed-height canvas card"""
+        if len(title) > 60:
+            return title[:57] + "…"
+        return title
+    
+    def canvas_card_task(self, status):
+        """Return the task of the canvas-drawn card under the pointer"""
+        column = self.columns[status]
+        for tag in column['canvas'].gettags('current'):
+            slot = column['slot_tags'].get(tag)
+            if slot is not None:
+                return slot['task'], slot
+        return None, None
+    
+    def bind_canvas_cards(self, status):
+        """Install the column-wide tag bindings used by canvas-drawn cards"""
+        canvas = self.columns[status]['canvas']
+        
+        def on_double_click(event):
+            task, slot = self.canvas_card_task(status)
+            if task is not None:
+                self.advance_task(task)
+        
+        def on_right_click(event):
+            task, slot = self.canvas_card_task(status)
+            if task is not None:
+                self.show_task_menu(task, event)
+        
+        def on_delete_click(event):
+            task, slot = self.canvas_card_task(status)
+            if task is not None:
+                self.delete_task(task)
+        
         def on_enter(event):
-            card.config(bg='#f8f9fa')
-            content_frame.config(bg='#f8f9fa')
-            title_label.config(bg='#f8f9fa')
-            delete_btn.config(bg='#f8f9fa')
-            
+            task, slot = self.canvas_card_task(status)
+            if slot is not None:
+                canvas.itemconfigure(slot['rect'], fill='#f8f9fa')
+        
         def on_leave(event):
-            card.config(bg='white')
-            content_frame.config(bg='white')
-            title_label.config(bg='white')
-            delete_btn.config(bg='white')
+            task, slot = self.canvas_card_task(status)
+            if slot is not None:
+                canvas.itemconfigure(slot['rect'], fill='white')
+        
+        canvas.tag_bind('card', "<Double-Button-1>", on_double_click)
+        canvas.tag_bind('card', "<Button-3>", on_right_click)
+        canvas.tag_bind('card', "<Enter>", on_enter)
+        canvas.tag_bind('card', "<Leave>", on_leave)
+        canvas.tag_bind('card_delete', "<Button-1>", on_delete_click)
+    
+    def advance_task(self, task):
+        """Move a task to the next status, cycling Done back to Pending"""
+        if task['status'] == "pending":
+            self.move_task(task, "in_progress")
+        elif task['status'] == "in_progress":
+            self.move_task(task, "done")
+        elif task['status'] == "done":
+            self.move_task(task, "pending")  # Cycle back to pending
+    
+    def show_task_menu(self, task, event):
+        """Show the right-click context menu for a task"""
+        context_menu = tk.Menu(self.root, tearoff=0)
+        
+        if task['status'] == "pending":
+            context_menu.add_command(label="▶️ Start Task", 
+                                   command=lambda: self.move_task(task, "in_progress"))
+        elif task['status'] == "in_progress":
+            context_menu.add_command(label="✅ Mark Done", 
+                                   command=lambda: self.move_task(task, "done"))
+            context_menu.add_command(label="⬅️ Move Back", 
+                                   command=lambda: self.move_task(task, "pending"))
+        elif task['status'] == "done":
+            context_menu.add_command(label="🔄 Reopen", 
+                                   command=lambda: self.move_task(task, "pending"))
+        
+        context_menu.add_separator()
+        context_menu.add_command(label="🗑️ Delete", 
+                               command=lambda: self.delete_task(task))
         
-        # Bind hover effects to all components
-        for widget in [card, content_frame, title_label, delete_btn]:
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
+        try:
+            context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            context_menu.grab_release()
     
     def move_task(self, task, new_status):
         """Move task to a different status"""
-        task['status'] = new_status
-        task['modified'] = datetime.now().strftime('%b %d, %Y - %I:%M%p')
-        self.refresh_task_board()
-        self.save_tasks()
+        fields = {
+            'status': new_status,
+            'modified': time.time()
+        }
+        old_statuses = (task['status'],)
+        if task in self.archive:
+            # Reopening an archived task puts it back on the board, or on
+            # the board's copy of it that an interrupted move left behind
+            task, = move_tasks([task], self.archive, self.board)
+            old_statuses += (task['status'],)
+        self.board.update(task, **fields)
+        self.refresh_tasks([task], old_statuses)
     
     def delete_task(self, task):
         """Delete a task"""
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{task['title']}'?"):
-            self.tasks.remove(task)
+            engine = self.archive if task in self.archive else self.board
+            engine.remove(task)
+            self.refresh_tasks([task], (task['status'],))
+    
+    def archive_old_tasks(self):
+        """Move Done tasks untouched for archive_after_days from the board to the archive"""
+        if not self.archive_after_days:
+            return
+        # Done tasks were last modified when they were completed
+        cutoff = time.time() - self.archive_after_days * 86400
+        old = stale_tasks(self.board.column('done'), cutoff)
+        if old:
+            move_tasks(old, self.board, self.archive)
+            self.refresh_tasks(old, ('done',))
+    
+    def load_archive(self):
+        """Stream the current workspace's archived tasks into the Done column"""
+        archive = self.archive
+        if archive.loaded or archive.loader is not None:
+            return
+        archive.start_loading(on_chunk=lambda: self.show_archived_tasks(archive),
+                              on_done=lambda: self.show_archived_tasks(archive))
+        self.update_archive_button()
+    
+    def show_archived_tasks(self, archive):
+        """Redraw once archived tasks arrive, if their workspace is still shown"""
+        if archive is self.archive:
             self.refresh_task_board()
-            self.save_tasks()
+    
+    def update_archive_button(self):
+        """Offer to load the archive, or show how many tasks it holds"""
+        archive = self.archive
+        if archive.loaded:
+            self.archive_button.config(text=f"🗄️ {len(archive)} archived", state=tk.DISABLED)
+        elif archive.loader is not None:
+            self.archive_button.config(text="🗄️ Loading archive…", state=tk.DISABLED)
+        else:
+            self.archive_button.config(text="🗄️ Show archived tasks", state=tk.NORMAL)
     
     def update_stats(self):
         """Update statistics display and column count badges"""
-        total = len(self.tasks)
-        pending = len([t for t in self.tasks if t['status'] == 'pending'])
-        in_progress = len([t for t in self.tasks if t['status'] == 'in_progress'])
-        done = len([t for t in self.tasks if t['status'] == 'done'])
+        # Counters are maintained by the task store, no scan needed
+        pending = self.board.count('pending')
+        in_progress = self.board.count('in_progress')
+        done = self.board.count('done')
+        archived = len(self.archive)
         
-        # Update column count badges
+        # Update column count badges; Done also counts the loaded archive
         if hasattr(self, 'count_labels'):
             self.count_labels['pending'].config(text=str(pending))
             self.count_labels['in_progress'].config(text=str(in_progress))
-            self.count_labels['done'].config(text=str(done))
+            self.count_labels['done'].config(text=str(done + archived))
+        self.update_archive_button()
+        
+        stats_text = self.format_stats()
+        if self.search_query:
+            stats_text = f"🔍 {self.search_matches} matching | " + stats_text
+        
+        self.stats_label.config(text=stats_text)
+    
+    def format_stats(self, counts=None):
+        """Statistics line of the current board, or of the given column counts"""
+        if counts is None:
+            counts = {status: self.board.count(status) for status in self.columns}
+            total = len(self.board)
+        else:
+            total = sum(counts.values())
+        pending = counts.get('pending', 0)
+        in_progress = counts.get('in_progress', 0)
+        done = counts.get('done', 0)
         
         # Get current workspace name
         workspace_name = self.current_project if self.current_project else "Default"
         
         if total == 0:
-            stats_text = f"📁 Workspace: {workspace_name} | No tasks yet - click 'New Task' to get started! 🚀 | © 2025 Gwen Balajediong"
+            return f"📁 Workspace: {workspace_name} | No tasks yet - click 'New Task' to get started! 🚀 | © 2025 Gwen Balajediong"
+        completion_rate = (done / total) * 100 if total > 0 else 0
+        return f"📁 {workspace_name} | 📊 {total} total tasks | 📋 {pending} pending | ⚡ {in_progress} in progress | ✅ {done} done | {completion_rate:.0f}% complete | © 2025 Gwen Balajediong"
+    
+    def board_cache_key(self):
+        """Identifies the current workspace in the board cache"""
+        return "\t".join((self.current_project,) + self.project_location(self.current_project))
+    
+    def show_cached_board(self):
+        """Paint the board saved at the last exit; False when it is missing or out of date"""
+        cache = read_board_cache(self.board_cache_file, self.board_cache_key(),
+                                 self.board.storage.disk_stamp())
+        if cache is None:
+            return False
+        self.show_placeholders(cache.columns, cache.stats_text)
+        return True
+    
+    def show_first_pages(self):
+        """Paint each column's first tasks and count from the storage's indexes, if it has them"""
+        columns = self.board.storage.peek_columns(tuple(self.columns), self.CACHED_CARDS)
+        if columns is None:
+            return False
+        columns = {status: (count, [(task['id'], task['title']) for task in tasks])
+                   for status, (count, tasks) in columns.items()}
+        counts = {status: count for status, (count, _) in columns.items()}
+        self.show_placeholders(columns, self.format_stats(counts))
+        return True
+    
+    def show_placeholders(self, columns, stats_text):
+        """Show {status: (count, [(id, title)])} as the board until the tasks are loaded"""
+        for status, column in self.columns.items():
+            count, rows = columns.get(status, (0, []))
+            self.reconcile_column(column, [{'id': task_id, 'title': title, 'status': status}
+                                           for task_id, title in rows])
+            # Placeholders until the tasks are loaded; clicking them does nothing
+            for entry in column['cards'].values():
+                entry['task'] = None
+            self.count_labels[status].config(text=str(count))
+        self.update_archive_button()
+        self.stats_label.config(text=stats_text)
+        self.showing_cached_board = True
+    
+    def save_board_cache(self):
+        """Remember what the board shows, for the next launch to paint before loading"""
+        if not self.board.loaded:
+            # Closed mid-load: an unchanged task file keeps the old cache valid
+            return
+        # As a fresh load shows it: unfiltered, with the archive not loaded
+        columns = {}
+        for status in self.columns:
+            rows = islice(self.board.view((status,)), self.CACHED_CARDS)
+            columns[status] = (self.board.count(status),
+                               [(task['id'], task['title']) for task in rows])
+        cache = BoardCache(self.board_cache_key(), self.board.storage.disk_stamp(),
+                           columns, self.format_stats())
+        try:
+            write_board_cache(self.board_cache_file, cache)
+        except (OSError, ValueError):
+            # Only startup speed depends on the cache
+            pass
+    
+    def on_search_change(self, *args):
+        """Filter the board as the search text changes"""
+        if self.search_after is not None:
+            self.root.after_cancel(self.search_after)
+            self.search_after = None
+        query = self.search_var.get()
+        if not query.strip() or any(len(term) >= 3 for term in words_of(query)):
+            self.apply_search()
         else:
-            completion_rate = (done / total) * 100 if total > 0 else 0
-            stats_text = f"📁 {workspace_name} | 📊 {total} total tasks | 📋 {pending} pending | ⚡ {in_progress} in progress | ✅ {done} done | {completion_rate:.0f}% complete | © 2025 Gwen Balajediong"
+            self.search_after = self.root.after(self.SEARCH_DELAY, self.apply_search)
+    
+    def apply_search(self):
+        """Show only the tasks matching the search text, including archived ones"""
+        self.search_after = None
+        self.search_query = self.search_var.get().strip()
+        if self.search_query:
+            self.load_archive()
+        for column in self.columns.values():
+            column['canvas'].yview_moveto(0)
+        self.refresh_task_board()
+    
+    def show_global_search(self):
+        """Search the tasks of every workspace, listing matches as each workspace is searched"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Search All Workspaces")
+        dialog.geometry("600x450")
+        dialog.configure(bg='#2c3e50')
+        dialog.transient(self.root)
         
-        self.stats_label.config(text=stats_text)
+        # Center the dialog
+        dialog.update_idletasks()
+        x = (dialog.winfo_screenwidth() // 2) - (600 // 2)
+        y = (dialog.winfo_screenheight() // 2) - (450 // 2)
+        dialog.geometry(f"600x450+{x}+{y}")
+        
+        # Main frame
+        main_frame = tk.Frame(dialog, bg='#2c3e50', padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Query row
+        query_frame = tk.Frame(main_frame, bg='#2c3e50')
+        query_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        query_var = tk.StringVar(value=self.search_var.get())
+        query_entry = tk.Entry(query_frame, textvariable=query_var,
+                               font=('Segoe UI', 12), relief=tk.FLAT, bd=6)
+        query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        query_entry.focus_set()
+        
+        # Progress line
+        status_label = tk.Label(main_frame, text="", 
+                               font=('Segoe UI', 9), 
+                               bg='#2c3e50', fg='#bdc3c7')
+        status_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        # Results list
+        list_frame = tk.Frame(main_frame, bg='#34495e', relief=tk.SUNKEN, bd=1)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        results_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set,
+                                     bg='#34495e', fg='#ecf0f1',
+                                     font=('Segoe UI', 10),
+                                     selectbackground='#8e44ad',
+                                     relief=tk.FLAT, bd=0)
+        results_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=results_listbox.yview)
+        
+        # Workspace of each listed result
+        result_projects = []
+        status_names = {'pending': "📋", 'in_progress': "⚡", 'done': "✅"}
+        
+        def add_results(project_name, kind, rows):
+            if not dialog.winfo_exists():
+                return
+            for status, title in rows:
+                marker = "🗄️" if kind == 'archive' else status_names.get(status, "•")
+                results_listbox.insert(tk.END, f"{project_name}  {marker}  {title}")
+                result_projects.append(project_name)
+            status_label.config(text=f"{len(result_projects)} matching tasks, searching…")
+        
+        def search_done():
+            if dialog.winfo_exists():
+                status_label.config(text=f"{len(result_projects)} matching tasks in {len(self.projects)} workspaces")
+        
+        def run_search():
+            query = query_var.get().strip()
+            if not query:
+                return
+            results_listbox.delete(0, tk.END)
+            result_projects.clear()
+            self.start_global_search(query, add_results, search_done)
+        
+        def open_result(event):
+            selection = results_listbox.curselection()
+            if not selection:
+                return
+            project_name = result_projects[selection[0]]
+            query = query_var.get().strip()
+            close_dialog()
+            if project_name in self.projects and project_name != self.current_project:
+                self.switch_project(project_name)
+            self.search_var.set(query)
+        
+        def close_dialog():
+            self.stop_global_search()
+            dialog.destroy()
+        
+        tk.Button(query_frame, text="🔍 Search", command=run_search,
+                 bg='#8e44ad', fg='white', font=('Segoe UI', 10, 'bold'),
+                 relief=tk.FLAT, bd=0, padx=15, pady=6,
+                 cursor='hand2', activebackground='#9b59b6').pack(side=tk.RIGHT)
+        
+        query_entry.bind('<Return>', lambda e: run_search())
+        results_listbox.bind('<Double-Button-1>', open_result)
+        dialog.bind('<Escape>', lambda e: close_dialog())
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
+        
+        if query_var.get().strip():
+            run_search()
+    
+    def start_global_search(self, query, on_results, on_done):
+        """Search every workspace: loaded ones right away, the rest on worker threads"""
+        self.stop_global_search()
+        loaded = dict(self.workspace_cache)
+        loaded[self.current_project] = {'board': self.board, 'archive': self.archive}
+        
+        sources = {}
+        keys = []
+        for project_name in self.projects:
+            workspace = loaded.get(project_name)
+            location = self.project_location(project_name)
+            for kind, opener in (('board', open_storage), ('archive', open_archive)):
+                engine = workspace[kind] if workspace is not None else None
+                if engine is not None and engine.loaded:
+                    # In memory, unsaved changes included
+                    matches = engine.search(query)
+                    on_results(project_name, kind,
+                               [(task['status'], task['title']) for status in self.columns
+                                for task in engine.select(status, matches)])
+                    continue
+                # Cached titles are keyed by file, workspace and kind
+                key = "\t".join((kind, location[0], location[1]))
+                keys.append(key)
+                sources[(project_name, kind)] = (key, partial(opener, *location))
+        
+        self.workspace_search.submit(query, sources)
+        self.collect_global_results(on_results, on_done, keys)
+    
+    def collect_global_results(self, on_results, on_done, keys):
+        """Show the workspaces searched so far, until all are done"""
+        self.global_search_after = None
+        for (project_name, kind), rows in self.workspace_search.completed().items():
+            on_results(project_name, kind, [(status, title) for _, status, title in rows])
+        if self.workspace_search.pending():
+            self.global_search_after = self.root.after(
+                50, self.collect_global_results, on_results, on_done, keys)
+        else:
+            self.workspace_search.save(keys)
+            on_done()
+    
+    def stop_global_search(self):
+        """Stop showing results of a running global search"""
+        if self.global_search_after is not None:
+            self.root.after_cancel(self.global_search_after)
+            self.global_search_after = None
+        self.workspace_search.discard()
     
     def refresh_project_dropdown(self):
         """Update the project dropdown with current projects"""
@@ -576,6 +1318,9 @@ class ProjectTaskApp:
                     data = json.load(f)
                     self.projects = data.get('projects', {})
                     self.current_project = data.get('current_project', 'Default')
+                    self.card_engine = data.get('card_engine', 'widgets')
+                    self.prefetch_workspaces = data.get('prefetch_workspaces', True)
+                    self.archive_after_days = data.get('archive_after_days', 30)
                     
                     # Ensure we have at least a default project
                     if not self.projects:
@@ -600,10 +1345,13 @@ class ProjectTaskApp:
         try:
             data = {
                 'projects': self.projects,
-                'current_project': self.current_project
+                'current_project': self.current_project,
+                'card_engine': self.card_engine,
+                'prefetch_workspaces': self.prefetch_workspaces,
+                'archive_after_days': self.archive_after_days
             }
-            with open(self.projects_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            atomic_write(self.projects_file,
+                         json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
         except Exception as e:
             print(f"Error saving projects: {e}")
 
@@ -611,52 +1359,95 @@ class ProjectTaskApp:
         """Handle project selection change"""
         new_project = self.project_var.get()
         if new_project != self.current_project:
-            # Save current project's tasks
-            self.save_tasks()
-            
-            # Switch to new project
-            self.current_project = new_project
-            self.save_projects()
-            
-            # Prompt user to restart
-            tk.messagebox.showinfo("Project Changed", 
-                                 f"Switched to project '{new_project}'.\n\nPlease restart the application to see the new project's tasks.")
-            
-    def refresh_columns(self):
-        """Refresh all column displays with current tasks"""
-        for column in ['todo', 'progress', 'done']:
-            # Clear ALL widgets in the column, not just those with task_id
-            for widget in self.columns[column]['frame'].winfo_children():
-                widget.destroy()
-            
-            # Repopulate with current tasks
-            column_tasks = [task for task in self.tasks if task['status'] == column]
-            for task in column_tasks:
-                self.add_task_card(task, column)
-        
-        # Update statistics
-        self.update_stats()
+            self.switch_project(new_project)
+    
+    def switch_project(self, project_name):
+        """Show another workspace's tasks without restarting"""
+        # Only complete task lists are parked in the cache; a board switched
+        # away from before its startup load began is read now
+        self.stream_tasks()
+        self.board.finish_loading()
+        self.archive.finish_loading()
+        
+        # Park the current workspace; its queued saves keep running
+        self.workspace_cache[self.current_project] = {
+            'board': self.board,
+            'archive': self.archive
+        }
+        self.workspace_cache.move_to_end(self.current_project)
+        
+        self.current_project = project_name
+        cached = self.workspace_cache.pop(project_name, None)
+        prefetched = self.prefetcher.claim(project_name) if cached is None else None
+        if cached is not None:
+            self.use_workspace(cached)
+        elif prefetched is not None:
+            self.use_workspace(self.open_workspace(project_name, *prefetched))
+            self.report_recovery(self.board)
+        else:
+            self.load_tasks()
+        
+        # Evict the least recently used workspaces beyond the cache limit
+        while len(self.workspace_cache) > self.WORKSPACE_CACHE_SIZE:
+            name, entry = self.workspace_cache.popitem(last=False)
+            entry['board'].flush()
+            entry['archive'].flush()
+        
+        self.save_projects()
+        self.project_var.set(project_name)
+        for column in self.columns.values():
+            column['canvas'].yview_moveto(0)
+        if self.search_query:
+            self.load_archive()
+        self.refresh_task_board()
+        if self.board.loaded:
+            self.archive_old_tasks()
+    
+    def start_prefetch(self):
+        """Parse other workspaces in the background so switching never waits on disk"""
+        if not self.prefetch_workspaces:
+            return
         
-        # Force UI update
-        self.root.update_idletasks()
-
-    def reload_application(self):
-        """Reload the entire application for better readability after project changes"""
-        # Load tasks from the current project
-        self.load_tasks()
-        
-        # Clear all existing content
-        for column in ['todo', 'progress', 'done']:
-            for widget in self.columns[column]['frame'].winfo_children():
-                widget.destroy()
-        
-        # Refresh all displays
-        self.refresh_columns()
-        
-        # Update window title to show current project
-        project_name = self.current_project if self.current_project else "Default"
-        self.root.title(f"Project Task Manager - {project_name}")
-
+        # Bounded by the free cache slots and a total byte budget
+        free_slots = self.WORKSPACE_CACHE_SIZE - len(self.workspace_cache)
+        budget = self.PREFETCH_MAX_BYTES
+        for project_name in self.projects:
+            if free_slots <= 0:
+                break
+            if project_name == self.current_project or project_name in self.workspace_cache:
+                continue
+            storage = self.open_project_storage(project_name)
+            size = storage.disk_size()
+            if size > budget:
+                continue
+            budget -= size
+            free_slots -= 1
+            self.prefetcher.submit(project_name, storage)
+        
+        if self.prefetcher.pending():
+            self.root.after(100, self.collect_prefetched)
+    
+    def collect_prefetched(self):
+        """Move finished background loads into the workspace cache"""
+        for project_name, (storage, tasks) in self.prefetcher.completed().items():
+            if (project_name in self.projects and project_name != self.current_project
+                    and project_name not in self.workspace_cache):
+                self.workspace_cache[project_name] = self.open_workspace(project_name, storage, tasks)
+                # Not used yet, so first in line for eviction
+                self.workspace_cache.move_to_end(project_name, last=False)
+        
+        if self.prefetcher.pending():
+            self.root.after(100, self.collect_prefetched)
+    
+    def forget_project(self, project_name):
+        """Drop a cached workspace without writing its pending changes; returns its engines, if any"""
+        self.prefetcher.discard(project_name)
+        entry = self.workspace_cache.pop(project_name, None)
+        if entry is not None:
+            entry['board'].discard()
+            entry['archive'].discard()
+        return entry
+    
     def create_new_project(self):
         """Create a new project workspace"""
         dialog = tk.Toplevel(self.root)
@@ -706,18 +1497,13 @@ class ProjectTaskApp:
                 filename = f"project_{project_name.lower().replace(' ', '_')}.json"
                 full_path = os.path.join(self.get_documents_path(), filename)
                 self.projects[project_name] = {'file': full_path}
-                self.save_projects()
-                
-                # Switch to new project
-                self.project_var.set(project_name)
-                self.current_project = project_name
+                self.refresh_project_dropdown()
                 
                 # Close dialog first
                 dialog.destroy()
                 
-                # Show success message
-                tk.messagebox.showinfo("Project Created", 
-                                     f"Project '{project_name}' created successfully!\n\nPlease restart the application to switch to the new project.")
+                # Switch to new project
+                self.switch_project(project_name)
                 
             elif project_name in self.projects:
                 tk.messagebox.showerror("Error", f"Project '{project_name}' already exists!")
@@ -809,15 +1595,19 @@ class ProjectTaskApp:
                                                 f"Enter new name for '{old_name}':",
                                                 initialvalue=old_name)
             if new_name and new_name != old_name and new_name not in self.projects:
+                # Keep the storage key so database rows stay with the project
+                self.projects[old_name].setdefault('workspace', old_name)
                 self.projects[new_name] = self.projects.pop(old_name)
                 if self.current_project == old_name:
                     self.current_project = new_name
+                if old_name in self.workspace_cache:
+                    self.workspace_cache[new_name] = self.workspace_cache.pop(old_name)
                 self.save_projects()
                 self.refresh_project_dropdown()
                 self.project_var.set(self.current_project)
                 
-                # Reload application for better readability
-                self.reload_application()
+                # The stats line shows the workspace name
+                self.update_stats()
                 
                 dialog.destroy()
             elif new_name in self.projects:
@@ -840,29 +1630,40 @@ class ProjectTaskApp:
                 
             if tk.messagebox.askyesno("Confirm Delete", 
                                      f"Are you sure you want to delete project '{project_name}'?\n\nThis will permanently delete all tasks in this project!"):
-                # Delete project file if it exists
-                project_file = self.projects[project_name]['file']
-                if os.path.exists(project_file):
-                    try:
-                        os.remove(project_file)
-                    except:
-                        pass
-                
-                # Remove from projects
-                del self.projects[project_name]
-                
                 # Switch to Default if current project was deleted
                 if self.current_project == project_name:
-                    self.current_project = 'Default'
+                    self.switch_project('Default')
                 
+                # Drop its queued saves so they cannot recreate the files
+                entry = self.forget_project(project_name)
+                
+                # Delete project file, its journal and its archive if they exist
+                try:
+                    if entry is not None:
+                        # Through the parked engines, which first let go of
+                        # a mapped snapshot; Windows cannot delete it before
+                        entry['board'].delete_files()
+                        entry['archive'].delete_files()
+                    else:
+                        for opener in (open_storage, open_archive):
+                            storage = self.open_project_storage(project_name, opener)
+                            storage.delete_files()
+                            storage.close()
+                except Exception as e:
+                    tk.messagebox.showerror("Error",
+                                            f"Could not delete every file of '{project_name}': {e}")
+                
+                # Remove from projects
+                del self.projects[project_name]
                 self.save_projects()
+                self.refresh_project_dropdown()
                 
                 # Close dialog first
                 dialog.destroy()
                 
                 # Show success message
                 tk.messagebox.showinfo("Project Deleted", 
-                                     f"Project '{project_name}' deleted successfully!\n\nPlease restart the application to see the changes.")
+                                     f"Project '{project_name}' deleted successfully!")
         
         def close_dialog():
             dialog.destroy()
@@ -883,36 +1684,104 @@ class ProjectTaskApp:
                  cursor='hand2', activebackground='#7f8c8d').pack(side=tk.RIGHT)
     
     def load_tasks(self):
-        """Load tasks from current project file"""
-        # Get the current project's data file
+        """Stream tasks from current project file into the board"""
+        self.use_workspace(self.open_workspace(self.current_project))
+        self.stream_tasks()
+    
+    def stream_tasks(self):
+        """Start streaming the current board's tasks, unless they are loading or loaded"""
+        if self.board.loaded or self.board.loader is not None:
+            return
+        # The first chunk paints as soon as the board is idle, the rest
+        # follows in batches between events
+        self.board.start_loading(on_chunk=self.show_loaded_tasks, on_done=self.finish_loading)
+    
+    def show_loaded_tasks(self):
+        """Show the tasks streamed in so far"""
+        self.load_progress['value'] = self.board.progress * 100
+        self.load_progress.place(relx=1.0, rely=0.5, anchor=tk.E)
+        # A cached board stays up until the whole list is in
+        if not self.showing_cached_board:
+            self.refresh_task_board()
+            self.profile.mark("first tasks")
+    
+    def finish_loading(self):
+        """Hide the progress bar once the whole task list is loaded"""
+        self.load_progress.place_forget()
+        self.report_recovery(self.board)
+        self.refresh_task_board()
+        self.archive_old_tasks()
+        self.profile.mark("loaded")
+        self.profile.report()
+    
+    def open_project_storage(self, project_name, opener=open_storage):
+        """Open the storage backend holding a project's tasks, or with open_archive its archive"""
+        # Snapshot plus change journal, or SQLite rows for .db task files
+        return opener(*self.project_location(project_name))
+    
+    def project_location(self, project_name):
+        """Task file, storage workspace key and snapshot format of a project"""
+        # Get the project's data file
         default_file = os.path.join(self.get_documents_path(), 'project_tasks.json')
-        self.data_file = self.projects.get(self.current_project, {}).get('file', default_file)
-        
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    self.tasks = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.tasks = []
-        else:
-            self.tasks = []
+        project = self.projects.get(project_name, {})
+        data_file = project.get('file', default_file)
+        
+        # A project's 'format' picks 'compact' JSON, indented 'json' or 'binary'
+        return (data_file, project.get('workspace', project_name),
+                project.get('format', 'compact'))
     
-    def save_tasks(self):
-        """Save tasks to file"""
-        try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.tasks, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save tasks: {str(e)}")
+    def open_workspace(self, project_name, storage=None, tasks=None):
+        """Task engines for a project's board and archive; given tasks, the board starts loaded"""
+        if storage is None:
+            storage = self.open_project_storage(project_name)
+        # Archived tasks are only read once the user asks for them
+        return {
+            'board': TaskEngine(storage, self.root, on_error=self.report_save_error, tasks=tasks),
+            'archive': TaskEngine(self.open_project_storage(project_name, open_archive), self.root,
+                                  on_error=self.report_save_error)
+        }
+    
+    def use_workspace(self, workspace):
+        """Make a workspace's board and archive the current ones"""
+        self.board = workspace['board']
+        self.archive = workspace['archive']
+    
+    def report_recovery(self, engine):
+        """Tell the user when a damaged task file was restored from its backup or set aside"""
+        if engine.recovered:
+            messagebox.showwarning("Tasks Recovered",
+                                   f"The task file for '{self.current_project}' was damaged.\n\n"
+                                   "Your tasks were restored from the last good save.")
+        elif engine.damaged:
+            messagebox.showwarning("Tasks Not Recovered",
+                                   f"The task file for '{self.current_project}' was damaged "
+                                   "and could not be restored.\n\n"
+                                   f"It was set aside as:\n{engine.storage.path}.damaged")
+    
+    def report_save_error(self, error):
+        """Show a failed background save"""
+        messagebox.showerror("Error", f"Failed to save tasks: {str(error)}")
     
     def on_closing(self):
         """Handle window closing"""
-        self.save_tasks()
+        self.prefetcher.cancel()
+        self.stop_global_search()
+        self.workspace_search.cancel()
+        for entry in self.workspace_cache.values():
+            entry['board'].flush()
+            entry['archive'].flush()
+        # Tasks not loaded yet are still in the files; only changes are written
+        self.archive.close()
+        self.board.close()
+        self.save_board_cache()
         self.root.destroy()
 
 def main():
+    # Run with --profile-startup to print how long each startup phase takes
+    profile = startup_profile(sys.argv)
     root = tk.Tk()
-    app = ProjectTaskApp(root)
+    profile.mark("tk")
+    app = ProjectTaskApp(root, profile)
     root.mainloop()
 
 if __name__ == "__main__":
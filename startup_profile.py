@@ -0,0 +1,47 @@
+"""
+Startup Profile - Per-phase startup timing shared by both apps
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Started with --profile-startup, either app marks the end of each startup
+phase, from creating the Tk root to the last task being loaded, and prints
+how long every phase took once startup is over. Without the flag the marks
+cost nothing and nothing is printed.
+"""
+
+import time
+
+
+class StartupProfile:
+    """Wall-clock duration of each startup phase"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.started = self.last = time.perf_counter()
+        self.phases = []
+        self.ended = set()
+        self.reported = False
+
+    def mark(self, phase):
+        """End a phase, which began where the previous one ended; later marks of it are ignored"""
+        if self.enabled and not self.reported and phase not in self.ended:
+            self.ended.add(phase)
+            now = time.perf_counter()
+            self.phases.append((phase, now - self.last))
+            self.last = now
+
+    def report(self):
+        """Print the phase timings once"""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        width = max((len(phase) for phase, _ in self.phases), default=5)
+        print("Startup profile:")
+        for phase, seconds in self.phases:
+            print(f"  {phase:<{width}}  {seconds * 1000:8.1f} ms")
+        print(f"  {'total':<{width}}  {(self.last - self.started) * 1000:8.1f} ms")
+
+
+def startup_profile(argv):
+    """Profile requested on the command line with --profile-startup"""
+    return StartupProfile('--profile-startup' in argv[1:])
@@ -0,0 +1,353 @@
+"""
+Task Engine - Headless task list core shared by both apps
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+A TaskEngine owns one task list: its TaskStore, the storage backend, the
+background saver and the chunked loader. Every mutation goes through the
+engine, which updates the store and queues the matching journal record,
+so the Tk apps only draw what the engine holds. A search index over the
+task titles is built in idle slices once the list is loaded, or at once
+by a search that comes first, and then kept up to date by the same calls. Nothing here needs a display: given a HeadlessLoop instead
+of a Tk root, an engine can be loaded, changed and saved from scripts,
+benchmarks or a server.
+"""
+
+import heapq
+import itertools
+import time
+
+from task_model import LazyTask, Task
+from task_search import SearchIndex
+from task_storage import SaveScheduler, ChunkedLoader, add_record, update_record, delete_record
+from task_store import TaskStore
+
+
+class TaskEngine:
+    """One task list with its mutation API and persistence, independent of any UI"""
+
+    # Seconds of indexing per idle slice, well inside a frame
+    INDEX_SLICE = 0.008
+
+    def __init__(self, storage, root=None, sort_key=None, on_error=None, tasks=None,
+                 search_field='title'):
+        # Timers for the saver and loader; a Tk root or a HeadlessLoop
+        self.root = root if root is not None else HeadlessLoop()
+        self.storage = storage
+        self.tasks = TaskStore(tasks or (), next_id=storage.next_id, sort_key=sort_key)
+        self.saver = SaveScheduler(self.root, storage, lambda: self.tasks, on_error=on_error)
+        self.loader = None
+        # Tasks already read from the storage count as loaded; until then a
+        # snapshot would drop the tasks still on disk, so only records are written
+        self.loaded = tasks is not None
+        self.saver.partial = self.saver.unloaded = not self.loaded
+        # Field searched by search(); its index is built by index_slice()
+        # from the tasks in `unindexed`, while attach() and update() keep
+        # it current
+        self.search_field = search_field
+        self.index = None
+        self.unindexed = None
+        self.index_after = None
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def __contains__(self, task):
+        return self.tasks.get(task['id']) is task
+
+    def get(self, task_id):
+        """Return the task with an id, or None"""
+        return self.tasks.get(task_id)
+
+    def count(self, status):
+        """Number of tasks with a status"""
+        return self.tasks.count(status)
+
+    def column(self, status):
+        """Tasks with a status, in order"""
+        return self.tasks.column(status)
+
+    def position(self, task):
+        """Index of a task within its status, in order"""
+        return self.tasks.position(task)
+
+    def view(self, statuses):
+        """Sequence of the tasks of several statuses, one status after another"""
+        return self.tasks.view(statuses)
+
+    def search(self, query):
+        """Ids of the tasks whose search field contains every term of a query"""
+        if self.index is None:
+            self.start_indexing()
+        if self.unindexed is not None:
+            # Searched before the idle slices got through the list
+            self.finish_indexing()
+        return self.index.search(query)
+
+    def start_indexing(self):
+        """Index the loaded tasks in slices between events"""
+        self.stop_indexing()
+        self.index = SearchIndex(self.search_field, (), self.tasks.get)
+        self.unindexed = iter(list(self.tasks))
+        self.index_after = self.root.after_idle(self.index_slice)
+
+    def index_slice(self):
+        """Index tasks for INDEX_SLICE seconds, then let the event loop run"""
+        self.index_after = None
+        deadline = time.perf_counter() + self.INDEX_SLICE
+        for count, task in enumerate(self.unindexed, 1):
+            # Tasks removed since are skipped; added ones are indexed already
+            if self.tasks.get(task['id']) is task:
+                self.index.add(task)
+            if count % 64 == 0 and time.perf_counter() > deadline:
+                self.index_after = self.root.after(1, self.index_slice)
+                return
+        self.unindexed = None
+
+    def finish_indexing(self):
+        """Index the rest of the tasks right away"""
+        if self.index_after is not None:
+            self.root.after_cancel(self.index_after)
+            self.index_after = None
+        for task in self.unindexed:
+            if self.tasks.get(task['id']) is task:
+                self.index.add(task)
+        self.unindexed = None
+
+    def stop_indexing(self):
+        """Drop the index, e.g. before the task list is read again"""
+        if self.index_after is not None:
+            self.root.after_cancel(self.index_after)
+            self.index_after = None
+        self.index = None
+        self.unindexed = None
+
+    def select(self, status, task_ids):
+        """Tasks with a status among a set of ids, e.g. search results, in order"""
+        return self.tasks.select(status, task_ids)
+
+    @property
+    def progress(self):
+        """Fraction of the task file read so far"""
+        return self.storage.progress
+
+    @property
+    def recovered(self):
+        """Whether the task file was damaged and restored from its backup"""
+        return self.storage.recovered
+
+    @property
+    def damaged(self):
+        """Whether the task file was damaged with no backup and set aside as <file>.damaged"""
+        return self.storage.damaged
+
+    def load(self):
+        """Read the whole task list at once"""
+        self.start_reading()
+        self.tasks.clear()
+        self.stop_indexing()
+        self.tasks.extend(self.storage.load())
+        self.tasks.advance_next_id(self.storage.next_id)
+        self.loaded = True
+        self.saver.end_partial()
+        self.start_indexing()
+
+    def start_loading(self, on_chunk=None, on_done=None):
+        """Stream the task list in between events; callbacks follow each chunk and the end"""
+        def add_chunk(tasks):
+            self.tasks.extend(tasks)
+            self.tasks.advance_next_id(self.storage.next_id)
+            if self.index is not None:
+                for task in tasks:
+                    self.index.add(task)
+            if on_chunk is not None:
+                on_chunk()
+
+        def reset():
+            self.tasks.clear()
+            self.stop_indexing()
+
+        def finish():
+            self.loader = None
+            self.loaded = True
+            self.tasks.advance_next_id(self.storage.next_id)
+            if self.index is None:
+                self.start_indexing()
+            if on_done is not None:
+                on_done()
+
+        self.start_reading()
+        self.loader = ChunkedLoader(self.root, self.storage, self.saver,
+                                    on_chunk=add_chunk, on_reset=reset,
+                                    on_done=finish)
+        self.loader.start()
+
+    def start_reading(self):
+        """Write what was queued before the first read, and stop folding the journal on disk"""
+        if self.saver.unloaded:
+            # Records of an unloaded list are read back with the rest, and no
+            # fold may replace the files while they are being read
+            self.saver.flush()
+            self.saver.unloaded = False
+
+    def finish_loading(self):
+        """Load whatever is still streaming right away"""
+        if self.loader is not None:
+            self.loader.finish()
+
+    def create(self, **fields):
+        """Add a new task with the next free id and return it"""
+        task = Task(fields, id=self.tasks.next_id())
+        self.add(task)
+        return task
+
+    def add(self, task):
+        """Append a task"""
+        self.attach(task)
+        self.saver.record(add_record(task))
+
+    def update(self, task, **fields):
+        """Change fields of a task"""
+        reindex = self.index is not None and self.search_field in fields
+        if reindex:
+            self.index.remove(task)
+        self.tasks.update(task, **fields)
+        if reindex:
+            self.index.add(task)
+        self.saver.record(update_record(task['id'], fields))
+
+    def remove(self, task):
+        """Remove a task"""
+        self.detach(task)
+        self.saver.record(delete_record(task['id']))
+
+    def attach(self, task):
+        """Add a task to the store and index without journaling it"""
+        self.tasks.add(task)
+        if self.index is not None:
+            self.index.add(task)
+
+    def detach(self, task):
+        """Remove a task from the store and index without journaling it"""
+        self.tasks.remove(task)
+        if self.index is not None:
+            self.index.remove(task)
+
+    def flush(self, snapshot=False):
+        """Write every queued change now, optionally as a full snapshot"""
+        self.saver.flush(snapshot=snapshot)
+
+    def close(self):
+        """Stop loading and write everything, e.g. when the app exits"""
+        self.stop_indexing()
+        if self.loader is not None:
+            # Tasks not loaded yet are still in the file; only changes are written
+            self.loader.cancel()
+            self.loader = None
+        # An unchanged task list is left as it is; a requested snapshot,
+        # e.g. after a failed write, is still written
+        self.saver.flush(snapshot=self.storage.compacts_on_close(len(self.saver.records)))
+
+    def discard(self):
+        """Drop queued writes and stop loading, e.g. before the files are deleted"""
+        self.stop_indexing()
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader = None
+        self.saver.cancel()
+
+    def delete_files(self):
+        """Discard the task list and remove its files"""
+        self.discard()
+        self.storage.delete_files()
+
+
+def move_tasks(tasks, source, target):
+    """Move tasks to another engine and return the target's copies; a crash can duplicate them, never lose them"""
+    # A target that was never loaded only gets journal records
+    target.finish_loading()
+    moved = []
+    for task in tasks:
+        source.detach(task)
+        existing = target.get(task['id'])
+        if existing is not None:
+            # The target kept its copy from a move a crash interrupted;
+            # only the source's duplicate is dropped
+            moved.append(existing)
+            continue
+        if type(task) is LazyTask and task.source is not None:
+            # The source's next snapshot only keeps the text of its own tasks
+            task.decode()
+        if target.loaded:
+            target.attach(task)
+        target.saver.record(add_record(task))
+        moved.append(task)
+    # The target's copies are on disk before the source forgets the tasks
+    target.saver.flush()
+    for task in tasks:
+        source.saver.record(delete_record(task['id']))
+    return moved
+
+
+def stale_tasks(tasks, cutoff):
+    """Tasks last modified, or else created, before an epoch time"""
+    stale = []
+    for task in tasks:
+        stamp = task.get('modified', task.get('created'))
+        if isinstance(stamp, (int, float)) and stamp < cutoff:
+            stale.append(task)
+    return stale
+
+
+def creation_order(task):
+    """Sort key of a todo within the pending and completed groups"""
+    return task['created'] or 0
+
+
+class HeadlessLoop:
+    """Stand-in for the Tk event loop where there is no display"""
+
+    def __init__(self):
+        self.timers = {}
+        self.queue = []
+        self.ids = itertools.count(1)
+
+    def after(self, delay, callback, *args):
+        """Run a callback once `delay` milliseconds have passed"""
+        timer_id = next(self.ids)
+        due = time.monotonic() + delay / 1000
+        self.timers[timer_id] = (callback, args)
+        heapq.heappush(self.queue, (due, timer_id))
+        return timer_id
+
+    def after_idle(self, callback, *args):
+        """Run a callback on the next pass of the loop"""
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, timer_id):
+        """Forget a pending callback"""
+        self.timers.pop(timer_id, None)
+
+    def run_pending(self):
+        """Run the callbacks that are due; returns how many ran"""
+        ran = 0
+        now = time.monotonic()
+        while self.queue and self.queue[0][0] <= now:
+            _, timer_id = heapq.heappop(self.queue)
+            timer = self.timers.pop(timer_id, None)
+            if timer is not None:
+                callback, args = timer
+                callback(*args)
+                ran += 1
+        return ran
+
+    def run_until_idle(self):
+        """Run callbacks, waiting for timers, until none are left"""
+        while self.timers:
+            while self.queue and self.queue[0][1] not in self.timers:
+                heapq.heappop(self.queue)
+            time.sleep(max(self.queue[0][0] - time.monotonic(), 0))
+            self.run_pending()
@@ -0,0 +1,196 @@
+"""
+Task Model - Compact task records shared by both apps
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+A Task keeps the fields every task file uses in __slots__ instead of a
+per-task dict, and interns status strings so a board holds one copy of
+each. Tasks still behave as mutable mappings with the same keys as the
+JSON files, so code written against dicts keeps working, and keys the
+model does not know about are kept in a side dict, which makes the
+conversion from and to the files lossless. A LazyTask is indexed from
+the start of its line in a memory-mapped snapshot and only decodes the
+rest when another field is used.
+"""
+
+import json
+import sys
+from collections.abc import MutableMapping
+
+# Known fields in file order: the Project Task Manager uses title/status,
+# the Todo List Manager uses task/completed. The fields the board needs to
+# place a task come first, so a mapped snapshot finds them at line starts
+FIELDS = ('id', 'status', 'completed', 'created', 'title', 'task', 'modified')
+KNOWN_FIELDS = frozenset(FIELDS)
+INDEXED_FIELDS = frozenset(('id', 'status', 'completed', 'created'))
+
+# Marks an unset slot
+MISSING = object()
+
+
+class Task(MutableMapping):
+    """One task, stored in slots; unset slots are keys the task does not have"""
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, fields=(), **kwargs):
+        # Keys outside FIELDS, or None while there are none
+        self.extra = None
+        # Loading a board builds every task here, so set the slots directly
+        # instead of going through the generic MutableMapping.update
+        for key, value in dict(fields, **kwargs).items():
+            if key in KNOWN_FIELDS:
+                setattr(self, key, value)
+            else:
+                if self.extra is None:
+                    self.extra = {}
+                self.extra[key] = value
+        status = getattr(self, 'status', None)
+        if type(status) is str:
+            self.status = sys.intern(status)
+
+    def __getitem__(self, key):
+        if key in KNOWN_FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in KNOWN_FIELDS:
+            if key == 'status' and type(value) is str:
+                # A handful of statuses repeat across the whole board
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in KNOWN_FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self.extra is not None and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in KNOWN_FIELDS:
+            return hasattr(self, key)
+        return self.extra is not None and key in self.extra
+
+    def __iter__(self):
+        for key in FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def get(self, key, default=None):
+        if key in KNOWN_FIELDS:
+            return getattr(self, key, default)
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def to_dict(self):
+        """Plain dict with the task's keys, as stored in the task files"""
+        data = {key: value for key in FIELDS
+                if (value := getattr(self, key, MISSING)) is not MISSING}
+        if self.extra is not None:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self):
+        return f"Task({self.to_dict()!r})"
+
+
+class LazyTask(Task):
+    """A Task read from a mapped snapshot line, decoded when a field outside INDEXED_FIELDS is used"""
+
+    __slots__ = ('source', 'row')
+
+    def __init__(self, source, row, fields):
+        # Only ever given indexed fields, with the status already interned
+        self.extra = None
+        for key, value in fields.items():
+            setattr(self, key, value)
+        # The MappedSnapshot holding the line, or None once decoded
+        self.source = source
+        self.row = row
+
+    def decode(self):
+        """Fill in every field from the snapshot line"""
+        source, self.source = self.source, None
+        Task.__init__(self, json.loads(source.line(self.row)))
+
+    def raw(self):
+        """The undecoded JSON text of the task"""
+        return RawTask(self.source.line(self.row))
+
+    def __getitem__(self, key):
+        if self.source is not None and key not in INDEXED_FIELDS:
+            self.decode()
+        return Task.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        if self.source is not None:
+            self.decode()
+        Task.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if self.source is not None:
+            self.decode()
+        Task.__delitem__(self, key)
+
+    def __contains__(self, key):
+        if self.source is not None and key not in INDEXED_FIELDS:
+            self.decode()
+        return Task.__contains__(self, key)
+
+    def __iter__(self):
+        if self.source is not None:
+            self.decode()
+        return Task.__iter__(self)
+
+    def get(self, key, default=None):
+        if self.source is not None and key not in INDEXED_FIELDS:
+            self.decode()
+        return Task.get(self, key, default)
+
+    def to_dict(self):
+        if self.source is not None:
+            self.decode()
+        return Task.to_dict(self)
+
+
+class RawTask(bytes):
+    """JSON text of a task that was never decoded, written back to snapshots as is"""
+
+    __slots__ = ()
+
+
+def field_of(task, key, default=None):
+    """A field of a task, read from the snapshot line of an undecoded LazyTask without decoding it"""
+    if type(task) is LazyTask and task.source is not None and key not in INDEXED_FIELDS:
+        return json.loads(task.source.line(task.row)).get(key, default)
+    return task.get(key, default)
+
+
+def copy_task(task):
+    """Plain copy of a task for writing: a dict, or RawTask for an undecoded LazyTask"""
+    if type(task) is Task:
+        return task.to_dict()
+    if type(task) is LazyTask:
+        return task.to_dict() if task.source is None else task.raw()
+    return dict(task)
@@ -0,0 +1,235 @@
+"""
+Task Search - Incremental full-text index over task titles
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+A SearchIndex maps every word of the indexed field to the ids of the
+tasks using it, and every trigram to the words containing it. A query
+matches the tasks that have, for each of its terms, a word containing
+that term. The index is kept up to date one task at a time, so searching
+never rescans the task list, and titles still held as mapped snapshot text
+are read without decoding their tasks. WorkspaceSearch searches task lists that are
+not loaded, on worker threads, from an on-disk cache of their titles that
+is only refreshed for files that changed since they were last read.
+"""
+
+import json
+import re
+import threading
+
+from task_model import field_of
+from task_storage import atomic_write, status_of
+
+# Words are runs of letters, digits and underscores, compared case-folded
+WORD = re.compile(r'\w+')
+
+
+def words_of(text):
+    """Distinct case-folded words of a text"""
+    if not isinstance(text, str):
+        return frozenset()
+    return frozenset(WORD.findall(text.casefold()))
+
+
+def trigrams(word):
+    """Every three-character slice of a word"""
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class SearchIndex:
+    """Inverted word index over one text field of a task list, with a trigram index over its words"""
+
+    def __init__(self, field, tasks=(), get_task=None):
+        self.field = field
+        # Looks a task up by id, so short terms can be checked against a
+        # few candidates instead of the whole vocabulary
+        self.get_task = get_task
+        # word -> id of the one task using it, or a set of ids once several do;
+        # most words of a large board are used by a single task
+        self.postings = {}
+        # trigram -> words containing it
+        self.grams = {}
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task):
+        """Index a task"""
+        task_id = task['id']
+        for word in words_of(field_of(task, self.field)):
+            ids = self.postings.get(word)
+            if ids is None:
+                self.postings[word] = task_id
+                for gram in trigrams(word):
+                    self.grams.setdefault(gram, set()).add(word)
+            elif type(ids) is set:
+                ids.add(task_id)
+            else:
+                self.postings[word] = {ids, task_id}
+
+    def remove(self, task):
+        """Stop finding a task; call before its indexed field changes"""
+        task_id = task['id']
+        for word in words_of(field_of(task, self.field)):
+            ids = self.postings.get(word)
+            if type(ids) is set:
+                ids.discard(task_id)
+                if ids:
+                    continue
+            elif ids != task_id:
+                continue
+            # No task uses the word any more
+            del self.postings[word]
+            for gram in trigrams(word):
+                words = self.grams[gram]
+                words.discard(word)
+                if not words:
+                    del self.grams[gram]
+
+    def words_containing(self, term):
+        """Indexed words that contain a term"""
+        if len(term) < 3:
+            # Too short for a trigram; the vocabulary is far smaller than
+            # the task list, so scanning it is still cheap
+            return [word for word in self.postings if term in word]
+        candidates = None
+        for gram in sorted(trigrams(term), key=lambda gram: len(self.grams.get(gram, ()))):
+            words = self.grams.get(gram)
+            if not words:
+                return []
+            candidates = set(words) if candidates is None else candidates & words
+            if not candidates:
+                return []
+        return [word for word in candidates if term in word]
+
+    def search(self, query):
+        """Ids of the tasks matching every term of a query"""
+        matches = set()
+        # Longest term first: it usually matches the fewest tasks
+        for number, term in enumerate(sorted(words_of(query), key=len, reverse=True)):
+            if number and len(term) < 3 and self.get_task is not None and len(matches) < 1000:
+                # A term is made of word characters, so it is inside a word
+                # exactly when it is inside the case-folded text
+                matches = {task_id for task_id in matches
+                           if term in self.get_task(task_id)[self.field].casefold()}
+                if not matches:
+                    break
+                continue
+            ids = set()
+            for word in self.words_containing(term):
+                posting = self.postings[word]
+                if type(posting) is set:
+                    ids |= posting
+                else:
+                    ids.add(posting)
+            matches = ids if number == 0 else matches & ids
+            if not matches:
+                break
+        return matches
+
+
+class WorkspaceSearch:
+    """Search task lists on disk in a worker pool, from a title cache keyed by file stamps"""
+
+    def __init__(self, index_path, field='title', max_workers=2):
+        self.index_path = index_path
+        self.field = field
+        # Threads start, and concurrent.futures is imported, on first use
+        self.max_workers = max_workers
+        self.executor = None
+        self.lock = threading.Lock()
+        # key -> {'stamp': ..., 'tasks': [[id, status, text], ...]}, read from
+        # index_path on first use; changed once a task list had to be re-read
+        self.entries = None
+        self.changed = False
+        # key -> (stamp, rows, SearchIndex over the rows), kept between searches
+        self.indexes = {}
+        self.futures = {}
+
+    def submit(self, query, sources):
+        """Search task lists in the background; sources maps a label to (key, open_storage)"""
+        self.discard()
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                               thread_name_prefix="search")
+        for label, (key, open_source) in sources.items():
+            self.futures[label] = self.executor.submit(self.search_source, key, open_source, query)
+
+    def search_source(self, key, open_source, query):
+        """Worker: the [id, status, text] rows of one task list that match a query"""
+        self.read_entries()
+        storage = open_source()
+        try:
+            stamp = storage.disk_stamp()
+            cached = self.indexes.get(key)
+            if cached is None or cached[0] != stamp:
+                with self.lock:
+                    entry = self.entries.get(key)
+                if entry is None or entry['stamp'] != stamp:
+                    # Only task lists changed since they were cached are parsed
+                    rows = [[task.get('id'), status_of(task), task.get(self.field)]
+                            for task in storage.peek()]
+                    entry = {'stamp': stamp, 'tasks': rows}
+                    with self.lock:
+                        self.entries[key] = entry
+                        self.changed = True
+                # Rows are indexed by position, since ids are only repaired on load
+                rows = entry['tasks']
+                index = SearchIndex(self.field, ({'id': number, self.field: row[2]}
+                                                 for number, row in enumerate(rows)))
+                cached = self.indexes[key] = (stamp, rows, index)
+        finally:
+            storage.close()
+        _, rows, index = cached
+        return [rows[number] for number in sorted(index.search(query))]
+
+    def read_entries(self):
+        """Load the title cache from disk once"""
+        with self.lock:
+            if self.entries is not None:
+                return
+            try:
+                with open(self.index_path, 'rb') as f:
+                    data = json.loads(f.read())
+                self.entries = dict(data['sources'])
+            except (OSError, ValueError, KeyError, TypeError):
+                self.entries = {}
+
+    def pending(self):
+        """Whether any task list has not been collected yet"""
+        return bool(self.futures)
+
+    def completed(self):
+        """Pop the label -> rows results that are ready; failed searches give no rows"""
+        results = {}
+        for label, future in list(self.futures.items()):
+            if future.done():
+                del self.futures[label]
+                if not future.cancelled():
+                    results[label] = future.result() if future.exception() is None else []
+        return results
+
+    def save(self, keys):
+        """Write the title cache in the background, keeping only the given keys"""
+        if self.changed or (self.entries is not None and set(self.entries) - set(keys)):
+            self.executor.submit(self.write_entries, set(keys))
+
+    def write_entries(self, keys):
+        """Worker: replace the cache file"""
+        with self.lock:
+            self.entries = {key: entry for key, entry in self.entries.items() if key in keys}
+            self.changed = False
+            data = json.dumps({'sources': self.entries}, ensure_ascii=False, separators=(',', ':'))
+        atomic_write(self.index_path, data.encode('utf-8'))
+
+    def discard(self):
+        """Forget the searches still pending; running ones finish but are ignored"""
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+
+    def cancel(self):
+        """Stop searching, e.g. when the window closes"""
+        self.discard()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
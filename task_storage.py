@@ -0,0 +1,1438 @@
+"""
+Task Storage - Journaled persistence for task lists
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Shared by the Todo List Manager and the Project Task Manager. A task list
+is kept as a JSON snapshot plus an append-only journal with one compact
+record per mutation, so saving a change no longer rewrites the whole file.
+Records address tasks by their id, which load() keeps unique; each task
+list also persists the next id to hand out, so ids are never reused.
+Times are stored as epoch seconds and only formatted for display.
+Task files ending in .db or .sqlite are stored in an SQLite database
+instead, which can hold every workspace in one file. Writes are batched
+by SaveScheduler and run on a worker thread, off the Tk event loop.
+Snapshots are written to a synced temp file and renamed into place, so a
+crash leaves either the old or the new file, never a truncated one.
+Snapshots can be indented JSON, compact JSON or a binary columnar
+encoding; the format is detected when a file is read. Compact snapshots
+hold one task per line, so ChunkedLoader can stream them into the UI;
+large ones are memory-mapped instead, and each task is only decoded once
+a field beyond its id, status and creation time is used. Archived tasks
+are kept in a second task list next to the first, see open_archive().
+"""
+
+import json
+import mmap
+import os
+import re
+import shutil
+import struct
+import sys
+import threading
+from array import array
+from datetime import datetime
+from functools import lru_cache
+
+from task_model import LazyTask, RawTask, copy_task
+
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+
+# Magic bytes at the start of a binary columnar snapshot
+BINARY_MAGIC = b"GTB1"
+
+# Where open_archive() keeps a task list's archived tasks
+ARCHIVE_FILE_SUFFIX = ".archive"
+ARCHIVE_WORKSPACE_SUFFIX = "::archive"
+
+# First line of a compact snapshot; each following line holds one task
+STREAM_HEADER = re.compile(rb'\{"next_id":(\d+),"tasks":\[\n')
+
+# One task line of a compact snapshot, with the fields a mapped snapshot
+# indexes; Task writes them right after the id when a task has them
+MAPPED_LINE = re.compile(
+    rb'\{"id":(-?\d+),'
+    rb'(?:"status":"((?:[^"\\\n]|\\.)*)",)?'
+    rb'(?:"completed":(true|false),)?'
+    rb'(?:"created":(null|-?[0-9][0-9.eE+-]*),)?'
+    rb'[^\n]*\n')
+
+# Task fields holding epoch seconds, and how cards display them
+TIMESTAMP_FIELDS = ('created', 'modified')
+DISPLAY_FORMAT = '%b %d, %Y - %I:%M%p'
+
+
+def open_storage(path, workspace="Default", snapshot_format='compact'):
+    """Return the storage backend for a task file, chosen by its extension"""
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        return SqliteStorage(path, workspace)
+    return JournalStorage(path, snapshot_format=snapshot_format)
+
+
+def open_archive(path, workspace="Default", snapshot_format='compact'):
+    """Return the storage backend for the archived tasks of a task file"""
+    # A sibling file, or a companion workspace in the same database
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        return SqliteStorage(path, workspace + ARCHIVE_WORKSPACE_SUFFIX)
+    root, extension = os.path.splitext(path)
+    return JournalStorage(root + ARCHIVE_FILE_SUFFIX + extension, snapshot_format=snapshot_format)
+
+
+class JournalStorage:
+    """A JSON snapshot file plus an append-only journal of mutations"""
+
+    def __init__(self, path, compact_after=500, snapshot_format='compact',
+                 map_threshold=8 * 1024 * 1024):
+        self.path = path
+        self.snapshot_format = snapshot_format
+        self.journal_path = path + ".journal"
+        self.backup_path = path + ".bak"
+        self.compact_after = compact_after
+        # Compact snapshots this large are memory-mapped and decoded lazily
+        self.map_threshold = map_threshold
+        self.mapping = None
+        # Set by load() when the snapshot was damaged and the backup was used,
+        # or when it was damaged with no backup and was set aside
+        self.recovered = False
+        self.damaged = False
+        # Journal records written since the last snapshot
+        self.pending = 0
+        # Next task id to hand out; stored in the snapshot, never decreases
+        self.next_id = 1
+        # Fraction of the file read by load_chunks(), and whether it found
+        # data in an old layout that the next snapshot should rewrite
+        self.progress = 0.0
+        self.migrated = False
+
+    def snapshot_stamp(self):
+        """Identify the current snapshot file by its size and modification time"""
+        return file_stamp(self.path)
+
+    def peek_columns(self, statuses, limit):
+        """Column counts and first tasks; None, as they need the whole file read"""
+        return None
+
+    def disk_stamp(self):
+        """Identify the stored task list by its snapshot and journal files"""
+        return [file_stamp(self.path), file_stamp(self.journal_path)]
+
+    def peek(self):
+        """Read the task list without recovering, repairing or migrating anything"""
+        snapshot = self.read_snapshot(self.path)
+        if snapshot is None:
+            # The journal was written against the unreadable snapshot
+            backup = self.read_snapshot(self.backup_path)
+            return backup[0] if backup is not None else []
+        repair_ids(snapshot[0])
+        return replay_records(snapshot[0], self.read_journal(repair=False))
+
+    def load(self):
+        """Load the snapshot and replay the journal written on top of it"""
+        tasks, migrate = self.read_tasks()
+        repaired = repair_ids(tasks)
+        converted = migrate_timestamps(tasks)
+        if repaired or converted or migrate:
+            # One-time migration: fold everything into a fresh snapshot that
+            # stores the id counter and numeric times, so id-keyed records are
+            # never written on top of repaired ids or position-keyed records
+            self.save_snapshot(tasks)
+        return tasks
+
+    def read_tasks(self):
+        """Return the stored tasks and whether the file predates task ids"""
+        self.recovered = False
+        self.damaged = False
+        self.pending = 0
+        self.next_id = 1
+        snapshot = self.read_snapshot(self.path)
+        if snapshot is None:
+            backup = self.read_snapshot(self.backup_path)
+            if backup is not None:
+                # Damaged or missing: restore the previous good snapshot and
+                # set the damaged file aside for inspection
+                if os.path.exists(self.path):
+                    os.replace(self.path, self.path + ".damaged")
+                    self.recovered = True
+                shutil.copyfile(self.backup_path, self.path)
+                # The journal was written against the lost snapshot
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+                tasks, next_id = backup
+                self.next_id = max(next_id or 1, next_free_id(tasks))
+                return tasks, next_id is None
+            if os.path.exists(self.path):
+                # Nothing to restore, but the damaged file and the journal
+                # written on top of it are kept for inspection instead of
+                # being overwritten by the next save
+                os.replace(self.path, self.path + ".damaged")
+                if os.path.exists(self.journal_path):
+                    os.replace(self.journal_path, self.path + ".damaged.journal")
+                self.damaged = True
+            snapshot = [], 1
+        tasks, next_id = snapshot
+        # Files written before ids were unique can repeat or lack them; the
+        # replay below keys tasks by id, so they are repaired first
+        repaired = repair_ids(tasks)
+        self.next_id = max(next_id or 1, next_free_id(tasks))
+        # Snapshots written before the id counter existed carry no next_id
+        migrate = next_id is None or repaired
+        return replay_records(tasks, self.read_journal()), migrate
+
+    def read_journal(self, repair=True):
+        """Return the records of the journal written on top of the current snapshot"""
+        self.pending = 0
+        if not os.path.exists(self.journal_path):
+            return []
+
+        with open(self.journal_path, 'rb') as f:
+            lines = f.read().splitlines(keepends=True)
+
+        # The first line names the snapshot the journal applies to; a journal
+        # left behind by an interrupted compaction is stale and ignored
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if header.get('base') != self.snapshot_stamp():
+            return []
+
+        records = []
+        offset = len(lines[0])
+        for line in lines[1:]:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("unterminated record")
+                record = json.loads(line)
+            except ValueError:
+                # A crash mid-append leaves a truncated last line; cut it off
+                # so later records are not glued onto it
+                if repair:
+                    with open(self.journal_path, 'r+b') as f:
+                        f.truncate(offset)
+                break
+            records.append(record)
+            offset += len(line)
+            self.pending += 1
+        self.count_added(records)
+        return records
+
+    def load_chunks(self, chunk_size=1000, first_chunk=100):
+        """Yield the tasks load() would return, in chunks, parsing the snapshot as it goes"""
+        self.recovered = False
+        self.damaged = False
+        self.progress = 0.0
+        self.migrated = False
+        # Only compact snapshots with an id counter and an id-keyed journal
+        # can be streamed; anything else is recovered or migrated by load()
+        # and arrives as a single chunk
+        stream = self.stream_snapshot()
+        if stream is None:
+            yield self.load()
+            self.progress = 1.0
+            return
+
+        # Journal changes are applied to each task as it streams past, and
+        # to added tasks at the end, each in journal order. That only holds
+        # while an add is the first record of its id: after a delete, or
+        # for a second add, only load() replays the records in order
+        changes = {}
+        added = []
+        in_order = True
+        for record in self.read_journal():
+            if record.get('op') == 'add':
+                if isinstance(record.get('task'), dict):
+                    task_id = record['task'].get('id')
+                    in_order = in_order and task_id not in changes
+                    changes[task_id] = []
+                    added.append(record['task'])
+            else:
+                changes.setdefault(record.get('id'), []).append(record)
+        if not in_order:
+            stream.close()
+            yield self.load()
+            self.progress = 1.0
+            return
+
+        chunk = []
+        limit = first_chunk
+        seen = set()
+        damaged = False
+        try:
+            for task in stream:
+                if type(task.get('id')) is not int or task['id'] in seen:
+                    raise ValueError("task without a unique id")
+                seen.add(task['id'])
+                if apply_changes(task, changes):
+                    chunk.append(task)
+                if len(chunk) >= limit:
+                    self.migrated = migrate_timestamps(
+                        [task for task in chunk if type(task) is not LazyTask]) or self.migrated
+                    yield chunk
+                    chunk = []
+                    limit = chunk_size
+        except (ValueError, AttributeError, OSError):
+            damaged = True
+        finally:
+            stream.close()
+        if damaged:
+            # Damaged part way through: None tells the consumer to drop the
+            # chunks so far, then load() recovers the whole list
+            self.release_mapping()
+            yield None
+            yield self.load()
+            self.progress = 1.0
+            return
+
+        if any(task.get('id') in seen for task in added):
+            # Added again under an id the snapshot still holds, e.g. by a move
+            # that crashed half way; load() keeps one of them
+            self.release_mapping()
+            yield None
+            yield self.load()
+            self.progress = 1.0
+            return
+        for task in added:
+            if apply_changes(task, changes):
+                chunk.append(task)
+        self.migrated = migrate_timestamps(
+            [task for task in chunk if type(task) is not LazyTask]) or self.migrated
+        self.progress = 1.0
+        yield chunk
+
+    def stream_snapshot(self):
+        """Generator over the tasks of a compact snapshot, or None when it cannot stream"""
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return None
+        # The header is short; binary or indented snapshots fail to match
+        # without reading far into the file
+        header = f.readline(64)
+        match = STREAM_HEADER.fullmatch(header)
+        if match is None:
+            f.close()
+            return None
+        self.next_id = int(match.group(1))
+        if os.fstat(f.fileno()).st_size >= self.map_threshold:
+            return self.iter_mapped(f, len(header))
+        return self.iter_snapshot(f)
+
+    def iter_mapped(self, f, position):
+        """Yield the tasks of a compact snapshot as LazyTasks over a read-only mapping"""
+        with f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mapping = self.mapping = MappedSnapshot(data)
+        size = max(len(data), 1)
+        # Each status string is decoded once and shared by its tasks
+        statuses = {}
+        for match in MAPPED_LINE.finditer(data, position):
+            if match.start() != position:
+                raise ValueError("snapshot line does not start with its id")
+            position = match.end()
+            row = mapping.add_line(match.start(), position - 1)
+            task_id, status, completed, created = match.groups()
+            if status is None and completed is None:
+                # Written without the indexed fields up front; decode it now
+                yield json.loads(mapping.line(row))
+                continue
+            fields = {'id': int(task_id)}
+            if status is not None:
+                if status not in statuses:
+                    statuses[status] = sys.intern(json.loads(b'"' + status + b'"')
+                                                  if b"\\" in status else status.decode('utf-8'))
+                fields['status'] = statuses[status]
+            if completed is not None:
+                fields['completed'] = completed == b"true"
+            if created is not None:
+                fields['created'] = parse_number(created)
+            if row % 4096 == 0:
+                self.progress = position / size
+            yield LazyTask(mapping, row, fields)
+        if data[position:position + 1] == b"\n":
+            position += 1
+        if data[position:position + 2] != b"]}":
+            raise ValueError("truncated snapshot")
+
+    def release_mapping(self):
+        """Stop using the file mapping, so the snapshot can be replaced or removed"""
+        if self.mapping is not None:
+            self.mapping.release()
+
+    def hold_mapping(self, tasks, copies):
+        """Close the file mapping before a snapshot replaces it, keeping the copied text of undecoded tasks"""
+        mapping = self.mapping
+        if mapping is not None:
+            mapping.hold({task.row: (task['id'], copy) for task, copy in zip(tasks, copies)
+                          if type(task) is LazyTask and task.source is mapping})
+
+    def map_snapshot(self):
+        """Map the snapshot just written as (data, {id: line extent}), or None to keep the held text"""
+        if self.mapping is None or self.mapping.held is None:
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                header = f.readline(64)
+                if STREAM_HEADER.fullmatch(header) is None:
+                    return None
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        extents = {}
+        position = len(header)
+        for match in MAPPED_LINE.finditer(data, position):
+            if match.start() != position:
+                break
+            position = match.end()
+            end = position - 1
+            if data[end - 1:end] == b",":
+                end -= 1
+            extents[int(match.group(1))] = (match.start(), end)
+        return data, extents
+
+    def rebind_mapping(self, mapped):
+        """Let the held tasks read from the snapshot mapped by map_snapshot()"""
+        if self.mapping is not None and self.mapping.held is not None:
+            self.mapping.rebind(*mapped)
+
+    def close(self):
+        """Let go of the files, e.g. after a one-off read"""
+        self.release_mapping()
+
+    def iter_snapshot(self, f):
+        """Yield the tasks of an open compact snapshot, one per line"""
+        with f:
+            size = max(os.fstat(f.fileno()).st_size, 1)
+            for count, line in enumerate(f, 1):
+                if line.startswith(b"]}"):
+                    return
+                line = line.rstrip(b"\r\n")
+                if not line:
+                    continue
+                task = json.loads(line[:-1] if line.endswith(b",") else line)
+                if count % 256 == 0:
+                    self.progress = f.tell() / size
+                yield task
+        # The closing line is missing: the file was cut short
+        raise ValueError("truncated snapshot")
+
+    def read_snapshot(self, path):
+        """Read one snapshot file as (tasks, next_id), or None when it is missing or damaged"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                tasks, next_id = decode_tasks(f.read())
+        except (ValueError, OSError, struct.error, IndexError, KeyError, TypeError):
+            return None
+        return (tasks, next_id) if isinstance(tasks, list) else None
+
+    def count_added(self, records):
+        """Advance the id counter past the ids of added tasks"""
+        for record in records:
+            if record.get('op') == 'add':
+                self.next_id = max(self.next_id, next_free_id([record['task']]))
+
+    def append(self, record):
+        """Append one mutation record to the journal"""
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Append mutation records to the journal with a single fsync"""
+        if self.pending == 0 and not self.resume_journal():
+            # Missing, empty or stale: start a fresh journal bound to the
+            # current snapshot
+            with open(self.journal_path, 'w', encoding='utf-8') as f:
+                f.write(encode_record({'base': self.snapshot_stamp()}))
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(encode_record(record))
+            f.flush()
+            os.fsync(f.fileno())
+        self.pending += len(records)
+        self.count_added(records)
+
+    def resume_journal(self):
+        """Count the records of a journal left on the current snapshot; False if there is none"""
+        # A task list that was never loaded, such as an archive, may still
+        # have records from earlier sessions; they are kept, counted without
+        # being parsed, and a torn last line is cut off
+        try:
+            with open(self.journal_path, 'r+b') as f:
+                header = f.readline()
+                try:
+                    base = json.loads(header).get('base')
+                except (ValueError, AttributeError):
+                    return False
+                if base != self.snapshot_stamp():
+                    return False
+                records = f.read()
+                if records and not records.endswith(b"\n"):
+                    records = records[:records.rfind(b"\n") + 1]
+                    f.truncate(len(header) + len(records))
+        except OSError:
+            return False
+        self.pending = records.count(b"\n")
+        return self.pending > 0
+
+    def fold_journal(self):
+        """Fold the journal into a new snapshot, for a task list that is not in memory"""
+        tasks = self.load()
+        # load() already wrote a snapshot when it migrated the file
+        if self.pending:
+            self.save_snapshot(tasks)
+
+    def needs_compaction(self, extra=0):
+        """Whether the journal (plus `extra` queued records) should fold into a new snapshot"""
+        return self.pending + extra >= self.compact_after
+
+    def compacts_on_close(self, extra=0):
+        """Whether closing should fold the journal (plus `extra` queued records) into a snapshot"""
+        return self.pending + extra > 0
+
+    def save_snapshot(self, tasks):
+        """Write the full task list and start an empty journal"""
+        self.next_id = max(self.next_id, next_free_id(tasks))
+        atomic_write(self.path, encode_tasks(tasks, self.snapshot_format, self.next_id),
+                     backup_path=self.backup_path)
+        # Only drop the journal once the new snapshot is on disk; until then
+        # its header still matches the old snapshot
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.pending = 0
+
+    def disk_size(self):
+        """Bytes that load() has to read"""
+        return sum(os.path.getsize(path) for path in (self.path, self.journal_path)
+                   if os.path.exists(path))
+
+    def delete_files(self):
+        """Remove the snapshot and journal of this task list"""
+        self.release_mapping()
+        for path in (self.path, self.journal_path, self.backup_path, self.path + ".damaged",
+                     self.path + ".damaged.journal"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class MappedSnapshot:
+    """Text of a memory-mapped snapshot shared by its LazyTasks, with the extent of each line"""
+
+    def __init__(self, data):
+        self.data = data
+        self.starts = array('q')
+        self.ends = array('q')
+        # {row: (id, text)} of tasks read from copies while a new snapshot
+        # replaces the file, or None
+        self.held = None
+
+    def add_line(self, start, end):
+        """Record one task line and return its row number"""
+        self.starts.append(start)
+        self.ends.append(end)
+        return len(self.starts) - 1
+
+    def line(self, row):
+        """JSON text of the task on a row"""
+        if self.held is not None and row in self.held:
+            return self.held[row][1]
+        text = self.data[self.starts[row]:self.ends[row]]
+        return text[:-1] if text.endswith(b",") else text
+
+    def release(self):
+        """Copy the text out of the mapping and close it"""
+        if isinstance(self.data, mmap.mmap):
+            mapped = self.data
+            self.data = mapped[:]
+            mapped.close()
+
+    def hold(self, lines):
+        """Read the given rows from {row: (id, text)} and close the mapping"""
+        self.held = lines
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b""
+
+    def rebind(self, data, extents):
+        """Read the held rows from a new mapping, given {id: (start, end)} of its lines"""
+        held = {}
+        for row, (task_id, text) in self.held.items():
+            start, end = extents.get(task_id, (0, -1))
+            if end - start == len(text):
+                self.starts[row] = start
+                self.ends[row] = end
+            else:
+                # Not written as held, e.g. a snapshot in another format
+                held[row] = (task_id, text)
+        self.held = held or None
+        self.data = data
+
+
+class SqliteStorage:
+    """Tasks of one workspace stored as rows of a shared SQLite database"""
+
+    def __init__(self, path, workspace="Default"):
+        self.path = path
+        self.workspace = workspace
+        # SQLite transactions never leave a half-written table behind
+        self.recovered = False
+        self.damaged = False
+        # Fraction of the rows read by load_chunks(); rows never need migrating
+        self.progress = 0.0
+        self.migrated = False
+        # Lowest id the next snapshot may store as the counter
+        self.snapshot_next_id = 1
+        # Imported here, so apps using JSON task files never load sqlite3
+        import sqlite3
+        # Writes run on the SaveScheduler worker thread while the Tk thread
+        # reads; every use of the connection holds the lock, so neither
+        # sees the other's statements or transactions half done
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.RLock()
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                " workspace TEXT NOT NULL,"
+                " position INTEGER NOT NULL,"
+                " status TEXT,"
+                " data TEXT NOT NULL,"
+                " task_id INTEGER NOT NULL)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS workspaces ("
+                " workspace TEXT PRIMARY KEY,"
+                " next_id INTEGER NOT NULL)")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS tasks_position ON tasks (workspace, position)")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS tasks_id ON tasks (workspace, task_id)")
+            # Column counts and pages, see count_by_status() and page()
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS tasks_status ON tasks (workspace, status, position)")
+
+    def load(self):
+        """Load the workspace's tasks in board order"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT data FROM tasks WHERE workspace = ? ORDER BY position",
+                (self.workspace,)).fetchall()
+        tasks = [json.loads(data) for data, in rows]
+        with self.lock, self.connection:
+            self.advance_next_id(next_free_id(tasks))
+        return tasks
+
+    def peek(self):
+        """Read the workspace's tasks without repairing or migrating anything"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT data FROM tasks WHERE workspace = ? ORDER BY position",
+                (self.workspace,)).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def count_by_status(self):
+        """Number of the workspace's tasks per status"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT status, COUNT(*) FROM tasks WHERE workspace = ? GROUP BY status",
+                (self.workspace,)).fetchall()
+        return dict(rows)
+
+    def page(self, status, offset=0, limit=50):
+        """One page of a column's tasks in board order"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT data FROM tasks WHERE workspace = ? AND status = ?"
+                " ORDER BY position LIMIT ? OFFSET ?",
+                (self.workspace, status, limit, offset)).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def peek_columns(self, statuses, limit):
+        """{status: (task count, first `limit` tasks)}, read through the status index"""
+        # One lock for all the queries, so counts and pages agree
+        with self.lock:
+            counts = self.count_by_status()
+            return {status: (counts.get(status, 0), self.page(status, 0, limit))
+                    for status in statuses}
+
+    def disk_stamp(self):
+        """Identify the database state by its file and write-ahead log"""
+        # Shared by every workspace, so a change to any of them counts
+        return [file_stamp(self.path), file_stamp(self.path + "-wal")]
+
+    def close(self):
+        """Close the database connection, e.g. after a one-off read"""
+        with self.lock:
+            self.connection.close()
+
+    def load_chunks(self, chunk_size=1000, first_chunk=100):
+        """Return an iterator over the workspace's tasks in board order, one page at a time"""
+        self.progress = 0.0
+        self.migrated = False
+        # Counted right away, before the saver can add rows for tasks created
+        # while the list streams in: those tasks are already in memory, and
+        # the saver's rows always go after the last position counted here.
+        # The lock keeps the count out of the middle of a saver transaction
+        with self.lock:
+            total, last = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(MAX(position), 0) FROM tasks WHERE workspace = ?",
+                (self.workspace,)).fetchone()
+        return self.iter_chunks(total, last, chunk_size, first_chunk)
+
+    def iter_chunks(self, total, last, chunk_size, first_chunk):
+        """Yield the rows up to position `last` as lists of tasks"""
+        # Each page is its own short query, so neither a read transaction
+        # nor the lock stays held between chunks and blocks the saver's writes
+        # Positions start at 1
+        position = 0
+        limit = first_chunk
+        loaded = 0
+        seen = set()
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT position, data, task_id FROM tasks"
+                    " WHERE workspace = ? AND position > ? AND position <= ?"
+                    " ORDER BY position LIMIT ?",
+                    (self.workspace, position, last, limit)).fetchall()
+            if not rows:
+                break
+            if any(task_id in seen for _, _, task_id in rows):
+                yield None
+                yield self.load()
+                self.progress = 1.0
+                return
+            seen.update(task_id for _, _, task_id in rows)
+            tasks = [json.loads(data) for _, data, _ in rows]
+            position = rows[-1][0]
+            loaded += len(rows)
+            self.progress = loaded / max(total, 1)
+            yield tasks
+            limit = chunk_size
+        self.progress = 1.0
+
+    @property
+    def next_id(self):
+        """Next task id to hand out in this workspace"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT next_id FROM workspaces WHERE workspace = ?", (self.workspace,)).fetchone()
+        return row[0] if row else 1
+
+    def advance_next_id(self, next_id):
+        """Raise the stored id counter to at least next_id"""
+        self.connection.execute(
+            "INSERT INTO workspaces (workspace, next_id) VALUES (?, ?)"
+            " ON CONFLICT (workspace) DO UPDATE SET next_id = MAX(next_id, excluded.next_id)",
+            (self.workspace, next_id))
+
+    def count_added(self, records):
+        """Keep the ids of added tasks used by the next snapshot"""
+        tasks = [record['task'] for record in records if record.get('op') == 'add']
+        self.snapshot_next_id = max(self.snapshot_next_id, next_free_id(tasks))
+
+    def append(self, record):
+        """Apply one mutation record directly to the database"""
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Apply mutation records to the database in one transaction"""
+        with self.lock, self.connection:
+            for record in records:
+                self.apply(record)
+
+    def apply(self, record):
+        """Apply one mutation record inside the current transaction, holding the lock"""
+        op = record.get('op')
+        if op == 'add':
+            (last,) = self.connection.execute(
+                "SELECT COALESCE(MAX(position), 0) FROM tasks WHERE workspace = ?",
+                (self.workspace,)).fetchone()
+            self.insert(record['task'], last + 1)
+            self.advance_next_id(next_free_id([record['task']]))
+        elif op == 'set':
+            row = self.row_for(record['id'])
+            if row is not None:
+                task = json.loads(row[1])
+                task.update(record['fields'])
+                self.connection.execute(
+                    "UPDATE tasks SET status = ?, data = ? WHERE rowid = ?",
+                    (status_of(task), encode_task(task), row[0]))
+        elif op == 'delete':
+            self.connection.execute(
+                "DELETE FROM tasks WHERE workspace = ? AND task_id = ?",
+                (self.workspace, record['id']))
+
+    def row_for(self, task_id):
+        """Return (rowid, data) of the task with an id"""
+        return self.connection.execute(
+            "SELECT rowid, data FROM tasks WHERE workspace = ? AND task_id = ?",
+            (self.workspace, task_id)).fetchone()
+
+    def insert(self, task, position):
+        """Insert one task row"""
+        self.connection.execute(
+            "INSERT INTO tasks (workspace, position, status, data, task_id)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (self.workspace, position, status_of(task), encode_task(task), task['id']))
+
+    def needs_compaction(self, extra=0):
+        """Rows are updated in place, so there is never a journal to fold"""
+        return False
+
+    def compacts_on_close(self, extra=0):
+        """Records already changed the rows in place; rewriting them all would only cost time"""
+        return False
+
+    def save_snapshot(self, tasks):
+        """Replace all of the workspace's rows with the given task list"""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM tasks WHERE workspace = ?", (self.workspace,))
+            for position, task in enumerate(tasks, 1):
+                self.insert(task, position)
+            self.advance_next_id(max(self.snapshot_next_id, next_free_id(tasks)))
+
+    def disk_size(self):
+        """Size of the database file, an upper bound for this workspace"""
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def release_mapping(self):
+        """Rows are read through SQLite, never from a file mapping"""
+
+    def hold_mapping(self, tasks, copies):
+        """Rows are read through SQLite, never from a file mapping"""
+
+    def map_snapshot(self):
+        """Rows are read through SQLite, never from a file mapping"""
+        return None
+
+    def rebind_mapping(self, mapped):
+        """Rows are read through SQLite, never from a file mapping"""
+
+    def delete_files(self):
+        """Remove the workspace's rows; other workspaces share the file"""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM tasks WHERE workspace = ?", (self.workspace,))
+            self.connection.execute("DELETE FROM workspaces WHERE workspace = ?", (self.workspace,))
+
+
+class SaveScheduler:
+    """Coalesce bursts of changes into one background write after a quiet period"""
+
+    def __init__(self, root, storage, get_tasks, on_error=None, delay=400):
+        self.root = root
+        self.storage = storage
+        self.get_tasks = get_tasks
+        self.on_error = on_error
+        self.delay = delay
+        self.records = []
+        self.snapshot_requested = False
+        self.after_id = None
+        self.worker = None
+        self.error = None
+        # Set while the task list is still streaming in: a snapshot of it
+        # would drop the tasks not loaded yet, so snapshots wait until then
+        self.partial = False
+        # Set while none of the task list has been read, e.g. for an archive
+        # that is only written to; a long journal is then folded on disk
+        self.unloaded = False
+        # The snapshot a worker wrote and mapped, for the Tk thread to rebind
+        self.remapped = None
+
+    def record(self, record):
+        """Queue one journal record and restart the quiet-period timer"""
+        self.records.append(record)
+        if self.partial:
+            # Tasks added now sit before the ones still loading; a snapshot
+            # after the load keeps that order on disk as well
+            self.snapshot_requested = True
+        self.schedule()
+
+    def request_snapshot(self):
+        """Queue a full snapshot write instead of individual records"""
+        self.snapshot_requested = True
+        self.schedule()
+
+    def schedule(self):
+        """Write once no further change arrives for `delay` milliseconds"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        self.after_id = self.root.after(self.delay, self.start_write)
+
+    def take_batch(self):
+        """Collect the queued work as (records, snapshot, fold); a snapshot supersedes records"""
+        records, self.records = self.records, []
+        snapshot = None
+        if self.partial:
+            # Keep journaling; snapshot_requested stays set for end_partial()
+            fold = self.unloaded and self.storage.needs_compaction(len(records))
+            return records, None, fold
+        if self.snapshot_requested or self.storage.needs_compaction(len(records)):
+            # Copy on the Tk thread so the worker never sees a half-edited task;
+            # lazily decoded tasks read their copied text until the new file
+            # is mapped in its place
+            tasks = list(self.get_tasks())
+            snapshot = [copy_task(task) for task in tasks]
+            self.storage.hold_mapping(tasks, snapshot)
+            # Tasks added and moved away since, e.g. to the archive, leave
+            # no trace in the snapshot; their ids must stay used
+            self.storage.count_added(records)
+            records = []
+        self.snapshot_requested = False
+        return records, snapshot, False
+
+    def write(self, records, snapshot, fold=False):
+        """Perform one batch of storage writes"""
+        try:
+            if snapshot is not None:
+                self.storage.save_snapshot(snapshot)
+                self.remapped = self.storage.map_snapshot()
+            if records:
+                self.storage.append_many(records)
+            if fold:
+                self.storage.fold_journal()
+        except Exception as e:
+            self.error = e
+
+    def start_write(self):
+        """Hand the queued batch to a worker thread"""
+        self.after_id = None
+        if self.worker is not None and self.worker.is_alive():
+            # Still writing the previous batch; try again later
+            self.schedule()
+            return
+        self.rebind()
+        records, snapshot, fold = self.take_batch()
+        if not records and snapshot is None and not fold:
+            return
+        self.worker = threading.Thread(target=self.write, args=(records, snapshot, fold),
+                                       daemon=True)
+        self.worker.start()
+        self.root.after(50, self.check_worker)
+
+    def check_worker(self):
+        """Report a failed background write on the Tk thread"""
+        if self.worker is not None and self.worker.is_alive():
+            self.root.after(50, self.check_worker)
+            return
+        self.rebind()
+        self.report_error()
+
+    def rebind(self):
+        """Move lazily decoded tasks onto the mapping of the snapshot written last"""
+        if self.remapped is not None:
+            mapped, self.remapped = self.remapped, None
+            self.storage.rebind_mapping(mapped)
+
+    def report_error(self):
+        """Surface the last write error, and rewrite everything next time"""
+        if self.error is None:
+            return
+        error, self.error = self.error, None
+        self.snapshot_requested = True
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def flush(self, snapshot=False):
+        """Synchronously finish all pending writes, e.g. before closing"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
+        self.rebind()
+        if snapshot:
+            self.snapshot_requested = True
+        if self.error is not None:
+            # The last background write failed; fall back to a full snapshot
+            self.error = None
+            self.snapshot_requested = True
+        records, batch_snapshot, fold = self.take_batch()
+        if records or batch_snapshot is not None:
+            self.write(records, batch_snapshot)
+            self.rebind()
+        if fold:
+            # Folding reads the whole list; leave it to the worker thread
+            self.schedule()
+        self.report_error()
+
+    def end_partial(self):
+        """The task list is complete; write a snapshot held back meanwhile"""
+        self.partial = False
+        if self.snapshot_requested or self.storage.needs_compaction(len(self.records)):
+            self.schedule()
+
+    def cancel(self):
+        """Drop all queued writes, e.g. before the task file is deleted"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
+        self.records = []
+        self.snapshot_requested = False
+        self.remapped = None
+        self.error = None
+
+
+class ChunkedLoader:
+    """Stream a storage's tasks into the UI in chunks between Tk events"""
+
+    def __init__(self, root, storage, saver, on_chunk, on_reset, on_done,
+                 chunk_size=1000, first_chunk=100):
+        self.root = root
+        self.storage = storage
+        self.saver = saver
+        self.on_chunk = on_chunk
+        self.on_reset = on_reset
+        self.on_done = on_done
+        self.chunks = storage.load_chunks(chunk_size, first_chunk)
+        self.after_id = None
+        self.saver.partial = True
+
+    def start(self):
+        """Deliver the first chunk as soon as the event loop is idle"""
+        self.after_id = self.root.after_idle(self.step)
+
+    def step(self):
+        """Deliver one chunk, then let Tk handle events before the next"""
+        self.after_id = None
+        if self.deliver_next():
+            self.after_id = self.root.after(1, self.step)
+
+    def deliver_next(self):
+        """Hand the next chunk to the UI; False once the load is complete"""
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.complete()
+            return False
+        except OSError:
+            # Unreadable from here on; keep what has been loaded
+            self.complete()
+            return False
+        if chunk is None:
+            self.on_reset()
+        else:
+            self.on_chunk(chunk)
+        return True
+
+    def finish(self):
+        """Load everything that is left right away, e.g. before switching away"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        while self.deliver_next():
+            pass
+
+    def cancel(self):
+        """Stop loading without touching the file, e.g. when the window closes"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.chunks.close()
+
+    def complete(self):
+        """Release held-back snapshots and tell the UI the list is complete"""
+        if self.storage.migrated:
+            self.saver.snapshot_requested = True
+        self.saver.end_partial()
+        self.on_done()
+
+
+class Prefetcher:
+    """Load task lists on worker threads ahead of use; cancellable"""
+
+    def __init__(self, max_workers=2):
+        # Threads start, and concurrent.futures is imported, on first submit
+        self.max_workers = max_workers
+        self.executor = None
+        self.futures = {}
+        self.cancelled = threading.Event()
+
+    def submit(self, key, storage):
+        """Start loading a storage backend in the background"""
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                               thread_name_prefix="prefetch")
+        self.futures[key] = self.executor.submit(self.load, storage)
+
+    def load(self, storage):
+        """Worker: load one task list unless prefetching was cancelled"""
+        if self.cancelled.is_set():
+            return None
+        return storage, storage.load()
+
+    def pending(self):
+        """Whether any load has not been collected yet"""
+        return bool(self.futures)
+
+    def completed(self):
+        """Pop the (storage, tasks) results that finished loading"""
+        results = {}
+        for key, future in list(self.futures.items()):
+            if future.done():
+                del self.futures[key]
+                if not future.cancelled() and future.exception() is None and future.result():
+                    results[key] = future.result()
+        return results
+
+    def claim(self, key):
+        """Take one result now, waiting if it is mid-load; None if it never started"""
+        future = self.futures.pop(key, None)
+        if future is None or future.cancel():
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def discard(self, key):
+        """Forget one pending load; a running load finishes but is ignored"""
+        future = self.futures.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def cancel(self):
+        """Stop all prefetching"""
+        self.cancelled.set()
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+
+def status_of(task):
+    """Board status of a task; todos only know whether they are completed"""
+    if 'status' in task:
+        return task['status']
+    return 'done' if task.get('completed') else 'pending'
+
+
+def encode_task(task):
+    """Encode one task as compact JSON"""
+    return json.dumps(task, ensure_ascii=False, separators=(',', ':'), default=dict)
+
+
+def file_stamp(path):
+    """Size and modification time of a file, or None when it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def atomic_write(path, data, backup_path=None):
+    """Write bytes to a synced temp file, then atomically rename it into place"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Keep the previous version as a hard link; this costs no extra I/O
+    if backup_path is not None and os.path.exists(path):
+        try:
+            if os.path.exists(backup_path):
+                os.remove(backup_path)
+            os.link(path, backup_path)
+        except OSError:
+            pass
+
+    os.replace(temp_path, path)
+    sync_directory(path)
+
+
+def sync_directory(path):
+    """Make a rename durable where the platform allows syncing directories"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        # Windows cannot open directories; its renames are already journaled
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def encode_tasks(tasks, snapshot_format='compact', next_id=None):
+    """Serialize a task list and its id counter in one of the SNAPSHOT_FORMATS"""
+    if snapshot_format != 'compact':
+        # Only compact snapshots can take undecoded task text as is
+        tasks = [json.loads(task) if type(task) is RawTask else task for task in tasks]
+    return SNAPSHOT_FORMATS[snapshot_format](tasks, next_id)
+
+
+def decode_tasks(data):
+    """Deserialize (tasks, next_id); next_id is None in files that predate it"""
+    if data.startswith(BINARY_MAGIC):
+        return decode_binary(data)
+    snapshot = json.loads(data)
+    if isinstance(snapshot, list):
+        return snapshot, None
+    return snapshot['tasks'], snapshot['next_id']
+
+
+def encode_json(tasks, next_id, **options):
+    """Encode a JSON snapshot; bare lists are kept for files without a counter"""
+    snapshot = tasks if next_id is None else {'next_id': next_id, 'tasks': tasks}
+    return json.dumps(snapshot, ensure_ascii=False, default=dict, **options).encode('utf-8')
+
+
+# Binary value kinds; each column stores one kind byte per row
+KIND_MISSING, KIND_NONE, KIND_FALSE, KIND_TRUE, KIND_INT, KIND_FLOAT, KIND_STR, KIND_JSON = range(8)
+INT64_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+def encode_compact(tasks, next_id):
+    """Encode a compact JSON snapshot with one task per line, so it can be streamed"""
+    if next_id is None:
+        return encode_json(tasks, None, separators=(',', ':'))
+    lines = ",\n".join(task.decode('utf-8') if type(task) is RawTask else encode_task(task)
+                        for task in tasks)
+    return f'{{"next_id":{next_id},"tasks":[\n{lines}\n]}}\n'.encode('utf-8')
+
+
+def encode_binary(tasks, next_id=None):
+    """Encode tasks column by column, with strings stored once in a string table"""
+    strings = {}
+
+    def string_index(text):
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    keys = {}
+    for task in tasks:
+        for key in task:
+            if key not in keys:
+                keys[key] = len(keys)
+
+    columns = []
+    for key in keys:
+        kinds = bytearray()
+        ints, floats, texts, others = [], [], [], []
+        for task in tasks:
+            if key not in task:
+                kinds.append(KIND_MISSING)
+                continue
+            value = task[key]
+            if value is None:
+                kinds.append(KIND_NONE)
+            elif value is True:
+                kinds.append(KIND_TRUE)
+            elif value is False:
+                kinds.append(KIND_FALSE)
+            elif type(value) is int and value in INT64_RANGE:
+                kinds.append(KIND_INT)
+                ints.append(value)
+            elif type(value) is float:
+                kinds.append(KIND_FLOAT)
+                floats.append(value)
+            elif type(value) is str:
+                kinds.append(KIND_STR)
+                texts.append(string_index(value))
+            else:
+                kinds.append(KIND_JSON)
+                others.append(string_index(json.dumps(value, ensure_ascii=False)))
+        columns.append(struct.pack('<I', string_index(key)) + bytes(kinds)
+                       + struct.pack(f'<{len(ints)}q', *ints)
+                       + struct.pack(f'<{len(floats)}d', *floats)
+                       + struct.pack(f'<{len(texts)}I', *texts)
+                       + struct.pack(f'<{len(others)}I', *others))
+
+    parts = [BINARY_MAGIC, struct.pack('<II', len(tasks), len(strings))]
+    for text in strings:
+        encoded = text.encode('utf-8')
+        parts.append(struct.pack('<I', len(encoded)))
+        parts.append(encoded)
+    parts.append(struct.pack('<I', len(columns)))
+    parts.extend(columns)
+    if next_id is not None:
+        # Optional trailer; older snapshots end after the last column
+        parts.append(struct.pack('<q', next_id))
+    return b"".join(parts)
+
+
+def decode_binary(data):
+    """Decode a snapshot written by encode_binary"""
+    offset = len(BINARY_MAGIC)
+    count, string_count = struct.unpack_from('<II', data, offset)
+    offset += 8
+    strings = []
+    for _ in range(string_count):
+        (length,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        strings.append(data[offset:offset + length].decode('utf-8'))
+        offset += length
+
+    tasks = [{} for _ in range(count)]
+    (column_count,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    for _ in range(column_count):
+        (key_index,) = struct.unpack_from('<I', data, offset)
+        key = strings[key_index]
+        offset += 4
+        kinds = data[offset:offset + count]
+        offset += count
+
+        values = {}
+        for kind, code, size in ((KIND_INT, 'q', 8), (KIND_FLOAT, 'd', 8),
+                                 (KIND_STR, 'I', 4), (KIND_JSON, 'I', 4)):
+            n = kinds.count(kind)
+            values[kind] = struct.unpack_from(f'<{n}{code}', data, offset)
+            offset += n * size
+        values[KIND_STR] = [strings[i] for i in values[KIND_STR]]
+        values[KIND_JSON] = [json.loads(strings[i]) for i in values[KIND_JSON]]
+
+        for kind in set(kinds):
+            if kinds.count(kind) == count:
+                # Fast path: every row holds the same kind of value
+                if kind in values:
+                    for task, value in zip(tasks, values[kind]):
+                        task[key] = value
+                elif kind != KIND_MISSING:
+                    constant = {KIND_NONE: None, KIND_FALSE: False, KIND_TRUE: True}[kind]
+                    for task in tasks:
+                        task[key] = constant
+                break
+        else:
+            iterators = {kind: iter(column) for kind, column in values.items()}
+            for task, kind in zip(tasks, kinds):
+                if kind == KIND_MISSING:
+                    continue
+                if kind in iterators:
+                    task[key] = next(iterators[kind])
+                else:
+                    task[key] = {KIND_NONE: None, KIND_FALSE: False, KIND_TRUE: True}[kind]
+
+    next_id = None
+    if len(data) >= offset + 8:
+        (next_id,) = struct.unpack_from('<q', data, offset)
+    return tasks, next_id
+
+
+SNAPSHOT_FORMATS = {
+    # Human-readable, as written by earlier versions
+    'json': lambda tasks, next_id: encode_json(tasks, next_id, indent=2),
+    'compact': lambda tasks, next_id: encode_compact(tasks, next_id),
+    'binary': encode_binary,
+}
+
+
+def add_record(task):
+    """Journal record for a task appended to the end of the list"""
+    task = copy_task(task)
+    return {'op': 'add', 'task': json.loads(task) if type(task) is RawTask else task}
+
+
+def update_record(task_id, fields):
+    """Journal record for changed fields of the task with an id"""
+    return {'op': 'set', 'id': task_id, 'fields': fields}
+
+
+def delete_record(task_id):
+    """Journal record for the removal of the task with an id"""
+    return {'op': 'delete', 'id': task_id}
+
+
+def encode_record(record):
+    """Encode one journal record as a compact JSON line"""
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+
+def replay_records(tasks, records):
+    """Apply journal records to a task list and return the resulting list"""
+    by_id = {task['id']: task for task in tasks}
+    for record in records:
+        op = record.get('op')
+        try:
+            if op == 'add':
+                by_id[record['task']['id']] = record['task']
+            elif op == 'set':
+                by_id[record['id']].update(record['fields'])
+            elif op == 'delete':
+                del by_id[record['id']]
+        except (KeyError, TypeError):
+            # Skip records that no longer match the list
+            pass
+    return list(by_id.values())
+
+
+def parse_number(text):
+    """Value of a JSON number or null, keeping ints and floats apart like json.loads"""
+    if text == b"null":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def apply_changes(task, changes):
+    """Apply the queued journal records of one task; False if it was deleted"""
+    for record in changes.pop(task['id'], ()):
+        if record.get('op') == 'delete':
+            return False
+        if record.get('op') == 'set':
+            task.update(record['fields'])
+    return True
+
+
+def next_free_id(tasks):
+    """One past the highest integer id in a task list"""
+    # Undecoded tasks come from a snapshot whose counter is already past them
+    return max((task['id'] for task in tasks
+                if type(task) is not RawTask and type(task.get('id')) is int), default=0) + 1
+
+
+def repair_ids(tasks):
+    """Give tasks with a missing or repeated id a fresh one; True if any changed"""
+    top = next_free_id(tasks) - 1
+    seen = set()
+    changed = False
+    for task in tasks:
+        task_id = task.get('id')
+        if type(task_id) is not int or task_id in seen:
+            top += 1
+            task['id'] = task_id = top
+            changed = True
+        seen.add(task_id)
+    return changed
+
+
+def migrate_timestamps(tasks):
+    """Convert time strings written by older versions to epoch seconds; True if any changed"""
+    changed = False
+    for task in tasks:
+        for field in TIMESTAMP_FIELDS:
+            value = task.get(field)
+            if isinstance(value, str):
+                try:
+                    task[field] = datetime.strptime(value, DISPLAY_FORMAT).timestamp()
+                except ValueError:
+                    # Hand-edited or foreign text; there is no time to keep
+                    task[field] = None
+                changed = True
+    return changed
+
+
+def format_timestamp(value):
+    """Display text for an epoch timestamp"""
+    if value is None:
+        return ""
+    # The display format stops at minutes, so cache one string per minute
+    return format_minute(int(value // 60))
+
+
+@lru_cache(maxsize=1024)
+def format_minute(minute):
+    """Display text for a minute since the epoch"""
+    return datetime.fromtimestamp(minute * 60).strftime(DISPLAY_FORMAT)
@@ -0,0 +1,229 @@
+"""
+Task Store - In-memory task collection shared by both apps
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Keeps the loaded tasks indexed by id together with one sorted index per
+status, so looking up, moving and deleting a task never scans the whole
+list, and statistics are read straight from the size of each index.
+"""
+
+from bisect import bisect_left, insort
+
+from task_model import Task
+from task_storage import status_of as default_status_of
+
+
+class TaskStore:
+    """Tasks indexed by id, with per-status indexes kept in sorted order"""
+
+    def __init__(self, tasks=(), status_of=default_status_of, verify=False, next_id=1,
+                 sort_key=None):
+        self.status_of = status_of
+        # Order within a status; without one, tasks keep their board order
+        self.sort_key = sort_key
+        # Cross-check the indexes against a full scan after every change
+        self.verify = verify
+        # Highest id handed out so far, starting from the stored counter
+        self.max_id = next_id - 1
+        self.clear()
+        self.extend(tasks)
+
+    def clear(self):
+        """Drop all tasks; ids handed out so far stay used"""
+        # Board order is the insertion order of the id map. Every task also
+        # gets a sequence number, and each status index is a sorted list of
+        # (sort key, sequence number) entries
+        self.by_id = {}
+        self.by_seq = {}
+        self.entry_of = {}
+        self.columns = {}
+        self.next_seq = 0
+
+    def extend(self, tasks):
+        """Append loaded tasks, sorting each status index once"""
+        # Loaded tasks arrive as dicts and are kept as compact Task records
+        touched = set()
+        for task in tasks:
+            task = task if isinstance(task, Task) else Task(task)
+            self.insert(task, bulk=True)
+            touched.add(self.status_of(task))
+        if self.sort_key is not None:
+            for status in touched:
+                self.columns[status].sort()
+        self.check()
+
+    def advance_next_id(self, next_id):
+        """Never hand out ids below a stored counter"""
+        self.max_id = max(self.max_id, next_id - 1)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def get(self, task_id):
+        """Return the task with an id, or None"""
+        return self.by_id.get(task_id)
+
+    def next_id(self):
+        """Id for a new task; ids of deleted tasks are never reused"""
+        return self.max_id + 1
+
+    def count(self, status):
+        """Number of tasks with a status"""
+        return len(self.columns.get(status, ()))
+
+    def column(self, status):
+        """Tasks with a status, in order"""
+        by_seq = self.by_seq
+        return [by_seq[seq] for _, seq in self.columns.get(status, ())]
+
+    def select(self, status, task_ids):
+        """Tasks with a status whose id is in a set, in order"""
+        index = self.columns.get(status, ())
+        by_seq = self.by_seq
+        if len(task_ids) * 4 < len(index):
+            # Few matches: order just those by their index entries
+            entries = []
+            for task_id in task_ids:
+                task = self.by_id.get(task_id)
+                if task is not None and self.status_of(task) == status:
+                    entries.append(self.entry_of[task_id])
+            entries.sort()
+            return [by_seq[seq] for _, seq in entries]
+        return [task for _, seq in index if (task := by_seq[seq])['id'] in task_ids]
+
+    def position(self, task):
+        """Index of a task within its status, in order"""
+        return bisect_left(self.columns[self.status_of(task)], self.entry_of[task['id']])
+
+    def view(self, statuses):
+        """Sequence of the tasks of several statuses, one status after another"""
+        return StatusView(self, statuses)
+
+    def entry(self, task, seq):
+        """Status index entry of a task"""
+        return (0 if self.sort_key is None else self.sort_key(task), seq)
+
+    def insert(self, task, bulk=False):
+        """Index a task at the end of the board"""
+        task_id = task['id']
+        if task_id in self.by_id:
+            raise ValueError(f"duplicate task id {task_id}")
+        seq = self.next_seq
+        self.next_seq += 1
+        self.by_id[task_id] = task
+        self.by_seq[seq] = task
+        entry = self.entry_of[task_id] = self.entry(task, seq)
+        index = self.columns.setdefault(self.status_of(task), [])
+        if self.sort_key is None or bulk:
+            # Sequence numbers only grow, so appending keeps board order;
+            # a bulk load sorts each index once at the end instead
+            index.append(entry)
+        else:
+            insort(index, entry)
+        if isinstance(task_id, int) and task_id > self.max_id:
+            self.max_id = task_id
+
+    def add(self, task):
+        """Append a task"""
+        self.insert(task)
+        self.check()
+
+    def update(self, task, **fields):
+        """Change fields of a task, relocating only that task in the indexes"""
+        old_status = self.status_of(task)
+        task.update(fields)
+        new_status = self.status_of(task)
+        old_entry = self.entry_of[task['id']]
+        new_entry = self.entry(task, old_entry[1])
+        if new_status != old_status or new_entry != old_entry:
+            self.unindex(old_status, old_entry)
+            insort(self.columns.setdefault(new_status, []), new_entry)
+            self.entry_of[task['id']] = new_entry
+        self.check()
+
+    def remove(self, task):
+        """Remove a task"""
+        task_id = task['id']
+        entry = self.entry_of.pop(task_id)
+        del self.by_id[task_id]
+        del self.by_seq[entry[1]]
+        self.unindex(self.status_of(task), entry)
+        self.check()
+
+    def unindex(self, status, entry):
+        """Drop an entry from a status index"""
+        index = self.columns[status]
+        del index[bisect_left(index, entry)]
+
+    def verify_counts(self):
+        """Whether the status indexes match a full scan"""
+        expected = {}
+        for task in self.by_id.values():
+            seq = self.entry_of[task['id']][1]
+            if self.by_seq.get(seq) is not task:
+                return False
+            expected.setdefault(self.status_of(task), []).append(self.entry(task, seq))
+        for status, index in self.columns.items():
+            if index != sorted(expected.pop(status, [])):
+                return False
+        return not expected
+
+    def check(self):
+        """In verification mode, fail loudly when the indexes drift"""
+        if self.verify and not self.verify_counts():
+            raise AssertionError("status indexes out of sync with the task list")
+
+
+class StatusView:
+    """Read-only sequence over the indexes of several statuses, without copying"""
+
+    def __init__(self, store, statuses):
+        self.by_seq = store.by_seq
+        self.indexes = [store.columns.setdefault(status, []) for status in statuses]
+
+    def __len__(self):
+        return sum(len(index) for index in self.indexes)
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += len(self)
+        if position >= 0:
+            for index in self.indexes:
+                if position < len(index):
+                    return self.by_seq[index[position][1]]
+                position -= len(index)
+        raise IndexError("task view index out of range")
+
+    def __iter__(self):
+        by_seq = self.by_seq
+        for index in self.indexes:
+            for _, seq in index:
+                yield by_seq[seq]
+
+
+class ChainedView:
+    """Read-only sequence over several task sequences, one after another"""
+
+    def __init__(self, views):
+        self.views = views
+
+    def __len__(self):
+        return sum(len(view) for view in self.views)
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += len(self)
+        if position >= 0:
+            for view in self.views:
+                if position < len(view):
+                    return view[position]
+                position -= len(view)
+        raise IndexError("task view index out of range")
+
+    def __iter__(self):
+        for view in self.views:
+            yield from view
@@ -0,0 +1,10 @@
+"""
+Test setup - Makes the app modules importable from the tests
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,77 @@
+"""
+Board Cache Tests - Reading back the board painted on warm starts
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Each test writes a cache the way the Project Task Manager does on exit,
+then reads it as the next launch would, with the workspace key and the
+stamp of the task files as they are by then.
+"""
+
+import pytest
+
+from board_cache import BoardCache, read_board_cache, write_board_cache
+from task_storage import JournalStorage
+
+KEY = "Work\ttasks.json\tWork"
+
+
+def make_cache(stamp):
+    """A cache of a small board with every column, one of them empty"""
+    columns = {'pending': (3, [(1, "Write notes"), (4, "Ünïcode ✅")]),
+               'in_progress': (1, [(2, "Review")]),
+               'done': (0, [])}
+    return BoardCache(KEY, stamp, columns, "📊 4 total tasks")
+
+
+def test_round_trip(tmp_path):
+    """A cache reads back with its columns, stats and stamp"""
+    path = str(tmp_path / "board_cache.bin")
+    stamp = [[120, 1_700_000_000_000_000_000], None]
+    write_board_cache(path, make_cache(stamp))
+
+    cache = read_board_cache(path, KEY, stamp)
+    assert cache is not None
+    assert cache.columns == make_cache(stamp).columns
+    assert cache.stats_text == "📊 4 total tasks"
+    assert cache.stamp == stamp
+
+
+def test_stale_stamp_or_other_workspace(tmp_path):
+    """A change to the task files, or another workspace, makes the cache unusable"""
+    path = str(tmp_path / "board_cache.bin")
+    storage = JournalStorage(str(tmp_path / "tasks.json"))
+    storage.save_snapshot([{'id': 1, 'title': "Write notes", 'status': 'pending'}])
+    write_board_cache(path, make_cache(storage.disk_stamp()))
+    assert read_board_cache(path, KEY, storage.disk_stamp()) is not None
+    assert read_board_cache(path, "Home\ttasks.json\tHome", storage.disk_stamp()) is None
+
+    storage.append({'op': 'delete', 'id': 1})
+    assert read_board_cache(path, KEY, storage.disk_stamp()) is None
+
+
+def test_missing_file(tmp_path):
+    """No cache yet means a normal load"""
+    assert read_board_cache(str(tmp_path / "board_cache.bin"), KEY, [None]) is None
+
+
+@pytest.mark.parametrize('damage', [
+    lambda data: b"",
+    lambda data: b"XXXX" + data[4:],
+    lambda data: data[:len(data) // 2],
+    lambda data: data[:-3],
+])
+def test_corrupt_file(tmp_path, damage):
+    """A damaged or truncated cache is ignored instead of raising"""
+    path = tmp_path / "board_cache.bin"
+    stamp = [[120, 1_700_000_000_000_000_000]]
+    write_board_cache(str(path), make_cache(stamp))
+    path.write_bytes(damage(path.read_bytes()))
+    assert read_board_cache(str(path), KEY, stamp) is None
+
+
+def test_ids_the_format_cannot_hold(tmp_path):
+    """Writing refuses ids that are not integers"""
+    cache = BoardCache(KEY, [None], {'pending': (1, [("a1", "Legacy")])}, "")
+    with pytest.raises(ValueError):
+        write_board_cache(str(tmp_path / "board_cache.bin"), cache)
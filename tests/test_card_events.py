@@ -0,0 +1,117 @@
+"""
+Card Events Tests - Dispatch of card events through one bind tag per column
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+A stand-in root records what CardEvents binds and registers, and
+stand-in widgets carry only a Tk path and bind tags, so the dispatch
+runs as it does on screen without a display.
+"""
+
+from types import SimpleNamespace
+
+from card_events import CardEvents
+
+
+class StandInRoot:
+    """Records class bindings and registered commands"""
+
+    def __init__(self):
+        self.bindings = {}
+        self.commands = {}
+
+    def bind_class(self, tag, sequence, handler):
+        self.bindings[(tag, sequence)] = handler
+
+    def register(self, function):
+        name = f"cmd{len(self.commands)}"
+        self.commands[name] = function
+        return name
+
+    def fire(self, tag, sequence, widget):
+        """Deliver an event to the handler bound for a tag, as Tk would"""
+        return self.bindings[(tag, sequence)](SimpleNamespace(widget=widget))
+
+    def run(self, command):
+        """Run a button's command text, as Tk would"""
+        name, *args = command.split()
+        return self.commands[name](*args)
+
+
+class StandInWidget:
+    """A widget path with bind tags"""
+
+    def __init__(self, path):
+        self.path = path
+        self.tags = (path, "Label", ".", "all")
+
+    def bindtags(self, tags=None):
+        if tags is None:
+            return self.tags
+        self.tags = tags
+
+    def __str__(self):
+        return self.path
+
+
+def add_card(events, container, card):
+    """Register a card whose title label sits inside its container"""
+    widgets = [StandInWidget(container), StandInWidget(container + ".title")]
+    events.add(container, widgets, card)
+    return widgets
+
+
+def test_events_reach_the_card_under_the_pointer():
+    """One binding per column finds the card from any of its widgets"""
+    root = StandInRoot()
+    events = CardEvents(root, "pending_cards")
+    first = add_card(events, ".col.c1", {'id': 1})
+    second = add_card(events, ".col.c2", {'id': 2})
+    assert all(widget.bindtags()[0] == "pending_cards" for widget in first + second)
+
+    clicked = []
+    events.bind("<Button-1>", lambda card, event: clicked.append(card['id']))
+    root.fire("pending_cards", "<Button-1>", first[1])
+    root.fire("pending_cards", "<Button-1>", second[0])
+    # A widget of no card, e.g. the column's own frame, is ignored
+    root.fire("pending_cards", "<Button-1>", StandInWidget(".col"))
+    assert clicked == [1, 2]
+
+
+def test_destroyed_cards_are_forgotten():
+    """Destroying any widget of a card drops its record, so later events skip it"""
+    root = StandInRoot()
+    events = CardEvents(root, "done_cards")
+    widgets = add_card(events, ".col.c1", {'id': 1})
+    add_card(events, ".col.c2", {'id': 2})
+
+    root.fire("done_cards", "<Destroy>", widgets[1])
+    root.fire("done_cards", "<Destroy>", widgets[0])
+    assert list(events.cards) == [".col.c2"]
+    clicked = []
+    events.bind("<Double-Button-1>", lambda card, event: clicked.append(card['id']))
+    root.fire("done_cards", "<Double-Button-1>", widgets[1])
+    assert clicked == []
+
+
+def test_button_commands_run_the_action_for_their_card():
+    """Buttons share one registered command that names the action and card"""
+    root = StandInRoot()
+    events = CardEvents(root, "pending_cards")
+    add_card(events, ".col.c1", {'id': 1})
+    add_card(events, ".col.c2", {'id': 2})
+    done = []
+    events.on_command("advance", lambda card: done.append(('advance', card['id'])))
+    events.on_command("delete", lambda card: done.append(('delete', card['id'])))
+
+    advance = events.command("advance", ".col.c2")
+    delete = events.command("delete", ".col.c1")
+    assert len(root.commands) == 1
+    root.run(advance)
+    root.run(delete)
+    assert done == [('advance', 2), ('delete', 1)]
+
+    # A button of a card destroyed since does nothing
+    root.fire("pending_cards", "<Destroy>", StandInWidget(".col.c2"))
+    root.run(advance)
+    assert done == [('advance', 2), ('delete', 1)]
@@ -0,0 +1,86 @@
+"""
+Task Search Tests - Word and trigram lookups of the search index
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Each test indexes a small task list, changes it the way the engine does,
+and compares the matches with what a scan of the titles would find.
+"""
+
+from task_engine import TaskEngine, HeadlessLoop
+from task_search import SearchIndex
+from task_storage import JournalStorage
+
+
+def make_tasks():
+    """Tasks whose titles share words and word fragments"""
+    return [{'id': 1, 'title': "Write release notes"},
+            {'id': 2, 'title': "Review notebook"},
+            {'id': 3, 'title': "Release the Kraken"},
+            {'id': 4, 'title': "Rewrite notes"}]
+
+
+def test_search_finds_words_and_fragments():
+    """Terms match inside words, case-folded, and every term must match"""
+    tasks = {task['id']: task for task in make_tasks()}
+    index = SearchIndex('title', tasks.values(), tasks.get)
+    assert index.search("notes") == {1, 4}
+    assert index.search("NOTE") == {1, 2, 4}
+    assert index.search("rite") == {1, 4}
+    assert index.search("release notes") == {1}
+    assert index.search("kraken notes") == set()
+    assert index.search("zebra") == set()
+    # Terms too short for a trigram scan the vocabulary, or the candidates
+    assert index.search("re") == {1, 2, 3, 4}
+    assert index.search("notes re") == {1, 4}
+
+
+def test_add_remove_and_update_keep_the_index_current():
+    """Removing a task before its title changes, then adding it back, moves its words"""
+    tasks = {task['id']: task for task in make_tasks()}
+    index = SearchIndex('title', tasks.values(), tasks.get)
+
+    index.add({'id': 5, 'title': "Notes on trigrams"})
+    assert index.search("trigram") == {5}
+    assert index.search("notes") == {1, 4, 5}
+
+    index.remove(tasks[3])
+    assert index.search("kraken") == set()
+    # The only task using the word is gone, and so are its trigrams
+    assert "kraken" not in index.postings
+    assert not any("kraken" in words for words in index.grams.values())
+
+    index.remove(tasks[2])
+    tasks[2]['title'] = "Review kraken"
+    index.add(tasks[2])
+    assert index.search("notebook") == set()
+    assert index.search("kraken") == {2}
+    assert index.search("review") == {2}
+
+    # A word shared by several tasks stays until the last one is removed
+    index.remove(tasks[1])
+    assert index.search("notes") == {4, 5}
+
+
+def test_engine_indexes_in_idle_slices(tmp_path):
+    """The index is built between events after loading, and a search before that finishes it"""
+    root = HeadlessLoop()
+    engine = TaskEngine(JournalStorage(str(tmp_path / "tasks.json")), root)
+    engine.load()
+    for number in range(2000):
+        engine.create(title=f"task {number}")
+    engine.close()
+
+    engine = TaskEngine(JournalStorage(str(tmp_path / "tasks.json")), root)
+    engine.load()
+    assert engine.unindexed is not None
+    engine.remove(engine.get(7))
+    engine.update(engine.get(8), title="renamed")
+    root.run_until_idle()
+    assert engine.unindexed is None
+    assert engine.search("task") == set(range(1, 2001)) - {7, 8}
+    assert engine.search("renamed") == {8}
+
+    engine.load()
+    assert engine.search("1999") == {2000}
+    assert engine.unindexed is None
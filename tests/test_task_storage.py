@@ -0,0 +1,357 @@
+"""
+Task Storage Tests - Round trips of the task file formats
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Each test writes task lists through the engine or a storage backend, then
+reads them back in a fresh session, as the apps do on their next launch.
+"""
+
+import mmap
+import os
+import threading
+
+import pytest
+
+from task_engine import TaskEngine, move_tasks
+from task_model import LazyTask, Task
+from task_storage import JournalStorage, SqliteStorage, add_record, delete_record, update_record
+
+
+def fill(engine, count=30):
+    """Give an engine tasks in every column, then change and delete some"""
+    statuses = ('todo', 'doing', 'done')
+    for number in range(count):
+        engine.create(title=f"task {number}", status=statuses[number % 3],
+                      created=1_700_000_000 + number)
+    engine.update(engine.get(2), title="renamed", status='done')
+    engine.remove(engine.get(5))
+
+
+def contents(engine):
+    """Comparable copy of an engine's tasks in board order"""
+    return [dict(task.items()) for task in engine]
+
+
+def test_archive_keeps_tasks_from_earlier_sessions(tmp_path):
+    """Tasks archived in one session survive archiving in the next"""
+    board_path = str(tmp_path / "board.json")
+    archive_path = str(tmp_path / "board.archive.json")
+
+    for title in ("first", "second"):
+        board = TaskEngine(JournalStorage(board_path))
+        board.load()
+        # As in the app, the archive is only written to, never loaded
+        archive = TaskEngine(JournalStorage(archive_path))
+        task = board.create(title=title, status='done')
+        move_tasks([task], board, archive)
+        board.close()
+        archive.close()
+
+    archive = TaskEngine(JournalStorage(archive_path))
+    archive.load()
+    assert [task['title'] for task in archive] == ["first", "second"]
+    # The board never hands out the id of a task it archived
+    assert [task['id'] for task in archive] == [1, 2]
+    board = TaskEngine(JournalStorage(board_path))
+    board.load()
+    assert len(board) == 0
+
+
+def test_sqlite_load_skips_rows_added_while_streaming(tmp_path):
+    """Tasks created and saved mid-load are not loaded a second time"""
+    path = str(tmp_path / "tasks.db")
+    engine = TaskEngine(SqliteStorage(path))
+    engine.load()
+    for number in range(250):
+        engine.create(title=f"task {number}", status='todo')
+    engine.close()
+
+    engine = TaskEngine(SqliteStorage(path))
+    engine.start_loading()
+    engine.loader.step()
+    engine.create(title="added while loading", status='todo')
+    engine.flush()
+    engine.finish_loading()
+    assert engine.loaded
+    assert not engine.saver.partial
+    assert len(engine) == 251
+
+
+def test_damaged_snapshot_without_backup_is_set_aside(tmp_path):
+    """An unreadable task file with no backup is renamed, not overwritten"""
+    path = tmp_path / "tasks.json"
+    path.write_bytes(b'{"next_id": 3, "tasks": [{"id": 1,')
+    storage = JournalStorage(str(path))
+    assert storage.load() == []
+    assert storage.damaged and not storage.recovered
+    assert not path.exists()
+    assert (tmp_path / "tasks.json.damaged").read_bytes().startswith(b'{"next_id": 3')
+
+
+def test_close_leaves_an_unchanged_task_file_alone(tmp_path):
+    """Closing only rewrites the snapshot when there are changes to fold in"""
+    path = tmp_path / "tasks.json"
+    engine = TaskEngine(JournalStorage(str(path)))
+    engine.load()
+    engine.create(title="first", status='todo')
+    engine.close()
+    assert not (tmp_path / "tasks.json.journal").exists()
+    # Snapshots are renamed into place, so a rewrite changes the inode
+    inode = path.stat().st_ino
+
+    engine = TaskEngine(JournalStorage(str(path)))
+    engine.load()
+    engine.close()
+    assert path.stat().st_ino == inode
+
+
+def test_sqlite_close_writes_only_the_changes(tmp_path):
+    """Closing an SQLite task list never rewrites its rows"""
+    path = str(tmp_path / "tasks.db")
+    engine = TaskEngine(SqliteStorage(path))
+    engine.load()
+    for number in range(20):
+        engine.create(title=f"task {number}", status='todo')
+    engine.flush()
+
+    connection = engine.storage.connection
+    changes = connection.total_changes
+    engine.update(engine.get(1), title="renamed")
+    engine.close()
+    assert connection.total_changes - changes <= 2
+
+
+def test_journal_round_trip(tmp_path):
+    """Changes saved only to the journal are replayed on the next load"""
+    path = str(tmp_path / "tasks.json")
+    engine = TaskEngine(JournalStorage(path))
+    engine.load()
+    fill(engine)
+    # Flushed records, no snapshot, as after a crash
+    engine.flush()
+    assert engine.storage.pending > 0
+
+    reloaded = TaskEngine(JournalStorage(path))
+    reloaded.load()
+    assert contents(reloaded) == contents(engine)
+    assert reloaded.tasks.next_id() == engine.tasks.next_id()
+
+
+@pytest.mark.parametrize('snapshot_format', ['json', 'compact', 'binary'])
+def test_snapshot_round_trip(tmp_path, snapshot_format):
+    """Every snapshot format reads back the tasks it was written from"""
+    path = str(tmp_path / "tasks.json")
+    engine = TaskEngine(JournalStorage(path, snapshot_format=snapshot_format))
+    engine.load()
+    fill(engine)
+    engine.flush(snapshot=True)
+
+    reloaded = TaskEngine(JournalStorage(path))
+    reloaded.load()
+    assert contents(reloaded) == contents(engine)
+
+
+def test_mapped_round_trip(tmp_path):
+    """A mapped snapshot streams LazyTasks that decode to the saved tasks"""
+    path = str(tmp_path / "tasks.json")
+    engine = TaskEngine(JournalStorage(path))
+    engine.load()
+    fill(engine)
+    engine.close()
+
+    mapped = TaskEngine(JournalStorage(path, map_threshold=0))
+    mapped.start_loading()
+    mapped.finish_loading()
+    assert mapped.loaded
+    assert all(type(task) is LazyTask for task in mapped)
+    # Counts come from the indexed fields, without decoding anything
+    assert [mapped.count(status) for status in ('todo', 'doing', 'done')] == \
+        [engine.count(status) for status in ('todo', 'doing', 'done')]
+    assert contents(mapped) == contents(engine)
+
+    # A change decodes the task; the next snapshot releases the mapping first
+    mapped.update(mapped.get(1), title="changed")
+    mapped.close()
+    reloaded = TaskEngine(JournalStorage(path))
+    reloaded.load()
+    assert reloaded.get(1)['title'] == "changed"
+    assert len(reloaded) == len(engine)
+
+
+def test_compaction_maps_the_new_snapshot(tmp_path):
+    """Undecoded tasks read from the snapshot that replaced theirs, not from a copy of it"""
+    path = str(tmp_path / "tasks.json")
+    engine = TaskEngine(JournalStorage(path))
+    engine.load()
+    fill(engine)
+    engine.close()
+    expected = contents(engine)
+
+    mapped = TaskEngine(JournalStorage(path, map_threshold=0))
+    mapped.start_loading()
+    mapped.finish_loading()
+    mapped.update(mapped.get(1), title="changed")
+    mapped.flush(snapshot=True)
+    mapping = mapped.storage.mapping
+    assert mapping.held is None
+    assert isinstance(mapping.data, mmap.mmap)
+    assert all(task.source is mapping for task in mapped if task['id'] != 1)
+    expected[0]['title'] = "changed"
+    assert contents(mapped) == expected
+    mapped.close()
+
+
+def test_sqlite_round_trip(tmp_path):
+    """Rows written record by record load back in board order"""
+    path = str(tmp_path / "tasks.db")
+    engine = TaskEngine(SqliteStorage(path))
+    engine.load()
+    fill(engine)
+    engine.close()
+
+    reloaded = TaskEngine(SqliteStorage(path))
+    reloaded.start_loading()
+    reloaded.finish_loading()
+    assert contents(reloaded) == contents(engine)
+    assert reloaded.tasks.next_id() == engine.tasks.next_id()
+
+
+def test_sqlite_column_counts_and_pages(tmp_path):
+    """Per-column counts and pages match the loaded board"""
+    path = str(tmp_path / "tasks.db")
+    engine = TaskEngine(SqliteStorage(path))
+    engine.load()
+    fill(engine)
+    engine.close()
+
+    storage = SqliteStorage(path)
+    statuses = ('todo', 'doing', 'done')
+    columns = storage.peek_columns(statuses, 2)
+    for status in statuses:
+        view = engine.view((status,))
+        count, first = columns[status]
+        assert count == len(view)
+        assert [task['id'] for task in first] == [task['id'] for task in list(view)[:2]]
+        assert ([task['id'] for task in storage.page(status, 1, 2)]
+                == [task['id'] for task in list(view)[1:3]])
+    storage.close()
+    assert JournalStorage(str(tmp_path / "tasks.json")).peek_columns(statuses, 2) is None
+
+
+def test_sqlite_reads_never_see_half_a_write(tmp_path):
+    """Reads on one thread see a snapshot written on another either whole or not at all"""
+    storage = SqliteStorage(str(tmp_path / "tasks.db"))
+    tasks = [{'id': number, 'title': f"task {number}", 'status': 'todo'}
+             for number in range(1, 5001)]
+    storage.save_snapshot(tasks)
+
+    def write():
+        for _ in range(5):
+            storage.save_snapshot(tasks)
+    writer = threading.Thread(target=write)
+    writer.start()
+    totals = set()
+    while writer.is_alive():
+        totals.add(sum(storage.count_by_status().values()))
+    writer.join()
+    assert totals <= {len(tasks)}
+    storage.close()
+
+
+def test_legacy_file_with_repeated_ids_keeps_every_task(tmp_path):
+    """A bare-list file from before unique ids loads, and migrates, without losing tasks"""
+    path = tmp_path / "todos.json"
+    path.write_text('[{"id": 1, "title": "a"}, {"id": 1, "title": "b"}, {"id": 2, "title": "c"}]')
+    tasks = JournalStorage(str(path)).load()
+    assert [task['title'] for task in tasks] == ["a", "b", "c"]
+    assert len({task['id'] for task in tasks}) == 3
+
+    # The migration snapshot holds all three, with a counter past them
+    reloaded = JournalStorage(str(path))
+    assert [task['title'] for task in reloaded.load()] == ["a", "b", "c"]
+    assert reloaded.next_id == 4
+
+
+def streamed(storage):
+    """Tasks as the chunked loader delivers them, dropping chunks before a reset"""
+    tasks = []
+    for chunk in storage.load_chunks(chunk_size=2, first_chunk=1):
+        if chunk is None:
+            tasks = []
+        else:
+            tasks.extend(chunk)
+    return [dict(task.items()) for task in tasks]
+
+
+@pytest.mark.parametrize('records', [
+    # Reopened from the archive, then edited
+    [delete_record(2), add_record({'id': 2, 'status': 'done', 'modified': 1}),
+     update_record(2, {'status': 'pending', 'modified': 99})],
+    # A move that crashed before the source dropped its copy
+    [add_record({'id': 2, 'status': 'pending', 'modified': 5}),
+     update_record(2, {'modified': 6})],
+    # Added twice
+    [add_record({'id': 7, 'status': 'pending'}), add_record({'id': 7, 'status': 'done'})],
+])
+def test_streaming_matches_load(tmp_path, records):
+    """Streaming a snapshot and journal gives the tasks load() gives"""
+    path = str(tmp_path / "tasks.json")
+    storage = JournalStorage(path)
+    storage.save_snapshot([{'id': number, 'status': 'done', 'modified': 1}
+                           for number in range(1, 5)])
+    storage.append_many(records)
+
+    expected = [dict(task.items()) for task in JournalStorage(path).load()]
+    assert streamed(JournalStorage(path)) == expected
+    assert streamed(JournalStorage(path, map_threshold=0)) == expected
+
+
+def test_reopening_a_task_the_board_still_holds(tmp_path):
+    """Moving back a task whose id is already on the board keeps the board's copy"""
+    board = TaskEngine(JournalStorage(str(tmp_path / "board.json")))
+    board.load()
+    archive = TaskEngine(JournalStorage(str(tmp_path / "board.archive.json")))
+    archive.load()
+    task = board.create(title="twice", status='done')
+    # As left by a move that crashed before the board dropped its copy
+    archive.add(Task(dict(task.items())))
+
+    moved = move_tasks([archive.get(task['id'])], archive, board)
+    assert len(moved) == 1 and moved[0] is task
+    assert [task['title'] for task in board] == ["twice"]
+    assert len(archive) == 0
+    board.close()
+    archive.close()
+
+    archive = TaskEngine(JournalStorage(str(tmp_path / "board.archive.json")))
+    archive.load()
+    assert len(archive) == 0
+
+
+def test_archive_journal_is_folded_without_loading(tmp_path):
+    """A write-only archive compacts on disk instead of journaling forever"""
+    board_path = str(tmp_path / "board.json")
+    archive_path = str(tmp_path / "board.archive.json")
+
+    for session in range(3):
+        board = TaskEngine(JournalStorage(board_path))
+        board.load()
+        archive = TaskEngine(JournalStorage(archive_path, compact_after=20))
+        archive.saver.delay = 0
+        tasks = [board.create(title=f"{session}.{number}", status='done')
+                 for number in range(30)]
+        move_tasks(tasks, board, archive)
+        # The fold runs on the saver's worker thread
+        archive.root.run_until_idle()
+        board.close()
+        archive.close()
+        assert not archive.loaded
+
+    assert os.path.exists(archive_path)
+    assert not os.path.exists(archive_path + ".journal")
+    archive = TaskEngine(JournalStorage(archive_path))
+    archive.start_loading()
+    archive.finish_loading()
+    assert [task['title'] for task in archive] == [f"{session}.{number}" for session in range(3)
+                                                   for number in range(30)]
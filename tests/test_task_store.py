@@ -0,0 +1,62 @@
+"""
+Task Store Tests - Index bookkeeping of the in-memory task collection
+Copyright (c) 2025 Gwen Balajediong
+All rights reserved.
+
+Every store here runs with verify=True, so each mutation cross-checks the
+status indexes against a full scan and raises when they drift.
+"""
+
+import pytest
+
+from task_engine import creation_order
+from task_store import TaskStore
+
+
+def make_tasks():
+    """A small board with tasks in every column"""
+    return [{'id': 1, 'title': "a", 'status': 'todo', 'created': 30},
+            {'id': 2, 'title': "b", 'status': 'doing', 'created': 10},
+            {'id': 3, 'title': "c", 'status': 'todo', 'created': 20},
+            {'id': 4, 'title': "d", 'status': 'done', 'created': 40}]
+
+
+@pytest.mark.parametrize('sort_key', [None, creation_order])
+def test_mutations_keep_the_indexes_in_sync(sort_key):
+    """Adding, updating and removing tasks keeps every status index exact"""
+    store = TaskStore(make_tasks(), verify=True, sort_key=sort_key)
+    assert store.verify_counts()
+
+    store.add({'id': 5, 'title': "e", 'status': 'todo', 'created': 5})
+    store.update(store.get(1), status='done')
+    store.update(store.get(4), created=1)
+    store.remove(store.get(2))
+    store.extend([{'id': 7, 'title': "g", 'status': 'doing', 'created': 0}])
+
+    assert store.verify_counts()
+    assert [store.count(status) for status in ('todo', 'doing', 'done')] == [2, 1, 2]
+    todo = [task['id'] for task in store.column('todo')]
+    done = [task['id'] for task in store.column('done')]
+    if sort_key is None:
+        # Board order is insertion order, whatever changed since
+        assert (todo, done) == ([3, 5], [1, 4])
+    else:
+        assert (todo, done) == ([5, 3], [4, 1])
+
+def test_verify_detects_drift():
+    """A status change made behind the store's back fails the next check"""
+    store = TaskStore(make_tasks(), verify=True)
+    store.get(1)['status'] = 'done'
+    assert not store.verify_counts()
+    with pytest.raises(AssertionError):
+        store.add({'id': 5, 'title': "e", 'status': 'todo'})
+
+
+def test_ids_are_never_reused():
+    """Removing the newest task does not free its id"""
+    store = TaskStore(make_tasks(), verify=True, next_id=3)
+    assert store.next_id() == 5
+    store.remove(store.get(4))
+    assert store.next_id() == 5
+    with pytest.raises(ValueError):
+        store.add({'id': 1, 'title': "again", 'status': 'todo'})
@@ -7,15 +7,31 @@ A modern todo list application with beautiful card-based interface.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-import json
+from tkinter import ttk, messagebox
 import os
-import subprocess
 import sys
-from datetime import datetime
+import time
+
+from task_storage import open_storage, format_timestamp
+from task_engine import TaskEngine, creation_order
+from task_search import words_of
+from startup_profile import StartupProfile, startup_profile
+from card_events import CardEvents
 
 class TodoApp:
-    def __init__(self, root):
+    # Lists with more cards than this only materialize the visible rows
+    VIRTUAL_THRESHOLD = 100
+    VIRTUAL_ROW_HEIGHT = 150
+    VIRTUAL_OVERSCAN = 2
+    
+    # Snapshot encoding of todos.json: 'compact' JSON, indented 'json' or 'binary'
+    SNAPSHOT_FORMAT = 'compact'
+    
+    # Searches made only of one- or two-letter terms match much of a long
+    # list, so they wait this many milliseconds for typing to pause
+    SEARCH_DELAY = 200
+    
+    def __init__(self, root, profile=None):
         self.root = root
         self.root.title("✨ Todo List Manager - by Gwen Balajediong")
         self.root.geometry("800x700")
@@ -23,79 +39,87 @@ class TodoApp:
         self.root.resizable(True, True)
         self.root.minsize(700, 600)  # Adjusted for single column layout
         
-        # Set window icon for taskbar
-        self.set_window_icon()
+        # Startup phase timings, printed with --profile-startup
+        self.profile = profile if profile is not None else StartupProfile()
+        
+        # Resolved on first use, so startup probes the disk once for each
+        self.documents_path = None
+        self.icon_path = None
         
         # Center the main window on screen
         self.center_window(800, 700)
         
         # Configure style
         self.setup_styles()
+        self.profile.mark("window")
         
-        # File to store todos in Documents/GwenProject/
+        # File to store todos in Documents/GwenProject/, plus its change journal;
+        # a todos.db database there is used instead when it exists
         self.data_file = os.path.join(self.get_documents_path(), "todos.json")
+        database_file = os.path.join(self.get_documents_path(), "todos.db")
+        if os.path.exists(database_file):
+            self.data_file = database_file
+        storage = open_storage(self.data_file, "todos", self.SNAPSHOT_FORMAT)
+        self.profile.mark("open list")
+        
+        # Todo list data, streamed in once the window is on screen; changes
+        # are coalesced and written on a worker thread
+        self.todos = TaskEngine(storage, self.root, sort_key=creation_order,
+                                on_error=self.report_save_error, search_field='task')
         
-        # Todo list data
-        self.todos = self.load_todos()
+        # Text typed into the search box; only matching todos are listed
+        self.search_query = ""
+        self.search_after = None
         
         # Setup the UI
         self.setup_ui()
-        
-        # Load existing todos
         self.refresh_todo_list()
+        self.profile.mark("ui")
         
         # Bind window close event to save data
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # Set icon again after window is fully loaded (for taskbar)
-        self.root.after(100, self.refresh_taskbar_icon)
+        # Paint the empty list before the todo file is read
+        self.root.update()
+        self.profile.mark("first paint")
+        
+        # Icon, then existing todos, streamed in now that the list is on screen
+        self.root.after_idle(self.set_window_icon)
+        self.root.after_idle(self.load_todos)
     
     def set_window_icon(self):
         """Set window icon for taskbar and title bar"""
         try:
-            # Try to load the icon file if it exists
-            icon_path = os.path.join(os.path.dirname(__file__), "todo-icon.ico")
-            if os.path.exists(icon_path):
+            icon_path = self.get_icon_path()
+            if icon_path:
+                # Set once the window is mapped, which is when Windows picks
+                # up the taskbar icon; the default also covers every dialog
                 self.root.iconbitmap(icon_path)
-                # Additional method to force taskbar icon update
                 self.root.iconbitmap(default=icon_path)
-            else:
-                # Fallback - try in current directory
-                if os.path.exists("todo-icon.ico"):
-                    self.root.iconbitmap("todo-icon.ico")
-                    self.root.iconbitmap(default="todo-icon.ico")
-            
-            # Force icon refresh for taskbar (Windows-specific)
-            try:
-                # This helps Windows recognize the icon change
-                self.root.wm_iconbitmap(icon_path if os.path.exists(icon_path) else "todo-icon.ico")
-            except:
-                pass
-                
         except Exception:
             # If icon loading fails, continue without custom icon
             pass
+        self.profile.mark("icon")
     
-    def get_documents_path(self):
-        """Get the path to the GwenProject directory in Documents"""
-        documents_path = os.path.expanduser("~/Documents/GwenProject")
-        os.makedirs(documents_path, exist_ok=True)
-        return documents_path
-    
-    def refresh_taskbar_icon(self):
-        """Force refresh of taskbar icon after window is fully loaded"""
-        try:
-            # Try to refresh the icon for the taskbar
+    def get_icon_path(self):
+        """Path of the window icon, next to the script or in the current directory; '' if missing"""
+        if self.icon_path is None:
             icon_path = os.path.join(os.path.dirname(__file__), "todo-icon.ico")
             if os.path.exists(icon_path):
-                # Force update the window icon
-                self.root.iconbitmap(icon_path)
-                self.root.wm_iconbitmap(icon_path)
+                self.icon_path = icon_path
             elif os.path.exists("todo-icon.ico"):
-                self.root.iconbitmap("todo-icon.ico")
-                self.root.wm_iconbitmap("todo-icon.ico")
-        except Exception:
-            pass
+                self.icon_path = "todo-icon.ico"
+            else:
+                self.icon_path = ""
+        return self.icon_path
+    
+    def get_documents_path(self):
+        """Get the path to the GwenProject directory in Documents"""
+        if self.documents_path is None:
+            documents_path = os.path.expanduser("~/Documents/GwenProject")
+            os.makedirs(documents_path, exist_ok=True)
+            self.documents_path = documents_path
+        return self.documents_path
     
     def setup_styles(self):
         """Configure modern UI styles"""
@@ -150,6 +174,22 @@ class TodoApp:
                               bg='#8e44ad', fg='#ecf0f1')
         title_label.pack(side=tk.LEFT, anchor=tk.W)
         
+        # Live search over the todo descriptions
+        search_frame = tk.Frame(title_container, bg='#8e44ad')
+        search_frame.pack(side=tk.LEFT, anchor=tk.W, padx=(30, 0))
+        
+        tk.Label(search_frame, text="Search:", 
+                font=('Segoe UI', 10, 'bold'), 
+                bg='#8e44ad', fg='#ecf0f1').pack(anchor=tk.W)
+        
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(search_frame, textvariable=self.search_var,
+                                font=('Segoe UI', 10), width=20,
+                                relief=tk.FLAT, bd=4)
+        search_entry.pack(fill=tk.X, pady=(2, 0))
+        search_entry.bind('<Escape>', lambda e: self.search_var.set(""))
+        self.search_var.trace_add('write', self.on_search_change)
+        
         # Modern add button in header
         add_btn = tk.Button(title_container, text="➕ New Task", 
                            command=self.show_add_dialog,
@@ -175,6 +215,10 @@ class TodoApp:
                                    bg='#ecf0f1', fg='#7f8c8d')
         self.stats_label.pack(anchor=tk.W, pady=15)
         
+        # Shown while a large todo file is still streaming in
+        self.load_progress = ttk.Progressbar(stats_frame, mode='determinate',
+                                             maximum=100, length=180)
+        
         # Single-column task board (like notes.py but with one column)
         board_frame = tk.Frame(content_frame, bg='#ecf0f1')
         board_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
@@ -222,7 +266,9 @@ class TodoApp:
         
         # Configure scrolling
         def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            # The windowed list sizes its scroll region from the row count
+            if not self.virtual:
+                canvas.configure(scrollregion=canvas.bbox("all"))
         
         def on_mouse_wheel(event):
             # Make sure we can scroll regardless of focus
@@ -236,17 +282,10 @@ class TodoApp:
             canvas.focus_set()
         
         scrollable_frame.bind("<Configure>", configure_scroll_region)
-        canvas.bind("<MouseWheel>", on_mouse_wheel)
-        
-        # Bind mouse wheel to main window and all child widgets for better scrolling
-        def bind_mousewheel_recursive(widget):
-            widget.bind("<MouseWheel>", on_mouse_wheel)
-            for child in widget.winfo_children():
-                bind_mousewheel_recursive(child)
         
-        # Apply mousewheel binding to the entire application
+        # Every widget of the main window, cards created later included,
+        # carries the window's bind tag, so this one binding scrolls from anywhere
         self.root.bind("<MouseWheel>", on_mouse_wheel)
-        bind_mousewheel_recursive(self.root)
         
         # Bind click events to help with focus
         canvas.bind("<Button-1>", on_frame_click)
@@ -257,9 +296,17 @@ class TodoApp:
         # Configure canvas window width
         def configure_canvas_width(event):
             canvas.itemconfig(canvas_window, width=event.width-25)
+            for slot in self.virtual_pool:
+                canvas.itemconfig(slot['item'], width=max(event.width - 45, 1))
         canvas.bind("<Configure>", configure_canvas_width)
         
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Re-bind the recycled cards whenever the view scrolls or resizes
+        def on_view_change(first, last):
+            scrollbar.set(first, last)
+            if self.virtual:
+                self.render_virtual_rows()
+        
+        canvas.configure(yscrollcommand=on_view_change)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=15)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 5), pady=15)
@@ -267,22 +314,42 @@ class TodoApp:
         # Store column references
         self.tasks_frame = scrollable_frame
         self.canvas = canvas
+        self.canvas_window = canvas_window
+        
+        # Windowed list state, used once the list grows past VIRTUAL_THRESHOLD
+        self.virtual = False
+        self.virtual_rows = []
+        self.virtual_pool = []
+        
+        # Card buttons of the whole column share one set of handlers
+        self.card_events = CardEvents(self.root, "TodoCard")
+        self.card_events.on_command('toggle', lambda card: self.run_card_action(card, self.toggle_task_complete))
+        self.card_events.on_command('edit', lambda card: self.run_card_action(card, self.edit_task))
+        self.card_events.on_command('delete', lambda card: self.run_card_action(card, self.delete_task))
+    
+    def run_card_action(self, card, action):
+        """Apply a card button's action to the todo the card shows"""
+        task = card['holder']['task']
+        if task is not None:
+            action(task)
     
     def add_task_card(self, task):
         """Add a compact task card (like notes.py but for todos)"""
-        frame = self.tasks_frame
-        color = "#27ae60" if task['completed'] else "#3498db"
-        
+        card = self.create_card_widgets(self.tasks_frame, {'task': task})
+        self.fill_task_card(card, task)
+        card['container'].pack(fill=tk.X, padx=10, pady=8)
+    
+    def create_card_widgets(self, parent, holder):
+        """Build the widgets of one todo card; its buttons act on holder['task']"""
         # Create compact card container
-        card_container = tk.Frame(frame, bg='#f8f9fa')
-        card_container.pack(fill=tk.X, padx=10, pady=8)
+        card_container = tk.Frame(parent, bg='#f8f9fa')
         
         # Main card with modern styling
         card = tk.Frame(card_container, bg='white', relief=tk.FLAT, bd=0)
         card.pack(fill=tk.X, padx=2, pady=2)
         
         # Top accent bar
-        accent_bar = tk.Frame(card, bg=color, height=4)
+        accent_bar = tk.Frame(card, height=4)
         accent_bar.pack(fill=tk.X)
         
         # Content area
@@ -290,23 +357,13 @@ class TodoApp:
         content_frame.pack(fill=tk.X, padx=15, pady=15)
         
         # Task title with status indicator
-        status_prefix = "✅" if task['completed'] else "⭕"
-        title_text = f"{status_prefix} {task['task']}"
-        if task['completed']:
-            title_font = ('Segoe UI', 12, 'overstrike')
-            title_color = '#6c757d'
-        else:
-            title_font = ('Segoe UI', 12, 'bold')
-            title_color = '#2c3e50'
-            
-        title_label = tk.Label(content_frame, text=title_text, 
-                              font=title_font, 
-                              bg='white', fg=title_color,
+        title_label = tk.Label(content_frame, 
+                              bg='white',
                               wraplength=500, justify=tk.LEFT, anchor='w')
         title_label.pack(anchor=tk.W, pady=(0, 8))
         
         # Task date with icon
-        date_label = tk.Label(content_frame, text=f"📅 {task['created']}", 
+        date_label = tk.Label(content_frame, 
                              font=('Segoe UI', 9), 
                              bg='white', fg='#6c757d')
         date_label.pack(anchor=tk.W, pady=(0, 12))
@@ -316,23 +373,16 @@ class TodoApp:
         button_frame.pack(fill=tk.X)
         
         # Toggle complete button
-        if task['completed']:
-            toggle_btn = tk.Button(button_frame, text="Reopen", 
-                                 command=lambda: self.toggle_task_complete(task),
-                                 bg='#17a2b8', fg='white', font=('Segoe UI', 9, 'bold'),
-                                 relief=tk.FLAT, bd=0, padx=12, pady=6,
-                                 cursor='hand2', activebackground='#138496')
-        else:
-            toggle_btn = tk.Button(button_frame, text="Complete", 
-                                 command=lambda: self.toggle_task_complete(task),
-                                 bg='#27ae60', fg='white', font=('Segoe UI', 9, 'bold'),
-                                 relief=tk.FLAT, bd=0, padx=12, pady=6,
-                                 cursor='hand2', activebackground='#229954')
+        toggle_btn = tk.Button(button_frame, 
+                             command=self.card_events.command('toggle', card_container),
+                             fg='white', font=('Segoe UI', 9, 'bold'),
+                             relief=tk.FLAT, bd=0, padx=12, pady=6,
+                             cursor='hand2')
         toggle_btn.pack(side=tk.LEFT, padx=(0, 5))
         
         # Edit button
         edit_btn = tk.Button(button_frame, text="Edit", 
-                           command=lambda: self.edit_task(task),
+                           command=self.card_events.command('edit', card_container),
                            bg='#f39c12', fg='white', font=('Segoe UI', 9, 'bold'),
                            relief=tk.FLAT, bd=0, padx=12, pady=6,
                            cursor='hand2', activebackground='#e67e22')
@@ -340,11 +390,104 @@ class TodoApp:
         
         # Delete button
         delete_btn = tk.Button(button_frame, text="×", 
-                             command=lambda: self.delete_task(task),
+                             command=self.card_events.command('delete', card_container),
                              bg='#dc3545', fg='white', font=('Segoe UI', 12, 'bold'),
                              relief=tk.FLAT, bd=0, width=3, height=1,
                              cursor='hand2', activebackground='#c82333')
         delete_btn.pack(side=tk.RIGHT)
+        
+        # The buttons run the column's handlers for this card
+        self.card_events.add(card_container, [toggle_btn, edit_btn, delete_btn], {'holder': holder})
+        
+        return {
+            'container': card_container,
+            'accent_bar': accent_bar,
+            'title_label': title_label,
+            'date_label': date_label,
+            'toggle_btn': toggle_btn
+        }
+    
+    def fill_task_card(self, card, task):
+        """Show a todo's text, date and completion state on a card"""
+        color = "#27ae60" if task['completed'] else "#3498db"
+        card['accent_bar'].config(bg=color)
+        
+        status_prefix = "✅" if task['completed'] else "⭕"
+        if task['completed']:
+            title_font = ('Segoe UI', 12, 'overstrike')
+            title_color = '#6c757d'
+        else:
+            title_font = ('Segoe UI', 12, 'bold')
+            title_color = '#2c3e50'
+        card['title_label'].config(text=f"{status_prefix} {task['task']}",
+                                   font=title_font, fg=title_color)
+        card['date_label'].config(text=f"📅 {format_timestamp(task['created'])}")
+        
+        if task['completed']:
+            card['toggle_btn'].config(text="Reopen", bg='#17a2b8', activebackground='#138496')
+        else:
+            card['toggle_btn'].config(text="Complete", bg='#27ae60', activebackground='#229954')
+    
+    def show_virtual_rows(self, tasks):
+        """Show the column as a windowed list that only materializes visible rows"""
+        canvas = self.canvas
+        if not self.virtual:
+            # Drop the per-task cards and hide the frame that held them
+            for widget in self.tasks_frame.winfo_children():
+                widget.destroy()
+            canvas.itemconfigure(self.canvas_window, state='hidden')
+            self.virtual = True
+        
+        self.virtual_rows = tasks
+        canvas.configure(scrollregion=(0, 0, canvas.winfo_width(),
+                                       len(tasks) * self.VIRTUAL_ROW_HEIGHT))
+        self.render_virtual_rows()
+    
+    def leave_virtual_rows(self):
+        """Switch the column back from the windowed list to regular cards"""
+        for slot in self.virtual_pool:
+            slot['card']['container'].destroy()
+            self.canvas.delete(slot['item'])
+        self.virtual_pool = []
+        self.virtual_rows = []
+        self.virtual = False
+        self.canvas.itemconfigure(self.canvas_window, state='normal')
+        self.canvas.yview_moveto(0)
+    
+    def render_virtual_rows(self):
+        """Bind the recycled card pool to the rows in the viewport"""
+        canvas = self.canvas
+        rows = self.virtual_rows
+        row_height = self.VIRTUAL_ROW_HEIGHT
+        
+        first = max(int(canvas.canvasy(0)) // row_height, 0)
+        visible = canvas.winfo_height() // row_height + self.VIRTUAL_OVERSCAN
+        
+        # The pool only grows with the viewport, never with the task count
+        while len(self.virtual_pool) < visible:
+            self.virtual_pool.append(self.create_virtual_slot())
+        
+        for offset, slot in enumerate(self.virtual_pool):
+            index = first + offset
+            if index < len(rows):
+                slot['task'] = rows[index]
+                self.fill_task_card(slot['card'], rows[index])
+                canvas.coords(slot['item'], 10, index * row_height + 8)
+                canvas.itemconfigure(slot['item'], state='normal')
+            else:
+                slot['task'] = None
+                canvas.itemconfigure(slot['item'], state='hidden')
+    
+    def create_virtual_slot(self):
+        """Create one recycled card for the windowed column"""
+        canvas = self.canvas
+        slot = {'task': None}
+        slot['card'] = self.create_card_widgets(canvas, slot)
+        slot['item'] = canvas.create_window(10, 0, window=slot['card']['container'], anchor="nw",
+                                            width=max(canvas.winfo_width() - 45, 1),
+                                            height=self.VIRTUAL_ROW_HEIGHT - 16,
+                                            state='hidden')
+        return slot
     
     def show_add_dialog(self):
         """Show a modern dialog for adding new tasks"""
@@ -358,11 +501,8 @@ class TodoApp:
         
         # Set dialog icon
         try:
-            icon_path = os.path.join(os.path.dirname(__file__), "todo-icon.ico")
-            if os.path.exists(icon_path):
-                dialog.iconbitmap(icon_path)
-            elif os.path.exists("todo-icon.ico"):
-                dialog.iconbitmap("todo-icon.ico")
+            if self.get_icon_path():
+                dialog.iconbitmap(self.get_icon_path())
         except Exception:
             pass
         
@@ -405,15 +545,8 @@ class TodoApp:
         def add_task():
             task = task_entry.get().strip()
             if task:
-                todo_item = {
-                    'id': len(self.todos) + 1,
-                    'task': task,
-                    'completed': False,
-                    'created': datetime.now().strftime('%b %d, %Y - %I:%M%p')
-                }
-                self.todos.append(todo_item)
+                self.todos.create(task=task, completed=False, created=time.time())
                 self.refresh_todo_list()
-                self.save_todos()
                 dialog.destroy()
             else:
                 messagebox.showwarning("Warning", "Please enter a task description!")
@@ -448,13 +581,26 @@ class TodoApp:
     
     def refresh_todo_list(self):
         """Refresh all task cards"""
+        # Incomplete first, then completed, each by creation time; the store
+        # keeps both in order, so this is a view rather than a sort
+        if self.search_query:
+            matches = self.todos.search(self.search_query)
+            sorted_todos = self.todos.select('pending', matches) + self.todos.select('done', matches)
+        else:
+            sorted_todos = self.todos.view(('pending', 'done'))
+        
+        # Very long lists only materialize the cards inside the viewport
+        if len(sorted_todos) > self.VIRTUAL_THRESHOLD:
+            self.show_virtual_rows(sorted_todos)
+            self.update_stats()
+            return
+        if self.virtual:
+            self.leave_virtual_rows()
+        
         # Clear existing cards
         for widget in self.tasks_frame.winfo_children():
             widget.destroy()
         
-        # Sort todos: incomplete first, then completed
-        sorted_todos = sorted(self.todos, key=lambda x: (x['completed'], x['created']))
-        
         # Add todos as cards
         for todo in sorted_todos:
             self.add_task_card(todo)
@@ -462,8 +608,9 @@ class TodoApp:
         self.update_stats()
     
     def update_stats(self):
+        # Counters are maintained by the task store, no scan needed
         total = len(self.todos)
-        completed = sum(1 for todo in self.todos if todo['completed'])
+        completed = self.todos.count('done')
         pending = total - completed
         
         # Update task count badge
@@ -478,11 +625,29 @@ class TodoApp:
         
         self.stats_label.config(text=stats_text)
     
+    def on_search_change(self, *args):
+        """Filter the list as the search text changes"""
+        if self.search_after is not None:
+            self.root.after_cancel(self.search_after)
+            self.search_after = None
+        query = self.search_var.get()
+        if not query.strip() or any(len(term) >= 3 for term in words_of(query)):
+            self.apply_search()
+        else:
+            self.search_after = self.root.after(self.SEARCH_DELAY, self.apply_search)
+    
+    def apply_search(self):
+        """Show only the todos matching the search text"""
+        self.search_after = None
+        self.search_query = self.search_var.get().strip()
+        self.canvas.yview_moveto(0)
+        self.refresh_todo_list()
+    
     def toggle_task_complete(self, task):
         """Toggle task completion status"""
-        task['completed'] = not task['completed']
+        fields = {'completed': not task['completed']}
+        self.todos.update(task, **fields)
         self.refresh_todo_list()
-        self.save_todos()
     
     def edit_task(self, task):
         """Edit a task (using existing edit dialog)"""
@@ -495,7 +660,6 @@ class TodoApp:
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete this task?\n\n'{task['task']}'"):
             self.todos.remove(task)
             self.refresh_todo_list()
-            self.save_todos()
     
     def get_selected_todo(self):
         selection = self.tree.selection()
@@ -504,14 +668,14 @@ class TodoApp:
             return None
         
         todo_id = int(selection[0])
-        return next((todo for todo in self.todos if todo['id'] == todo_id), None)
+        return self.todos.get(todo_id)
     
     def toggle_complete(self):
         todo = self.get_selected_todo()
         if todo:
-            todo['completed'] = not todo['completed']
+            fields = {'completed': not todo['completed']}
+            self.todos.update(todo, **fields)
             self.refresh_todo_list()
-            self.save_todos()
     
     def edit_todo(self):
         # Check if we have a selected task from card click
@@ -534,11 +698,8 @@ class TodoApp:
         
         # Set dialog icon
         try:
-            icon_path = os.path.join(os.path.dirname(__file__), "todo-icon.ico")
-            if os.path.exists(icon_path):
-                dialog.iconbitmap(icon_path)
-            elif os.path.exists("todo-icon.ico"):
-                dialog.iconbitmap("todo-icon.ico")
+            if self.get_icon_path():
+                dialog.iconbitmap(self.get_icon_path())
         except Exception:
             pass
         
@@ -583,9 +744,8 @@ class TodoApp:
         def save_changes():
             new_task = task_entry.get().strip()
             if new_task:
-                todo['task'] = new_task
+                self.todos.update(todo, task=new_task)
                 self.refresh_todo_list()
-                self.save_todos()
                 dialog.destroy()
             else:
                 messagebox.showwarning("Warning", "Please enter a task description!")
@@ -620,31 +780,47 @@ class TodoApp:
             if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete this task?\n\n'{todo['task']}'"):
                 self.todos.remove(todo)
                 self.refresh_todo_list()
-                self.save_todos()
     
     def load_todos(self):
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return []
-        return []
+        """Stream the todo file in; the first screenful paints right away"""
+        self.todos.start_loading(on_chunk=self.show_loaded_todos, on_done=self.finish_loading)
     
-    def save_todos(self):
-        try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.todos, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save todos: {str(e)}")
+    def show_loaded_todos(self):
+        """Show the todos streamed in so far"""
+        self.load_progress['value'] = self.todos.progress * 100
+        self.load_progress.place(relx=1.0, rely=0.5, anchor=tk.E)
+        self.refresh_todo_list()
+        self.profile.mark("first todos")
+    
+    def finish_loading(self):
+        """Hide the progress bar once every todo is loaded"""
+        self.load_progress.place_forget()
+        self.profile.mark("loaded")
+        self.profile.report()
+        if self.todos.recovered:
+            messagebox.showwarning("Todos Recovered",
+                                   "The todo file was damaged.\n\n"
+                                   "Your todos were restored from the last good save.")
+        elif self.todos.damaged:
+            messagebox.showwarning("Todos Not Recovered",
+                                   "The todo file was damaged and could not be restored.\n\n"
+                                   f"It was set aside as:\n{self.todos.storage.path}.damaged")
+    
+    def report_save_error(self, error):
+        """Show a failed background save"""
+        messagebox.showerror("Error", f"Failed to save todos: {str(error)}")
     
     def on_closing(self):
-        self.save_todos()
+        # Todos not loaded yet are still in the file; only changes are written
+        self.todos.close()
         self.root.destroy()
 
 def main():
+    # Run with --profile-startup to print how long each startup phase takes
+    profile = startup_profile(sys.argv)
     root = tk.Tk()
-    app = TodoApp(root)
+    profile.mark("tk")
+    app = TodoApp(root, profile)
     root.mainloop()
 
 if __name__ == "__main__":